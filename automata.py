@@ -1,714 +1,2085 @@
-from collections import deque
-from state import State, ALPH, LETTER_ID
-
-DETER_NOT_COMPLETE = -2
-NOT_DETERM_INPUT = -1
-TRANSITION_BEGIN, NOT_DETERM_TRANSITIONS = 0, 0
-TRANSITION_CHAR, DETERMINISTIC, CDFA = 1, 1, 1
-TRANSITION_END = 2
-MAX_STATE_NB_EXPECTED = 30
-
-
-class Automata:
-    def __init__(self, alph_size: int, nb_states: int):
-        self.__alph_size = alph_size
-        self.__nb_states = nb_states
-        self.__states = [State(self.__alph_size,i) for i in range(self.__nb_states)]
-        # These variable will be put to True when necessary, but will be but to False again at any modification
-        # This will avoid to compute multiple time the same thing
-        self.__is_deter = False
-        self.__is_complete = False
-        self.__is_standard = False
-        self.__is_valid = False
-    
-    # The getters:
-    def get_nb_states(self) -> int:
-        '''Getter for the number of states'''
-        return self.__nb_states
-    def get_alph_size(self) -> int:
-        '''Getter for the number of symbols'''
-        return self.__alph_size
-    def get_nb_in_states(self) -> int:
-        '''Getter for the number of input states'''
-        nb_in = 0
-        for id_state in range(self.get_nb_states()):
-            if self.get_state(id_state).is_in():
-                nb_in += 1
-        return nb_in
-    def get_nb_out_states(self) -> int:
-        '''Getter for the number of output states'''
-        nb_out = 0
-        for id_state in range(self.get_nb_states()):
-            if self.get_state(id_state).is_out():
-                nb_out += 1
-        return nb_out
-    def get_state(self, state_id: int) -> State:
-        '''Getter to get the state associated to a given id'''
-        return self.__states[state_id]
-    
-    def is_standard(self) -> bool:
-        '''Method wether the automata is standard'''
-        if self.__is_standard:
-            return True
-        else:
-            is_std = True
-
-            # should have 1 input
-            if self.get_nb_in_states() != 1:
-                is_std = False
-                return is_std
-
-            # identifying the input state
-            cur_state_id = 0
-            while not self.get_state(cur_state_id).is_in(): # The previous condition force that there is at least 1 input
-                cur_state_id += 1
-            in_state_id = cur_state_id
-
-            # should have no transition to the input state
-            cur_state_id = 0
-            while is_std and cur_state_id < self.get_nb_states():
-                cur_alph_id = 0
-                while is_std and cur_alph_id < self.get_alph_size():
-                    if in_state_id in self.get_state(cur_state_id).get_dests(ALPH[cur_alph_id]):
-                        is_std = False
-                    cur_alph_id += 1
-                cur_state_id += 1
-
-            self.__is_standard = is_std
-            return is_std
-    
-    def is_deterministic(self) -> int:
-        '''
-        Method which says wether an automata is deterministic
-        Return :
-            An integer:
-                - 1 if deterministic (DETERMINISTIC)
-                - -1 if not due to the number of input (NOT_DETERM_INPUT)
-                - 0 if not due to multiple destinations (NOT_DETERM_TRANSITIONS)
-        '''
-        if self.__is_deter:
-            return True
-        else:
-            # Automata should have one input state
-            if self.get_nb_in_states() != 1:
-                return NOT_DETERM_INPUT
-
-            # Each destination should lead to 0 or 1 state
-            is_deter = True
-            cur_state_id = 0
-            while is_deter and cur_state_id < self.get_nb_states():
-                cur_alph_id = 0
-                while is_deter and cur_alph_id < self.get_alph_size():
-                    if len(self.get_state(cur_state_id).get_dests(ALPH[cur_alph_id])) > 1:
-                        is_deter = False
-                    cur_alph_id += 1
-                cur_state_id += 1
-            if is_deter:
-                self.__is_deter = True
-                return DETERMINISTIC
-            else:
-                return NOT_DETERM_TRANSITIONS
-    
-    def is_complete_DFA(self, silent_mode: bool = False) -> int:
-        '''
-        Method which says wether a FA is a complete deterministic automata
-        Return :
-            An integer:
-                - 1 if CDFA (CDFA)
-                - -1,0 if not deterministic (NOT_DETERM_INPUT, NOT_DETERM_TRANSITIONS)
-                - -2 if deterministic but not complete (first problematic state will be printed) (
-        '''
-        if self.__is_deter and self.__is_complete:
-            # if the Automata is already CDFA (haven't be changed since last check)
-            return True
-        else:
-            # if it has more than one entry it is not a deterministic one
-            if self.get_nb_in_states() != 1:
-                if not silent_mode: print('Algorithm isn\'t CDFA: it is not a deterministic one.')
-                return NOT_DETERM_INPUT
-            #
-            is_complete = True
-            cur_state_id = 0
-            # Checking how many states are in all destinations, acting in consequence
-            while is_complete and cur_state_id < self.get_nb_states():
-                cur_alph_id = 0
-                while is_complete and cur_alph_id < self.get_alph_size():
-                    if len(self.get_state(cur_state_id).get_dests(ALPH[cur_alph_id])) != 1:
-                        if len(self.get_state(cur_state_id).get_dests(ALPH[cur_alph_id])) == 0:
-                            if not silent_mode: print('Algorithm isn\'t CDFA: it is not complete for sure and may not be deterministic due to numerous destinations.'
-                                  +'\n\t'+'Not complete for state, transition: '+str(cur_state_id)+', '+ALPH[cur_alph_id])
-                            output = NOT_DETERM_TRANSITIONS
-                        else:
-                            if not silent_mode: print('Algorithm isn\'t CDFA: it is not deterministic for sure and may not be complete.' +
-                                  '\n\tNot deterministic for state, transition, number of destinations: '
-                                  + str(cur_state_id) + ', ' + ALPH[cur_alph_id] + ', '+  str(len(self.get_state(cur_state_id).get_dests(ALPH[cur_alph_id]))))
-                            output = DETER_NOT_COMPLETE
-                        is_complete = False
-                    cur_alph_id += 1
-                cur_state_id += 1
-            # Updating the Automata based on results
-            if is_complete:
-                self.__is_deter = True
-                self.__is_complete = True
-                return CDFA
-            else:
-                return output
-        
-    def is_valid(self) -> bool:
-        '''Method to know if an Automata is valid
-            (verify only for the destinations since the method add_state already ensure, for added states, the size of the alphabet and correct id)'''
-        if self.__is_valid:
-            return True
-        else:
-            # check if the destinations exists
-            validity = True
-            id_state = 0
-            while validity and id_state < self.get_nb_states():
-                alph_id = 0
-                while validity and alph_id < self.get_alph_size():
-                    destinations = self.get_state(id_state).get_dests(ALPH[alph_id])
-                    if any(dest >= self.get_nb_states() or dest < 0 for dest in destinations):
-                        validity = False
-                    alph_id += 1
-                id_state += 1
-            self.__is_valid = validity
-            return validity
-
-    
-    # The setters:
-    # Methods for Automata
-
-    def add_state(self, state: State, silent_mode: bool = False):
-        '''
-        Method to add a state in an Automata, safely (cohesion of data ensured with alphabet size and id of the nodes)
-        (will replace the node the exist with the same id)
-        '''
-        if state.get_alph_size() != self.__alph_size:
-            print("\033[91mIncompatible alphabet size, couldn\'t add the state\033[0m")
-        else:
-            if state.get_id() >= self.get_nb_states():
-                state.mod_id(self.__nb_states, True)
-                self.__nb_states += 1
-                self.__states.append(state)
-                if not silent_mode: print('Number of state successfuly increased by 1')
-            else :
-                self.__states[state.get_id()]=state
-                if not silent_mode: print('State successfuly replaced')
-            self.__is_deter = False
-            self.__is_complete = False
-            self.__is_standard = False
-            self.__is_valid = False
-
-    def standardize(self) -> bool:
-        if self.is_standard():
-            return False
-        else :
-            # looking for the entry states, removing their Input arrow
-            entries_id = []
-            for i in range(self.get_nb_states()):
-                if self.get_state(i).is_in():
-                    entries_id.append(i)
-                    self.get_state(i).set_not_in()
-
-            # looking: if an entry is an output, where the entries points
-            is_output = False
-            # using a state so that I don't do multiple times the same transition
-            destinations = set()
-            for iD in entries_id:
-                #if output
-                if self.get_state(iD).is_out():
-                    is_output = True
-                # storing destinations
-                for cur_alph_id in range(self.get_alph_size()):
-                    cur_dests = self.get_state(iD).get_dests(ALPH[cur_alph_id])
-                    for dest in cur_dests:
-                        destinations.add(ALPH[cur_alph_id] + str(dest))
-
-            # creating the new state i
-            # init
-            state_i = State(self.get_alph_size(), self.get_nb_states())
-            # entry
-            state_i.set_in()
-            # output ?
-            if is_output:
-                state_i.set_out()
-            # destinations
-            for dest in destinations:
-                state_i.add_dest(dest[0], dest[1:])
-            # adding to the automata
-            self.add_state(state_i)
-            self.__is_deter = False
-            self.__is_complete = False
-            self.__is_standard = True
-            return True
-
-    def recognize_word(self, word : str) -> bool:
-        '''
-        Method to check if a word is recognized by the Automata
-        :return: bool -- True if recognized
-        '''
-        valid = 1
-        ch_id = 0
-        while valid and ch_id < len(word):
-            if word[ch_id] not in ALPH[:self.get_alph_size()]:
-                valid = 0
-            ch_id += 1
-        if not valid:
-            print("Can't recognize, invalid character")
-            return False
-        else:
-            # Ensuring that it is deterministic to treat the problem easily
-            if self.is_complete_DFA(True) == CDFA:
-                print("The automata is deterministic")
-                return self.recursive_word_recognition(word, 0)
-            else:
-                print("The automata is not deterministic, we will based us on it's determinized version:")
-                A = self.determinize_complete()
-                A.printCDFA()
-                return A.recursive_word_recognition(word, 0)
-
-
-    def recursive_word_recognition(self, word: str, state_id: int) -> bool:
-        '''
-        Recursive call method to find if a correct word is recognized
-        :param word: correct word to be recognized (correct means characters in alphabet)
-        :param state_id: id of the state at which we arrived
-        :return:
-        '''
-        print("word: "+word)
-        print("state_id: "+str(state_id))
-        if not word:
-            if self.get_state(state_id).is_out():
-                return True
-            else:
-                return False
-        return self.recursive_word_recognition(word[1:], self.get_state(state_id).get_dests(word[0])[0])
-
-    def completion(self):
-        ''' Method to complete a deterministic Automata'''
-        if not self.is_complete_DFA(True):
-            if not self.is_deterministic():
-                print("The Automata should be deterministic first")
-            else:
-                # Completion
-                # Add a Garbage state G
-                g = State(self.get_alph_size(), self.get_nb_states())
-                g.set_label('G')
-                for alph_id in range(self.get_alph_size()):
-                    g.add_dest(ALPH[alph_id], self.get_nb_states())
-                g_id = self.get_nb_states()
-                self.add_state(g, True)
-                # Find all the transitions that are empty and put G as destination
-                for dest_id in range(self.get_nb_states()):
-                    for alph_id in range(self.get_alph_size()):
-                        if len(self.get_state(dest_id).get_dests(ALPH[alph_id])) == 0:
-                            self.get_state(dest_id).add_dest(ALPH[alph_id], g_id)
-                self.__is_complete = True
-                # may not be changed but prefer to be safe
-                self.__is_standard = False
-
-    def determinize_complete(self) -> 'Automata':
-        '''
-        Method to determinize an Automata, the result will be also complete
-        :return
-            None if failled
-            Automata object if success
-        '''
-        # ( for each new state (begining with the combination of the states) add the combined destination and if destination is a new state, add it)
-        # Identify the input states
-        entries_id = []
-        for i in range(self.get_nb_states()):
-            if self.get_state(i).is_in():
-                entries_id.append(i)
-
-        automat_alph_size = self.get_alph_size()
-        new_automata = Automata(automat_alph_size, 1)
-        # creating a dictionary to store which combination has which id, intiat it with the inputs states
-        cur_label = '.'.join([str(state_id) for state_id in entries_id])
-        new_states = {cur_label: 0}
-        # create a queue to know which state you have to treat
-        state_queue = deque()
-        state_queue.append(cur_label)
-
-        # run through all  states and process to adding when needed until the queue is empty
-        working = True
-        count = 0
-        while working and state_queue:
-            # Propose to close in case of endless loop
-            if count == MAX_STATE_NB_EXPECTED:
-                print('We arrived at 100 more states, should we continue? Y/N')
-                answer = input()
-                while answer != 'Y' and answer != 'N':
-                    answer = input()
-                if answer == 'Y':
-                    count = 0
-                else:
-                    working = False
-
-            # Initialization of the state and it's destinations
-            cur_label = state_queue.popleft()
-            cur_state = State(automat_alph_size, new_states[cur_label])
-            current_destinations = [set() for _ in range(automat_alph_size)]
-            cur_state.set_label(cur_label)
-            # Running through the states composing the current state
-            for state_str in cur_label.split('.'):
-                if state_str:
-                    if self.get_state(int(state_str)).is_out():
-                        cur_state.set_out()
-                    for alph_id in range(automat_alph_size):
-                        for dest_id in self.get_state(int(state_str)).get_dests(ALPH[alph_id]):
-                            current_destinations[alph_id].add(dest_id)
-            # Running through the destinations of the current state
-            for alph_id in range(automat_alph_size):
-                cur_alph_dests = list(current_destinations[alph_id])
-                if cur_alph_dests:
-                    cur_alph_dests.sort()
-                    dest_state_str = '.'.join([str(e) for e in cur_alph_dests])
-                    if dest_state_str not in new_states:
-                        new_states[dest_state_str] = len(new_states)
-                        state_queue.append(dest_state_str)
-                    cur_state.add_dest(ALPH[alph_id], new_states[dest_state_str])
-            new_automata.add_state(cur_state, True)
-            count += 1
-
-        new_automata.get_state(0).set_in()
-
-        if not working:
-            return None
-
-        new_automata.completion()
-        # __is_deter, __is_complete and __is_standard have been updated by previous calls to fcts
-        return new_automata
-
-    def printCDFA(self):
-        '''Method to print Automata with label (for Determinitics ones for exemple)'''
-        ch = 'Displaying Automata \n'
-        # Putting all the information to display in a matrix
-        array = self._str_label_list()
-
-        # Finding the max size of a column
-        col_widths = [max(len(item) for item in col if item) for col in zip(*array)]
-
-        # Creating a beautiful line
-        border = '+-' + '-+-'.join('-' * width for width in col_widths) + '-+'
-
-        # Display the information with a border all around and inside
-        print(border)
-        formatted_row = " | ".join(f"{item:<{width}}" if item else " " * width for item, width in zip(array[0], col_widths))
-        print(f"| {formatted_row} |")
-        print(border)
-        for row in array[1:]:
-            formatted_row = " | ".join(f"{item:<{width}}" if item else " " * width for item, width in zip(row, col_widths))
-            print(f"| {formatted_row} |")
-        print(border)
-
-    def _str_label_list(self, minim:bool = False) -> list:
-        '''
-        Method to display the state with print()
-        :return list: matrix corresponding to the display in a table of the Automata
-        '''
-
-        row = self.get_nb_states() + 1
-        col = self.get_alph_size() + 2
-
-        items = [['' for _ in range(col)] for __ in range(row)]
-        for i in range(2,col):
-            items[0][i] = ALPH[i-2]
-        for row_nbr in range(1,row):
-            # if it is an input or output state
-            state_id = row_nbr - 1
-            arrow = ""
-            if self.get_state(state_id).is_out():
-                arrow += '<'
-                if not (self.get_state(state_id).is_in()):
-                    arrow += '-'
-            if self.get_state(state_id).is_in():
-                arrow += '->'
-            items[row_nbr][0] = arrow
-            # It's id or label
-            cur_label = self.get_state(state_id).get_label()
-            if cur_label is None or ("," in cur_label and minim):
-                if cur_label is not None and state_id > 0 and state_id < 10:
-                    roman_numerals = {1: "I", 2: "II", 3: "III", 4: "IV", 5: "V", 6: "VI", 7: "VII", 8: "VIII", 9: "IX"}
-                    name = roman_numerals[state_id]
-                else:
-                    name = str(self.get_state(state_id).get_id())
-            else:
-                name = "(" + str(cur_label) + ")"
-            items[row_nbr][1] = name
-            # All the transitions
-            for col_nbr in range(2,col):
-                alph_id = col_nbr - 2
-                transitions_str = ""
-                for dest_id in self.get_state(state_id).get_dests(ALPH[alph_id]):
-                    # Don't show the label if isn't or if is a group due to minimization (,)
-                    dest_label = self.get_state(dest_id).get_label()
-                    if dest_label is None or ("," in dest_label and minim):
-                        if dest_label is not None and dest_id > 0 and dest_id < 10:
-                            roman_numerals = {1: "I",2: "II",3: "III",4: "IV",5: "V",6: "VI",7: "VII",8: "VIII",9: "IX"}
-                            transitions_str += roman_numerals[dest_id]
-                        else:
-                            transitions_str += str(dest_id)
-                    else:
-                        transitions_str += "(" + dest_label + ")"
-                    transitions_str += '/'
-                if not transitions_str:
-                    transitions_str += '--'
-                else:
-                    transitions_str = transitions_str[:-1]
-                items[row_nbr][col_nbr] = transitions_str + ''
-        return items
-
-    def print_minimized(self):
-        '''Method to display a minimized Automata'''
-        # mainly the same as printCDFA but showing the group at the end
-        ch = 'Displaying Automata \n'
-        # Putting all the information to display in a matrix
-        array = self._str_label_list(True)
-
-        # Finding the max size of a column
-        col_widths = [max(len(item) for item in col if item) for col in zip(*array)]
-
-        # Creating a beautiful line
-        border = '+-' + '-+-'.join('-' * width for width in col_widths) + '-+'
-
-        # Display the information with a border all around and inside
-        print(border)
-        formatted_row = " | ".join(
-            f"{item:<{width}}" if item else " " * width for item, width in zip(array[0], col_widths))
-        print(f"| {formatted_row} |")
-        print(border)
-        for row in array[1:]:
-            formatted_row = " | ".join(
-                f"{item:<{width}}" if item else " " * width for item, width in zip(row, col_widths))
-            print(f"| {formatted_row} |")
-        print(border)
-        # Displaying the eventual groups made by the minimization
-        group = False
-        for state_id in range(self.get_nb_states()):
-            if self.get_state(state_id).get_label() is not None and ',' in self.get_state(state_id).get_label():
-                if not group:
-                    print("| With the groups:")
-                    group = True
-                if state_id > 0 and state_id < 10:
-                    roman_numerals = {1: "I", 2: "II", 3: "III", 4: "IV", 5: "V", 6: "VI", 7: "VII", 8: "VIII", 9: "IX"}
-                    print("| "+roman_numerals[state_id]+" corresponding to "+ self.get_state(state_id).get_label())
-                else:
-                    print("| "+str(state_id)+" corresponding to "+ self.get_state(state_id).get_label())
-
-    def __split(self, group : list, association : dict) -> list:
-        '''
-        Method that split the group depending on the group of dest of each state given by association (minimization)
-        :return list of list
-        '''
-        splited_group = {}
-        for state_id in group:
-            # join the group of destination of the state for each letter of the alphabet, [0] bc deterministic
-            cur_group_dest = ','.join([str(association[self.get_state(state_id).get_dests(ALPH[alph_id])[0]]) for alph_id in range(self.get_alph_size())])
-            if cur_group_dest not in splited_group:
-                splited_group[cur_group_dest] = []
-            splited_group[cur_group_dest].append(state_id)
-        # sorting to be sure to obtain the same order (avoiding problem in minim. w/ old==groups)
-        return [splited_group[key] for key in sorted(splited_group.keys())]
-
-    def minimization(self) -> 'Automata':
-        '''
-        Method to build a minimized Automata
-        return: Automata minimized
-        '''
-        if self.is_complete_DFA(True) == CDFA:
-            # Splitting in two groups, terminal states and non-terminal states
-            groups = [[],[]]
-            for state_id in range(self.get_nb_states()):
-                groups[self.get_state(state_id).is_out()].append(state_id)
-            # Associating each state to its group
-            association = {state_id: grp_id for grp_id in range(2) for state_id in groups[grp_id]}
-
-            # Running through the groups and splitting them until it is stable
-            old_groups = []
-            while old_groups != groups:
-                old_groups = groups
-                groups = []
-                for group in old_groups:
-                    for new_group in self.__split(group, association):
-                        groups.append(new_group)
-                # Update the association dictionary
-                association.clear()
-                association = {state_id: grp_id for grp_id in range(len(groups)) for state_id in groups[grp_id]}
-
-            if len(groups) == self.get_nb_states():
-                print("The Automata was already minimized.")
-                return self.copy()
-
-            # Sorting the groups to have coherence with the original Automata
-            groups.sort(key=lambda x: x[0])
-            association.clear()
-            association = {state_id: grp_id for grp_id in range(len(groups)) for state_id in groups[grp_id]}
-
-            # Construct an Automata with the groups obtained
-            new_automata = Automata(self.get_alph_size(), len(groups))
-            # identify the entry state
-            state_id = 0
-            entry_state_id = -1
-            while entry_state_id == -1 and state_id < self.get_nb_states():
-                if self.get_state(state_id).is_in():
-                    entry_state_id = state_id
-                state_id += 1
-            # Create the states corresponding to the groups
-            for group_id in range(len(groups)):
-                group = groups[group_id]
-                new_state = State(self.get_alph_size(), group_id)
-                # if a state is an entry
-                if entry_state_id in group:
-                    new_state.set_in()
-                a_state_id = group[0]
-                # thanks to theta 0, if one is output the group is
-                if self.get_state(a_state_id).is_out():
-                    new_state.set_out()
-                # putting the correct destination since it is deterministic
-                for alph_id in range(self.get_alph_size()):
-                    new_state.add_dest(ALPH[alph_id], association[self.get_state(a_state_id).get_dests(ALPH[alph_id])[0]])
-                # adding a label to the group
-                cur_group_dest = ', '.join([self.get_state(state_id).get_label() if self.get_state(state_id).get_label() is not None else state_id for state_id in group])
-                new_state.set_label(cur_group_dest)
-                # adding the group state to the new Automata
-                new_automata.add_state(new_state)
-            return new_automata
-        else:
-            print("Can't minimize, your Automata should first be a complete and deterministic one")
-
-    def complementary_automata(self) -> 'Automata':
-        '''
-        Method that returns the complementary automata
-        :return:
-        '''
-        if self.is_complete_DFA(True) == CDFA:
-            new_automata = self.copy()
-        else:
-            new_automata = self.determinize_complete()
-            print("We will base us on the CDFA automata corresponding to your automata:")
-            new_automata.printCDFA()
-        # List such that [[NT],[T]]
-        state_id_is_terminal = [[],[]]
-        for state_id in range(new_automata.get_nb_states()):
-            state_id_is_terminal[new_automata.get_state(state_id).is_out()].append(state_id)
-        # Switching the NT and T states state of output
-        for state_id in state_id_is_terminal[0]:
-            new_automata.get_state(state_id).set_out()
-        for state_id in state_id_is_terminal[1]:
-            new_automata.get_state(state_id).set_not_out()
-        return new_automata
-    def copy(self) -> 'Automata':
-        '''
-        Method to copy an Automata instance
-        returns: Automata instance, a copy of this one
-        '''
-        new_automata = Automata(self.get_alph_size(), self.get_nb_states())
-        new_automata.__states = [self.__states[state_id].copy() for state_id in range(self.__nb_states)]
-        new_automata.__is_deter = self.__is_deter
-        new_automata.__is_complete = self.__is_complete
-        new_automata.__is_standard = self.__is_standard
-        new_automata.__is_valid = self.__is_valid
-        return new_automata
-
-    def __str__(self) -> str:
-        '''
-                Method to display the state with print()
-                '''
-        ch = 'Displaying Automata \n'
-        ch += '     \t' + '\t'.join(ALPH[:self.__alph_size]) + '\n'
-        # Here we could have directly print the states, but we want to show the labels in the transitions
-        for state_id in range(self.get_nb_states()):
-            ch += str(self.get_state(state_id)) + '\n'
-        return ch
-
-
-    # The overwrited functions and additional init
-    @classmethod
-    def from_file(cls, path: str) -> 'Automata':
-        '''
-        Function to create the Automata associated to a text file
-        '''
-        try:
-            with open(path, 'r') as file:
-                # reading the nb of symbols and states
-                nb_symbols = int(file.readline())
-                nb_states = int(file.readline())
-                A = cls(nb_symbols, nb_states)
-                # reading the nb of input states and their states number, applying it
-                in_states_str = file.readline().split()
-                for i in range(1, int(in_states_str[0])+1):
-                    A.get_state(int(in_states_str[i])).set_in()
-                # reading the nb of output states and their states number, applying it
-                out_states_str = file.readline().split()
-                for i in range(1, int(out_states_str[0])+1):
-                    A.get_state(int(out_states_str[i])).set_out()
-
-                # adding all the destinations, takin in count the case of multiple digits stat id
-                nb_transitions = int(file.readline())
-                transitions = file.read().split()
-                for i in range(nb_transitions):
-                    digits_before = []
-                    letter = ''
-                    digits_after = []
-                    for char in transitions[i]:
-                        ascii_value = ord(char)
-                        # check for digit
-                        if 48 <= ascii_value <= 57:
-                            if letter:
-                                digits_after.append(char)
-                            else:
-                                digits_before.append(char)
-                        elif 97 <= ascii_value <= 122:
-                        # check for lowercase letter
-                            if letter:
-                                raise ValueError("The transition should be one letter.")
-                            letter = char
-                        else:
-                            raise ValueError("The transition contains invalid characters.")
-                    # Convert lists to integers
-                    from_state_id = int(''.join(digits_before))
-                    to_state_id = int(''.join(digits_after))
-                    cur_transi = transitions[i]
-                    A.get_state(from_state_id).add_dest(letter, to_state_id)
-
-                # ensuring that destinations exist
-                validity = A.is_valid()
-                if not validity:
-                    print("\033[91mBE AWARE YOUR AUTOMATA IS NOT VALID (found a destination that don\'t exists)\033[0m")
-                return A
-
-        except FileNotFoundError:
-            raise FileNotFoundError("The file does not exist.")
-        except IOError:
-            raise IOError("An error occurred while reading the file.")
-        
-    # Other methods
-    def to_file(self, path:str):
-        '''Method to write the automata in a file text'''
-        with open(path, 'w') as file:
-            file.write(str(self.get_alph_size()) + '\n')
-            file.write(str(self.get_nb_states()) + '\n')
-            # writing input states
-            ch = str(self.get_nb_in_states()) + ' '
-            ch += ' '.join([str(self.__states[i].get_id()) for i in range(self.get_nb_states()) if self.__states[i].is_in()])
-            file.write(ch + '\n')
-            # writing output states
-            ch = str(self.get_nb_out_states()) + ' '
-            ch += ' '.join([str(self.__states[i].get_id()) for i in range(self.get_nb_states()) if self.__states[i].is_out()])
-            file.write(ch + '\n')
-            
-            transistions = [str(num_state) + ALPH[num_char] + str(destination)
-                            for num_state in range(self.get_nb_states())
-                                for num_char in range(self.get_alph_size())
-                                    for destination in self.get_state(num_state).get_dests(ALPH[num_char])]
-            
-            file.write(str(len(transistions))+'\n')
-            file.write('\n'.join(transistions))
-
-
-
-
-
-
-
+import contextlib
+import json
+import os
+import re
+import struct
+import sys
+import threading
+import time
+from mmap import mmap as memory_map, ACCESS_READ
+from array import array
+from collections import Counter, deque
+from state import State, ALPH
+from matcher import CompiledMatcher, LazyMatcher, Recognizer
+from tracer import trace, is_traced, tracing, render, add_tracer, remove_tracer, print_tracer
+
+# NumPy is optional, it is only used to count the words recognized (count_accepted) with vectorized steps
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Version of the library, to change when the results of the algorithms change (it is part of the keys of cache.DiskCache)
+__version__ = '1.2'
+
+DETER_NOT_COMPLETE = -2
+NOT_DETERM_INPUT = -1
+TRANSITION_BEGIN, NOT_DETERM_TRANSITIONS = 0, 0
+TRANSITION_CHAR, DETERMINISTIC, CDFA = 1, 1, 1
+TRANSITION_END = 2
+# Markers in the transition table of an Automata (destinations are >= 0)
+NO_DEST = -1
+MULTI_DESTS = -2
+# Text files: 5 lines of header then the transitions, such as 12a7
+HEADER_NB_LINES = 5
+TRANSITION_PATTERN = re.compile(rb'(?<!\S)\d+[a-z]\d+(?!\S)')
+LETTERS_BYTES = bytes(range(ord('a'), ord('z') + 1))
+LETTERS_TO_SPACES = bytes.maketrans(LETTERS_BYTES, b' ' * len(LETTERS_BYTES))
+LETTER_ID_BYTES = bytes.maketrans(LETTERS_BYTES, bytes(range(len(LETTERS_BYTES))))
+DIGITS_AND_SPACES = b'0123456789 \t\n\r\x0b\x0c'
+# Binary files (save_binary): header, then the table (int32, little endian), the input and output bitsets,
+# the slots with several destinations, their offsets and destinations (int32), the labels (JSON)
+# and the alphabet if it isn't the letters a, b... (JSON, since the version 2)
+BINARY_MAGIC = b'AUTB'
+BINARY_VERSION = 2
+BINARY_HEADER = struct.Struct('<4sHHIIIIII')
+FLAG_DETERMINISTIC, FLAG_COMPLETE, FLAG_STANDARD, FLAG_VALID = 1, 2, 4, 8
+# Counts of words below this bound fit in the int64 of NumPy, bigger ones are Python int
+INT64_BOUND = 1 << 63
+# Number of steps (states treated, rounds) between two calls of the progress listeners (see watching)
+PROGRESS_INTERVAL = 256
+
+
+class DeterminizationLimitError(Exception):
+    '''Raised when the determinization goes over its budget of states or time'''
+
+
+class OperationCancelled(Exception):
+    '''Raised by a progress listener to stop the operation in progress (see watching)'''
+
+
+def _parse_header_int(header: list, line_id: int) -> int:
+    '''Function reading the integer of a line of the header of a text file (from_file)'''
+    try:
+        return int(header[line_id])
+    except ValueError:
+        raise ValueError('Line ' + str(line_id + 1) + ': an integer is expected, not '
+                         + repr(header[line_id].decode(errors='replace').strip()))
+
+def _parse_header_states(header: list, line_id: int, nb_states: int) -> list:
+    '''Function reading a line "number_of_states state_id state_id ..." of the header of a text file (from_file)'''
+    words = header[line_id].split()
+    try:
+        state_ids = [int(word) for word in words]
+    except ValueError:
+        raise ValueError('Line ' + str(line_id + 1) + ': only integers are expected')
+    if not state_ids or len(state_ids) - 1 < state_ids[0]:
+        raise ValueError('Line ' + str(line_id + 1) + ': ' + (str(state_ids[0]) if state_ids else 'a number of')
+                         + ' states announced but ' + str(max(len(state_ids) - 1, 0)) + ' given')
+    for state_id in state_ids[1:state_ids[0] + 1]:
+        if not 0 <= state_id < nb_states:
+            raise ValueError('Line ' + str(line_id + 1) + ': state ' + str(state_id) + ' doesn\'t exist')
+    return state_ids[1:state_ids[0] + 1]
+
+def _raise_malformed_transition(content, start: int, nb_transitions: int, nb_states: int):
+    '''Function finding the first malformed transition of a text file to report it with its line (from_file)'''
+    line_nb = HEADER_NB_LINES
+    nb_read = 0
+    for line in content[start:].rstrip().split(b'\n'):
+        line_nb += 1
+        for word in line.split():
+            if TRANSITION_PATTERN.fullmatch(word) is None:
+                raise ValueError('Line ' + str(line_nb) + ': malformed transition '
+                                 + repr(word.decode(errors='replace')) + ' (expected such as 12a7)')
+            state_id = word.translate(LETTERS_TO_SPACES).split()[0]
+            if int(state_id) >= nb_states and nb_read < nb_transitions:
+                raise ValueError('Line ' + str(line_nb) + ': state ' + state_id.decode() + ' doesn\'t exist')
+            nb_read += 1
+    raise ValueError('Line ' + str(line_nb) + ': ' + str(nb_transitions) + ' transitions announced but '
+                     + str(nb_read) + ' given')
+
+
+def _to_little_endian(int_array: array) -> bytes:
+    '''Function giving the bytes of an array of int (or a memoryview on it) in little endian (binary files)'''
+    if sys.byteorder != 'little':
+        int_array = array('i', int_array)
+        int_array.byteswap()
+    return int_array.tobytes()
+
+def _from_little_endian(buffer) -> array:
+    '''Function reading an array of int from bytes in little endian (binary files)'''
+    int_array = array('i')
+    int_array.frombytes(buffer)
+    if sys.byteorder != 'little':
+        int_array.byteswap()
+    return int_array
+
+
+# Statistics of the operations (see profiling and set_stats_hook): the functions receiving them, as
+# listener(operation, stats). Without any, the recognitions don't compute them (the other operations only keep
+# their last ones, see Automata.get_last_stats)
+_stats_listeners = []
+_stats_hook = None
+
+
+@contextlib.contextmanager
+def profiling():
+    '''
+    Context manager collecting the statistics of the operations done by all the Automata in its block:
+    counters and time of the phases of the determinizations, minimizations, completions, parsings and recognitions
+        with profiling() as stats:
+            A.determinize_complete()
+        stats['determinization'] is then {'calls': 1, 'subsets': ..., 'seconds': ...}
+    The values of an operation done several times are summed. Only the operations of the thread of the block are collected
+    '''
+    stats = {}
+    thread_id = threading.get_ident()
+    def collect(operation: str, operation_stats: dict):
+        if threading.get_ident() != thread_id:
+            return
+        totals = stats.setdefault(operation, {'calls': 0})
+        totals['calls'] += 1
+        for name, value in operation_stats.items():
+            totals[name] = totals.get(name, 0) + value
+    _stats_listeners.append(collect)
+    try:
+        yield stats
+    finally:
+        _stats_listeners.remove(collect)
+
+
+def set_stats_hook(hook):
+    '''
+    Function to give the statistics of each operation of all the threads to hook(operation, stats), for example
+    to export them to a metrics system (None to remove the hook)
+    '''
+    global _stats_hook
+    if _stats_hook is not None:
+        _stats_listeners.remove(_stats_hook)
+    _stats_hook = hook
+    if hook is not None:
+        _stats_listeners.append(hook)
+
+
+# Progress of the long operations (see watching): the (thread id, listener) of each listener,
+# replaced (never modified) so that a thread can read it while another one changes it
+_progress_listeners = []
+
+
+@contextlib.contextmanager
+def watching(listener):
+    '''
+    Context manager giving the progress of the determinizations and minimizations done by the current thread
+    in its block to listener(operation, counters), every PROGRESS_INTERVAL steps, for example to display it
+        determinization: {'subsets': found, 'treated': ..., 'waiting': ...}
+        minimization: {'states': ..., 'groups': found, 'rounds': ..., 'waiting': splitters}
+    The listener can stop the operation by raising an exception (such as OperationCancelled), given to the caller
+    '''
+    global _progress_listeners
+    entry = (threading.get_ident(), listener)
+    _progress_listeners = _progress_listeners + [entry]
+    try:
+        yield
+    finally:
+        listeners = list(_progress_listeners)
+        listeners.remove(entry)
+        _progress_listeners = listeners
+
+
+def _watchers() -> list:
+    '''Function giving the progress listeners of the current thread (see watching)'''
+    if not _progress_listeners:
+        return []
+    thread_id = threading.get_ident()
+    return [listener for listener_thread_id, listener in _progress_listeners if listener_thread_id == thread_id]
+
+
+class Automata:
+    def __init__(self, alph_size: int, nb_states: int, alphabet=None):
+        '''
+        :param alphabet: the symbols of the transitions (any str, such as bytes as chr(0)..chr(255) or unicode characters),
+            either one symbol per column of the transitions (list of alph_size symbols, default: the letters a, b...),
+            or a dictionary symbol -> column, several symbols having the same transitions (see compress_alphabet)
+        '''
+        if alphabet is None:
+            if alph_size > len(ALPH):
+                raise ValueError('An alphabet should be given for more than ' + str(len(ALPH)) + ' symbols')
+            alphabet = ALPH[:alph_size]
+        if isinstance(alphabet, dict):
+            symbol_ids = dict(alphabet)
+            if set(symbol_ids.values()) != set(range(alph_size)):
+                raise ValueError('Each column between 0 and ' + str(alph_size - 1) + ' should have at least one symbol')
+        else:
+            symbol_ids = {symbol: alph_id for alph_id, symbol in enumerate(alphabet)}
+            if len(symbol_ids) != alph_size or len(alphabet) != alph_size:
+                raise ValueError('The alphabet should have ' + str(alph_size) + ' distinct symbols')
+        self.__symbol_ids = symbol_ids
+        self.__alph_size = alph_size
+        self.__nb_states = nb_states
+        # Storage of the states (State objects are views on it):
+        #   - __table[state_id * alph_size + alph_id] is the destination of the transition, NO_DEST if there is none,
+        #     MULTI_DESTS if there are several (or a negative one), stored in the set __multi_dests[state_id * alph_size + alph_id]
+        #   - __in_flags and __out_flags are bitsets of the input and output states
+        #   - __table may be a read-only memoryview on a mapped binary file (load_binary), copied at the first modification
+        self.__table = array('i', [NO_DEST]) * (nb_states * alph_size)
+        self.__multi_dests = {}
+        self.__in_flags = bytearray((nb_states + 7) // 8)
+        self.__out_flags = bytearray((nb_states + 7) // 8)
+        self.__labels = [None] * nb_states
+        # CSR form (offsets, targets) of all the transitions, built when needed and dropped when they change
+        self.__csr = None
+        # Predecessors of the states for each letter in CSR form (see _get_predecessors), built when needed.
+        # The transitions added since are kept in __added_predecessors[(alph_id, dest_id)] (list of the sources),
+        # the index is dropped at the other modifications of the transitions
+        self.__predecessors = None
+        self.__added_predecessors = {}
+        # Counters kept up to date at each modification, so that the properties are known without scanning the states:
+        #   - __in_states is the set of the input states, __nb_out_states the number of output states
+        #   - __in_degrees[state_id] is the number of transitions to the state, __out_of_range[dest_id] the same
+        #     for the destinations which aren't states, __nb_empty and __nb_multi the numbers of (state, letter)
+        #     without destination and with several ones
+        # The counters of the transitions are None when the table is given at once (_from_table, load_binary...),
+        # they are then computed in one pass when a property is needed (see __count_transitions)
+        self.__in_states = set()
+        self.__nb_out_states = 0
+        self.__in_degrees = array('i', [0]) * nb_states
+        self.__out_of_range = {}
+        self.__nb_empty = nb_states * alph_size
+        self.__nb_multi = 0
+        # These variable will be put to True when necessary, but will be but to False again at any modification
+        # This will avoid to compute multiple time the same thing
+        self.__is_deter = False
+        self.__is_complete = False
+        self.__is_standard = False
+        self.__is_valid = False
+        # Number of modifications of the Automata: the derived Automata and the compiled matcher are kept with
+        # the number of modifications when they were computed, and computed again only if it has changed
+        self.__nb_modifications = 0
+        self.__derived = {}
+        self.__derived_stats = {'hits': 0, 'misses': 0}
+        self.__recognition_stats = {'words': 0, 'characters': 0, 'seconds': 0.0, 'compilations': 0}
+        # Statistics of the last determinization, minimization, completion and parsing done by this Automata
+        self.__last_stats = {}
+    
+    # The getters:
+    def get_nb_states(self) -> int:
+        '''Getter for the number of states'''
+        return self.__nb_states
+    def get_alph_size(self) -> int:
+        '''Getter for the number of symbols (of columns of the transitions, see get_symbol_classes)'''
+        return self.__alph_size
+    def get_alphabet(self) -> list:
+        '''Getter for the symbols of the transitions'''
+        return list(self.__symbol_ids)
+    def get_symbol_id(self, symbol: str) -> int:
+        '''Getter for the column of the transitions of a symbol (KeyError if it isn't in the alphabet)'''
+        return self.__symbol_ids[symbol]
+    def get_symbol_classes(self) -> list:
+        '''Getter for the symbols of each column of the transitions (one symbol per column, unless compress_alphabet)'''
+        classes = [[] for _ in range(self.__alph_size)]
+        for symbol, alph_id in self.__symbol_ids.items():
+            classes[alph_id].append(symbol)
+        return classes
+    def _get_symbol_ids(self) -> dict:
+        '''Return the dictionary symbol -> column (not a copy)'''
+        return self.__symbol_ids
+    def __column_name(self, alph_id: int) -> str:
+        '''Name of a column of the transitions to display it: its symbols'''
+        return ','.join(str(symbol) for symbol in self.get_symbol_classes()[alph_id])
+    def get_nb_in_states(self) -> int:
+        '''Getter for the number of input states'''
+        return len(self.__in_states)
+    def get_nb_out_states(self) -> int:
+        '''Getter for the number of output states'''
+        return self.__nb_out_states
+    def get_state(self, state_id: int) -> State:
+        '''Getter to get the state associated to a given id (a view: modifying it modifies the Automata)'''
+        if not -self.__nb_states <= state_id < self.__nb_states:
+            raise IndexError('State ' + str(state_id) + ' doesn\'t exist')
+        return State._view(self, state_id % self.__nb_states)
+
+    # Internal access to the storage of the states (used by the State views and the algorithms)
+    def _get_dests(self, state_id: int, alph_id: int) -> list:
+        '''Return the list of destinations of a state for the given letter id'''
+        slot = state_id * self.__alph_size + alph_id
+        dest_id = self.__table[slot]
+        if dest_id >= 0:
+            return [dest_id]
+        if dest_id == NO_DEST:
+            return []
+        return list(self.__multi_dests[slot])
+    def _add_dest(self, state_id: int, alph_id: int, dest_id: int):
+        '''Add a destination to a state for the given letter id'''
+        self.__own_table()
+        slot = state_id * self.__alph_size + alph_id
+        cur_dest_id = self.__table[slot]
+        if cur_dest_id == dest_id:
+            return
+        counted = self.__in_degrees is not None
+        if cur_dest_id == MULTI_DESTS:
+            dests = self.__multi_dests[slot]
+            if dest_id in dests:
+                return
+            dests.add(dest_id)
+            if counted and len(dests) == 2:
+                self.__nb_multi += 1
+        elif cur_dest_id == NO_DEST and dest_id >= 0:
+            self.__table[slot] = dest_id
+            if counted:
+                self.__nb_empty -= 1
+        else:
+            self.__multi_dests[slot] = {dest_id} if cur_dest_id == NO_DEST else {cur_dest_id, dest_id}
+            self.__table[slot] = MULTI_DESTS
+            if counted and cur_dest_id == NO_DEST:
+                self.__nb_empty -= 1
+            elif counted:
+                self.__nb_multi += 1
+        if counted:
+            self.__count_dest(dest_id, 1)
+        if self.__predecessors is not None:
+            self.__added_predecessors.setdefault((alph_id, dest_id), []).append(state_id)
+        self.__modified()
+    def _is_in(self, state_id: int) -> bool:
+        return bool(self.__in_flags[state_id >> 3] >> (state_id & 7) & 1)
+    def _is_out(self, state_id: int) -> bool:
+        return bool(self.__out_flags[state_id >> 3] >> (state_id & 7) & 1)
+    def _set_in(self, state_id: int, value: bool):
+        if value:
+            self.__in_flags[state_id >> 3] |= 1 << (state_id & 7)
+            self.__in_states.add(state_id)
+        else:
+            self.__in_flags[state_id >> 3] &= ~(1 << (state_id & 7))
+            self.__in_states.discard(state_id)
+        self.__modified()
+    def _set_out(self, state_id: int, value: bool):
+        if value != self._is_out(state_id):
+            self.__nb_out_states += 1 if value else -1
+        if value:
+            self.__out_flags[state_id >> 3] |= 1 << (state_id & 7)
+        else:
+            self.__out_flags[state_id >> 3] &= ~(1 << (state_id & 7))
+        self.__modified()
+    def _get_label(self, state_id: int) -> str:
+        return self.__labels[state_id]
+    def _set_label(self, state_id: int, label: str):
+        self.__labels[state_id] = label
+        self.__modified()
+    def _add_transitions(self, state_ids, alph_ids, dest_ids):
+        '''Add all the transitions given by three sequences of the same length, ignoring the letters out of the alphabet'''
+        if state_ids and (max(state_ids) >= self.__nb_states or min(state_ids) < 0):
+            raise IndexError('A state of the transitions doesn\'t exist')
+        self.__own_table()
+        # the counters of the transitions and the predecessors are computed again at once when needed
+        self.__in_degrees = None
+        self.__predecessors = None
+        table = self.__table
+        alph_size = self.__alph_size
+        for state_id, alph_id, dest_id in zip(state_ids, alph_ids, dest_ids):
+            if alph_id < alph_size:
+                slot = state_id * alph_size + alph_id
+                if table[slot] == NO_DEST and dest_id >= 0:
+                    table[slot] = dest_id
+                elif table[slot] != dest_id:
+                    self._add_dest(state_id, alph_id, dest_id)
+        self.__modified()
+    def _get_table(self) -> array:
+        '''Return the transition table (not a copy), see the markers NO_DEST and MULTI_DESTS'''
+        return self.__table
+    def _get_csr(self) -> tuple:
+        '''
+        Return all the transitions in CSR form: the destinations of the state s for the letter id a
+        are targets[offsets[s * alph_size + a]:offsets[s * alph_size + a + 1]] (sorted)
+        :return tuple: (offsets, targets), arrays of int
+        '''
+        if self.__csr is None:
+            table = self.__table
+            offsets = array('i', [0]) * (len(table) + 1)
+            targets = array('i')
+            for slot in range(len(table)):
+                dest_id = table[slot]
+                if dest_id >= 0:
+                    targets.append(dest_id)
+                elif dest_id == MULTI_DESTS:
+                    targets.extend(sorted(self.__multi_dests[slot]))
+                offsets[slot + 1] = len(targets)
+            self.__csr = (offsets, targets)
+        return self.__csr
+    def _get_successor_masks(self) -> list:
+        '''
+        Return, for each slot state_id * alph_size + alph_id, the bitmask of its destinations (bit dest_id set),
+        to determinize on sets of states handled as bitmasks
+        '''
+        offsets, targets = self._get_csr()
+        return [sum(1 << dest_id for dest_id in targets[offsets[slot]:offsets[slot + 1]]) for slot in range(len(offsets) - 1)]
+    def __count_dest(self, dest_id: int, delta: int):
+        '''Update the counters of the transitions to dest_id (see __init__), when one is added (delta 1) or removed (-1)'''
+        if 0 <= dest_id < self.__nb_states:
+            self.__in_degrees[dest_id] += delta
+        else:
+            nb_transitions = self.__out_of_range.get(dest_id, 0) + delta
+            if nb_transitions:
+                self.__out_of_range[dest_id] = nb_transitions
+            else:
+                del self.__out_of_range[dest_id]
+    def __count_transitions(self):
+        '''Compute the counters of the transitions (see __init__) in one pass over the table, if they aren't known'''
+        if self.__in_degrees is not None:
+            return
+        nb_dests = Counter(self.__table)
+        self.__nb_empty = nb_dests.pop(NO_DEST, 0)
+        nb_dests.pop(MULTI_DESTS, None)
+        self.__nb_multi = 0
+        for dests in self.__multi_dests.values():
+            nb_dests.update(dests)
+            if len(dests) > 1:
+                self.__nb_multi += 1
+        self.__in_degrees = array('i', [0]) * self.__nb_states
+        self.__out_of_range = {}
+        for dest_id, nb_transitions in nb_dests.items():
+            self.__count_dest(dest_id, nb_transitions)
+    def __count_flags(self):
+        '''Compute the set of the input states and the number of output states from the bitsets (given at once)'''
+        self.__in_states = {byte_id * 8 + bit for byte_id, byte in enumerate(self.__in_flags) if byte
+                            for bit in range(8) if byte >> bit & 1}
+        self.__nb_out_states = int.from_bytes(self.__out_flags, 'little').bit_count()
+    def __modified(self):
+        '''Called at any modification of the storage: the properties known and the derived Automata are outdated'''
+        self.__nb_modifications += 1
+        self.__csr = None
+        self.__is_deter = False
+        self.__is_complete = False
+        self.__is_standard = False
+        self.__is_valid = False
+    def __derive(self, name: str, compute, fits=None):
+        '''
+        Return the derived object name (determinized Automata...) of this version of the Automata,
+        computed with compute() only if it hasn't been computed since the last modification
+        (a derived Automata is copied, so that it can be modified without altering the stored one)
+        :param fits: function result -> bool, the stored result is used only if it is True (computed again otherwise)
+        '''
+        nb_modifications, result = self.__derived.get(name, (None, None))
+        if nb_modifications == self.__nb_modifications and (fits is None or fits(result)):
+            self.__derived_stats['hits'] += 1
+        else:
+            self.__derived_stats['misses'] += 1
+            result = compute()
+            if result is None:
+                return None
+            self.__derived[name] = (self.__nb_modifications, result)
+        return result.copy() if isinstance(result, Automata) else result
+    def _get_predecessors(self) -> list:
+        '''
+        Return the predecessors of the states for each letter in CSR form: the states going to the state q
+        with the letter id a are sources[offsets[q]:offsets[q + 1]] (sorted), with (offsets, sources) = predecessors[a]
+        (built in linear time when needed, see predecessors)
+        :return list: (offsets, sources) for each letter id, arrays of int
+        '''
+        if self.__predecessors is None or self.__added_predecessors:
+            nb_states = self.__nb_states
+            alph_size = self.__alph_size
+            predecessors = []
+            for alph_id in range(alph_size):
+                # the transitions of the letter (source, destination), the destinations which aren't states are ignored
+                transitions = []
+                for state_id, dest_id in enumerate(self.__table[alph_id::alph_size]):
+                    if dest_id >= 0:
+                        transitions.append((state_id, dest_id))
+                    elif dest_id == MULTI_DESTS:
+                        transitions.extend((state_id, multi_dest_id) for multi_dest_id
+                                           in sorted(self.__multi_dests[state_id * alph_size + alph_id]))
+                # counting sort of the transitions by destination
+                pred_offsets = [0] * (nb_states + 1)
+                for _, dest_id in transitions:
+                    if 0 <= dest_id < nb_states:
+                        pred_offsets[dest_id + 1] += 1
+                for state_id in range(nb_states):
+                    pred_offsets[state_id + 1] += pred_offsets[state_id]
+                sources = array('i', [0]) * pred_offsets[nb_states]
+                position = pred_offsets[:-1]
+                for state_id, dest_id in transitions:
+                    if 0 <= dest_id < nb_states:
+                        sources[position[dest_id]] = state_id
+                        position[dest_id] += 1
+                predecessors.append((array('i', pred_offsets), sources))
+            self.__predecessors = predecessors
+            self.__added_predecessors = {}
+        return self.__predecessors
+    def __own_table(self):
+        '''Copy the transition table in memory if it is mapped from a binary file (load_binary), before modifying it'''
+        if not isinstance(self.__table, array):
+            table = array('i')
+            table.frombytes(self.__table.cast('B'))
+            self.__table = table
+    def __new_state_storage(self):
+        '''Add the storage of a new state, without transition'''
+        self.__own_table()
+        self.__table.extend(array('i', [NO_DEST]) * self.__alph_size)
+        if self.__nb_states % 8 == 0:
+            self.__in_flags.append(0)
+            self.__out_flags.append(0)
+        self.__labels.append(None)
+        if self.__in_degrees is None or self.__nb_states in self.__out_of_range:
+            # transitions to the new state were added before: they aren't in the index of the predecessors
+            self.__predecessors = None
+        if self.__in_degrees is not None:
+            # the transitions to the new state were counted as out of range
+            self.__in_degrees.append(self.__out_of_range.pop(self.__nb_states, 0))
+            self.__nb_empty += self.__alph_size
+        self.__nb_states += 1
+        self.__modified()
+    def __clear_state_storage(self, state_id: int):
+        '''Remove the transitions, the label and the flags of a state'''
+        self.__own_table()
+        self.__predecessors = None
+        counted = self.__in_degrees is not None
+        for slot in range(state_id * self.__alph_size, (state_id + 1) * self.__alph_size):
+            dest_id = self.__table[slot]
+            if dest_id == NO_DEST:
+                continue
+            if dest_id == MULTI_DESTS:
+                dests = self.__multi_dests.pop(slot)
+                if counted and len(dests) > 1:
+                    self.__nb_multi -= 1
+            else:
+                dests = (dest_id,)
+            if counted:
+                for dest_id in dests:
+                    self.__count_dest(dest_id, -1)
+                self.__nb_empty += 1
+            self.__table[slot] = NO_DEST
+        self._set_in(state_id, False)
+        self._set_out(state_id, False)
+        self.__labels[state_id] = None
+        self.__modified()
+    
+    def predecessors(self, state_id: int, letter: str) -> list:
+        '''
+        Method giving the states which have a transition to the state state_id with the letter
+        (the index of the predecessors is built once in linear time, then kept up to date when destinations are added)
+        :return list: ids of the states
+        '''
+        if not 0 <= state_id < self.__nb_states:
+            raise IndexError('State ' + str(state_id) + ' doesn\'t exist')
+        if letter not in self.__symbol_ids:
+            raise KeyError('Letter ' + repr(letter) + ' isn\'t in the alphabet of this Automata')
+        alph_id = self.__symbol_ids[letter]
+        if self.__predecessors is None:
+            self._get_predecessors()
+        offsets, sources = self.__predecessors[alph_id]
+        result = list(sources[offsets[state_id]:offsets[state_id + 1]]) if state_id < len(offsets) - 1 else []
+        return result + self.__added_predecessors.get((alph_id, state_id), [])
+
+    def reverse(self) -> 'Automata':
+        '''
+        Method building the reverse Automata: transitions reversed, input and output states exchanged
+        (it recognizes the mirror of the words recognized by this one)
+        :return: Automata, usually not deterministic
+        '''
+        state_ids = []
+        alph_ids = []
+        dest_ids = []
+        for alph_id, (offsets, sources) in enumerate(self._get_predecessors()):
+            for state_id in range(self.__nb_states):
+                for source_id in sources[offsets[state_id]:offsets[state_id + 1]]:
+                    state_ids.append(state_id)
+                    alph_ids.append(alph_id)
+                    dest_ids.append(source_id)
+        new_automata = Automata(self.__alph_size, self.__nb_states, self.__symbol_ids)
+        new_automata._add_transitions(state_ids, alph_ids, dest_ids)
+        for state_id in range(self.__nb_states):
+            if self._is_in(state_id):
+                new_automata._set_out(state_id, True)
+            if self._is_out(state_id):
+                new_automata._set_in(state_id, True)
+        new_automata.__labels = list(self.__labels)
+        return new_automata
+
+    def get_derived_stats(self) -> dict:
+        '''
+        Getter for the counters of the derived Automata and matcher kept between two modifications
+        (determinize_complete, minimization, complementary_automata, compile)
+        :return: dict with the number of hits (result reused), misses (result computed) and the number of modifications
+        '''
+        stats = dict(self.__derived_stats)
+        stats['modifications'] = self.__nb_modifications
+        return stats
+    def get_last_stats(self) -> dict:
+        '''
+        Getter for the statistics of the last operations computed by this Automata (not those kept, see get_derived_stats):
+        {'determinization': {'subsets', 'transitions', time of the phases...}, 'minimization': {...}, ...}
+        '''
+        return {operation: dict(stats) for operation, stats in self.__last_stats.items()}
+    def __record_stats(self, operation: str, stats: dict):
+        '''Method keeping the statistics of an operation and giving them to the listeners (see profiling)'''
+        self.__last_stats[operation] = stats
+        for listener in _stats_listeners:
+            listener(operation, stats)
+    def get_recognition_stats(self) -> dict:
+        '''
+        Getter for the throughput counters of the batch recognition (recognize_many)
+        :return: dict with the number of words, characters, compilations, the time spent and the throughput
+        '''
+        stats = dict(self.__recognition_stats)
+        seconds = stats['seconds']
+        stats['words_per_second'] = stats['words'] / seconds if seconds else 0.0
+        stats['characters_per_second'] = stats['characters'] / seconds if seconds else 0.0
+        return stats
+
+    def is_standard(self) -> bool:
+        '''Method wether the automata is standard'''
+        if self.__is_standard:
+            return True
+        else:
+            is_std = True
+
+            # should have 1 input
+            if self.get_nb_in_states() != 1:
+                is_std = False
+                return is_std
+
+            # should have no transition to the input state
+            self.__count_transitions()
+            in_state_id = next(iter(self.__in_states))
+            if self.__in_degrees[in_state_id] > 0:
+                is_std = False
+
+            self.__is_standard = is_std
+            return is_std
+    
+    def is_deterministic(self) -> int:
+        '''
+        Method which says wether an automata is deterministic
+        Return :
+            An integer:
+                - 1 if deterministic (DETERMINISTIC)
+                - -1 if not due to the number of input (NOT_DETERM_INPUT)
+                - 0 if not due to multiple destinations (NOT_DETERM_TRANSITIONS)
+        '''
+        if self.__is_deter:
+            return True
+        else:
+            # Automata should have one input state
+            if self.get_nb_in_states() != 1:
+                return NOT_DETERM_INPUT
+
+            # Each destination should lead to 0 or 1 state
+            self.__count_transitions()
+            is_deter = self.__nb_multi == 0
+            if is_deter:
+                self.__is_deter = True
+                return DETERMINISTIC
+            else:
+                return NOT_DETERM_TRANSITIONS
+    
+    def is_complete_DFA(self, silent_mode: bool = False) -> int:
+        '''
+        Method which says wether a FA is a complete deterministic automata
+        Return :
+            An integer:
+                - 1 if CDFA (CDFA)
+                - -1,0 if not deterministic (NOT_DETERM_INPUT, NOT_DETERM_TRANSITIONS)
+                - -2 if deterministic but not complete (first problematic state will be printed) (
+        '''
+        if self.__is_deter and self.__is_complete:
+            # if the Automata is already CDFA (haven't be changed since last check)
+            return True
+        else:
+            # if it has more than one entry it is not a deterministic one
+            if self.get_nb_in_states() != 1:
+                if not silent_mode: trace('not_cdfa_inputs')
+                return NOT_DETERM_INPUT
+            # Each transition should have exactly 1 destination (the first problematic one is printed)
+            self.__count_transitions()
+            if self.__nb_multi:
+                if not silent_mode:
+                    slot = min(slot for slot, dests in self.__multi_dests.items() if len(dests) > 1)
+                    cur_state_id, cur_alph_id = divmod(slot, self.get_alph_size())
+                    trace('not_cdfa_transitions', state_id=cur_state_id, letter=self.__column_name(cur_alph_id),
+                          nb_dests=len(self.__multi_dests[slot]))
+                return NOT_DETERM_TRANSITIONS
+            self.__is_deter = True
+            if self.__nb_empty:
+                if not silent_mode:
+                    table = self.__table if isinstance(self.__table, array) else self.__table.tolist()
+                    cur_state_id, cur_alph_id = divmod(table.index(NO_DEST), self.get_alph_size())
+                    trace('not_cdfa_incomplete', state_id=cur_state_id, letter=self.__column_name(cur_alph_id))
+                return DETER_NOT_COMPLETE
+            # Updating the Automata based on results
+            self.__is_complete = True
+            return CDFA
+        
+    def is_valid(self) -> bool:
+        '''Method to know if an Automata is valid
+            (verify only for the destinations since the method add_state already ensure, for added states, the size of the alphabet and correct id)'''
+        if self.__is_valid:
+            return True
+        else:
+            # check if the destinations exists
+            self.__count_transitions()
+            validity = not self.__out_of_range
+            self.__is_valid = validity
+            return validity
+
+    
+    # The setters:
+    # Methods for Automata
+
+    def add_state(self, state: State, silent_mode: bool = False):
+        '''
+        Method to add a state in an Automata, safely (cohesion of data ensured with alphabet size and id of the nodes)
+        (will replace the node the exist with the same id)
+        '''
+        if state.get_alph_size() != self.__alph_size:
+            trace('incompatible_alphabet', state_id=state.get_id(), alph_size=state.get_alph_size())
+        else:
+            # reading the data of the state first (it may be a view on this Automata)
+            dests = [state._get_dests_of(alph_id) for alph_id in range(self.__alph_size)]
+            is_in, is_out, label = state.is_in(), state.is_out(), state.get_label()
+            if state.get_id() >= self.get_nb_states():
+                state.mod_id(self.__nb_states, True)
+                self.__new_state_storage()
+                if not silent_mode: trace('state_added', state_id=self.__nb_states - 1)
+            else :
+                self.__clear_state_storage(state.get_id())
+                if not silent_mode: trace('state_replaced', state_id=state.get_id())
+            state_id = state.get_id()
+            for alph_id in range(self.__alph_size):
+                for dest_id in dests[alph_id]:
+                    self._add_dest(state_id, alph_id, dest_id)
+            self._set_in(state_id, is_in)
+            self._set_out(state_id, is_out)
+            self.__labels[state_id] = label
+            # the state added is now a view on this Automata (as if it was stored in it)
+            if not state.is_view():
+                state._attach(self)
+
+    def standardize(self) -> bool:
+        if self.is_standard():
+            return False
+        else :
+            # looking for the entry states, removing their Input arrow
+            entries_id = []
+            for i in range(self.get_nb_states()):
+                if self._is_in(i):
+                    entries_id.append(i)
+                    self._set_in(i, False)
+
+            # looking: if an entry is an output, where the entries points
+            is_output = False
+            # using a state so that I don't do multiple times the same transition
+            destinations = set()
+            symbols = [symbol_class[0] for symbol_class in self.get_symbol_classes()]
+            for iD in entries_id:
+                #if output
+                if self._is_out(iD):
+                    is_output = True
+                # storing destinations
+                for cur_alph_id in range(self.get_alph_size()):
+                    for dest in self._get_dests(iD, cur_alph_id):
+                        destinations.add((symbols[cur_alph_id], dest))
+
+            # creating the new state i
+            # init
+            state_i = State(self.get_alph_size(), self.get_nb_states(), self.__symbol_ids)
+            # entry
+            state_i.set_in()
+            # output ?
+            if is_output:
+                state_i.set_out()
+            # destinations
+            for letter, dest in destinations:
+                state_i.add_dest(letter, dest)
+            # adding to the automata
+            self.add_state(state_i)
+            return True
+
+    def recognize_word(self, word : str) -> bool:
+        '''
+        Method to check if a word is recognized by the Automata
+        :return: bool -- True if recognized
+        '''
+        valid = 1
+        ch_id = 0
+        while valid and ch_id < len(word):
+            if word[ch_id] not in self.__symbol_ids:
+                valid = 0
+            ch_id += 1
+        if _stats_listeners:
+            for listener in _stats_listeners:
+                listener('recognition', {'words': 1, 'characters': len(word)})
+        if not valid:
+            trace('invalid_character', word=word)
+            return False
+        else:
+            # Ensuring that it is deterministic to treat the problem easily
+            if self.is_complete_DFA(True) == CDFA:
+                trace('recognition_deterministic')
+                return self.recursive_word_recognition(word, next(iter(self.__in_states)))
+            else:
+                A = self.determinize_complete()
+                trace('recognition_determinized', automata=A)
+                return A.recursive_word_recognition(word, next(iter(A.__in_states)))
+
+
+    def compile_lazy(self, max_states: int = 10000, eviction: str = 'flush') -> LazyMatcher:
+        '''
+        Method to get a matcher which determinizes the Automata on the fly, only for the states reached by the words
+        (no need to build the whole determinized Automata first, see LazyMatcher)
+        :param max_states: maximum number of determinized states kept in memory
+        :param eviction: 'flush' or 'lru', what to do when the cache is full
+        :return: LazyMatcher
+        '''
+        return LazyMatcher.from_automata(self, max_states, eviction)
+
+    def recognize_many(self, words) -> list:
+        '''
+        Method to check if each word of a batch is recognized by the Automata
+        The Automata is determinized and compiled only once (see compile), the throughput is available with get_recognition_stats
+        :param words: any iterable of words
+        :return: list of bool -- True at the position of each recognized word (False for invalid characters)
+        '''
+        recognize = self.compile().recognize_word
+        results = []
+        nb_characters = 0
+        start = time.perf_counter()
+        for word in words:
+            results.append(recognize(word))
+            nb_characters += len(word)
+        seconds = time.perf_counter() - start
+        self.__recognition_stats['seconds'] += seconds
+        self.__recognition_stats['words'] += len(results)
+        self.__recognition_stats['characters'] += nb_characters
+        if _stats_listeners:
+            for listener in _stats_listeners:
+                listener('recognition', {'words': len(results), 'characters': nb_characters, 'seconds': seconds})
+        return results
+
+    def recognize_array(self, words):
+        '''
+        Method to check a batch of words with the vectorized recognition of the compiled Automata
+        (see CompiledMatcher.recognize_array, NumPy is used if installed)
+        :param words: any iterable of words
+        :return: array (list without NumPy) of bool -- True at the position of each recognized word
+        '''
+        matcher = self.compile()
+        start = time.perf_counter()
+        words = list(words)
+        results = matcher.recognize_array(words)
+        seconds = time.perf_counter() - start
+        nb_characters = sum(len(word) for word in words)
+        self.__recognition_stats['seconds'] += seconds
+        self.__recognition_stats['words'] += len(words)
+        self.__recognition_stats['characters'] += nb_characters
+        if _stats_listeners:
+            for listener in _stats_listeners:
+                listener('recognition', {'words': len(words), 'characters': nb_characters, 'seconds': seconds})
+        return results
+
+    def recognize_file(self, path: str, chunk_size: int = 1 << 20) -> bool:
+        '''
+        Method to check if the content of a file (one byte per character) is a word recognized by the Automata
+        The file is read by chunks of chunk_size bytes in a single buffer, whatever its size
+        :return: bool -- True if recognized
+        '''
+        recognizer = Recognizer(self)
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        with open(path, 'rb', buffering=0) as file:
+            nb_read = file.readinto(buffer)
+            while nb_read:
+                recognizer.feed_bytes(buffer if nb_read == chunk_size else view[:nb_read])
+                nb_read = file.readinto(buffer)
+        return recognizer.is_accepting()
+
+    def recursive_word_recognition(self, word: str, state_id: int) -> bool:
+        '''
+        Method to find if a correct word is recognized, from a state (iterative, despite its name)
+        Each step (the rest of the word and the state reached) is the event recognition_step, only built if traced
+        :param word: correct word to be recognized (correct means characters in alphabet)
+        :param state_id: id of the state at which we arrived
+        :return:
+        '''
+        traced = is_traced()
+        table = self.__table
+        alph_size = self.__alph_size
+        symbol_ids = self.__symbol_ids
+        for ch_id in range(len(word)):
+            if traced:
+                trace('recognition_step', word=word[ch_id:], state_id=state_id)
+            state_id = table[state_id * alph_size + symbol_ids[word[ch_id]]]
+        if traced:
+            trace('recognition_step', word='', state_id=state_id)
+        return self._is_out(state_id)
+
+    def compile(self) -> CompiledMatcher:
+        '''
+        Method to compile the Automata into an immutable matcher, based on its complete deterministic version
+        (recognition is then iterative, linear and silent: see CompiledMatcher.recognize_word)
+        The matcher is kept until the next modification of the Automata
+        :return: CompiledMatcher
+        '''
+        return self.__derive('compiled', self.__compile)
+    def __compile(self) -> CompiledMatcher:
+        if self.is_complete_DFA(True) == CDFA:
+            A = self
+        else:
+            A = self.determinize_complete()
+        self.__recognition_stats['compilations'] += 1
+        # the table of the matcher has a column per class of symbols
+        return CompiledMatcher.from_automata(A.__compressed())
+
+    def completion(self):
+        ''' Method to complete a deterministic Automata'''
+        if self.is_complete_DFA(True) != CDFA:
+            if self.is_deterministic() != DETERMINISTIC:
+                trace('not_deterministic')
+            else:
+                # Completion
+                start = time.perf_counter()
+                # Add a Garbage state G
+                g = State(self.get_alph_size(), self.get_nb_states(), self.__symbol_ids)
+                g.set_label('G')
+                for symbol_class in self.get_symbol_classes():
+                    g.add_dest(symbol_class[0], self.get_nb_states())
+                g_id = self.get_nb_states()
+                self.add_state(g, True)
+                # Find all the transitions that are empty and put G as destination
+                table = self.__table
+                slot = 0
+                nb_completed = 0
+                try:
+                    while True:
+                        slot = table.index(NO_DEST, slot)
+                        table[slot] = g_id
+                        nb_completed += 1
+                except ValueError:
+                    pass
+                if self.__in_degrees is not None:
+                    self.__in_degrees[g_id] += nb_completed
+                    self.__nb_empty -= nb_completed
+                self.__predecessors = None
+                self.__modified()
+                self.__is_complete = True
+                # may not be changed but prefer to be safe
+                self.__is_standard = False
+                self.__record_stats('completion', {'completed_transitions': nb_completed, 'seconds': time.perf_counter() - start})
+
+    def determinize_complete(self, max_states: int = None, timeout: float = None, trim: bool = False) -> 'Automata':
+        '''
+        Method to determinize an Automata, the result will be also complete
+        The states of the determinized Automata (sets of states) are handled as bitmasks of the ids of the states
+        :param max_states: maximum number of states of the determinized Automata (no limit if None)
+        :param timeout: maximum time of the determinization, in seconds (no limit if None)
+        :param trim: remove first the states useless to recognize words (see trim), the labels keep the ids of this Automata
+        :return Automata object
+        :raise DeterminizationLimitError: if max_states or timeout is exceeded
+        The determinized Automata kept from a previous call is given back only if it has at most max_states states
+        (it is given at once, within any timeout), otherwise it is computed again with the limits
+        '''
+        fits = None if max_states is None else lambda A: A.get_nb_states() <= max_states
+        if trim:
+            return self.__derive('determinized_trimmed', lambda: self.__determinize_trimmed(max_states, timeout), fits)
+        return self.__derive('determinized', lambda: self.__determinize_complete(max_states, timeout), fits)
+    def __determinize_trimmed(self, max_states: int, timeout: float) -> 'Automata':
+        trimmed, new_ids = self.trim(True)
+        state_names = [str(state_id) for state_id in range(self.__nb_states) if new_ids[state_id] != -1]
+        new_automata = trimmed.__determinize_complete(max_states, timeout, state_names)
+        self.__last_stats.update(trimmed.__last_stats)
+        return new_automata
+    def __determinize_complete(self, max_states: int, timeout: float, state_names: list = None) -> 'Automata':
+        '''
+        :param state_names: names of the states in the labels of the determinized Automata (default: their ids)
+        '''
+        compressed = self.__compressed()
+        if compressed is not self:
+            # the determinization works on the classes of symbols, then each symbol gets back its own column
+            class_of_column = [compressed.get_symbol_id(symbol_class[0]) for symbol_class in self.get_symbol_classes()]
+            new_automata = compressed.__determinize_complete(max_states, timeout, state_names)
+            self.__last_stats.update(compressed.__last_stats)
+            return new_automata._map_columns(class_of_column, self.__symbol_ids)
+        # ( for each new state (begining with the combination of the states) add the combined destination and if destination is a new state, add it)
+        automat_alph_size = self.get_alph_size()
+        start = time.perf_counter()
+        deadline = None if timeout is None else start + timeout
+        # Precomputing, for each state and letter, the bitmask of the destinations
+        successors = self._get_successor_masks()
+        successors_end = time.perf_counter()
+        nb_components = 0
+        in_mask = int.from_bytes(self.__in_flags, 'little')
+        out_mask = int.from_bytes(self.__out_flags, 'little')
+
+        # storage of the new Automata, the states are added in the order of their ids
+        new_table = array('i')
+        new_labels = []
+        new_out_states = []
+        # creating a dictionary to store which combination has which id, intiat it with the inputs states
+        new_states = {in_mask: 0}
+        # create a queue to know which state you have to treat
+        state_queue = deque()
+        state_queue.append(in_mask)
+        watchers = _watchers()
+
+        # run through all states and process to adding when needed until the queue is empty
+        while state_queue:
+            if deadline is not None and time.perf_counter() > deadline:
+                raise DeterminizationLimitError('The determinization took more than ' + str(timeout)
+                                                + ' seconds (' + str(len(new_states)) + ' states found)')
+            if watchers and not len(new_labels) % PROGRESS_INTERVAL:
+                for watcher in watchers:
+                    watcher('determinization', {'subsets': len(new_states), 'treated': len(new_labels),
+                                                'waiting': len(state_queue)})
+            # Initialization of the state and it's destinations
+            cur_mask = state_queue.popleft()
+            current_destinations = [0] * automat_alph_size
+            # Running through the states composing the current state (by increasing id)
+            components = []
+            remaining = cur_mask
+            while remaining:
+                lowest = remaining & -remaining
+                state_id = lowest.bit_length() - 1
+                components.append(str(state_id) if state_names is None else state_names[state_id])
+                offset = state_id * automat_alph_size
+                for alph_id in range(automat_alph_size):
+                    current_destinations[alph_id] |= successors[offset + alph_id]
+                remaining ^= lowest
+            new_labels.append('.'.join(components))
+            nb_components += len(components)
+            if cur_mask & out_mask:
+                new_out_states.append(new_states[cur_mask])
+            # Running through the destinations of the current state
+            for alph_id in range(automat_alph_size):
+                dest_mask = current_destinations[alph_id]
+                if dest_mask:
+                    if dest_mask not in new_states:
+                        if max_states is not None and len(new_states) >= max_states:
+                            raise DeterminizationLimitError('The determinized Automata has more than '
+                                                            + str(max_states) + ' states')
+                        new_states[dest_mask] = len(new_states)
+                        state_queue.append(dest_mask)
+                    new_table.append(new_states[dest_mask])
+                else:
+                    new_table.append(NO_DEST)
+
+        exploration_end = time.perf_counter()
+        new_automata = Automata._from_table(automat_alph_size, new_table, [0], new_out_states, new_labels, self.__symbol_ids)
+        new_automata.completion()
+        end = time.perf_counter()
+        self.__record_stats('determinization', {
+            'states': self.__nb_states,
+            # sets of states built, and transitions of their states read
+            'subsets': len(new_states),
+            'transitions': nb_components * automat_alph_size,
+            'successors_seconds': successors_end - start,
+            'exploration_seconds': exploration_end - successors_end,
+            'completion_seconds': end - exploration_end,
+            'seconds': end - start,
+        })
+        # __is_deter, __is_complete and __is_standard have been updated by previous calls to fcts
+        return new_automata
+
+    def printCDFA(self):
+        '''Method to print Automata with label (for Determinitics ones for exemple)'''
+        print(self.str_CDFA())
+
+    def str_CDFA(self) -> str:
+        '''Method giving the table displayed by printCDFA'''
+        return self.__str_table(self._str_label_list())
+
+    def __str_table(self, array: list) -> str:
+        '''Method giving the text of a matrix of _str_label_list, with a border all around and inside'''
+        # Finding the max size of a column
+        col_widths = [max(len(item) for item in col if item) for col in zip(*array)]
+
+        # Creating a beautiful line
+        border = '+-' + '-+-'.join('-' * width for width in col_widths) + '-+'
+
+        lines = [border]
+        for row_nbr, row in enumerate(array):
+            formatted_row = " | ".join(f"{item:<{width}}" if item else " " * width for item, width in zip(row, col_widths))
+            lines.append(f"| {formatted_row} |")
+            if row_nbr == 0:
+                lines.append(border)
+        lines.append(border)
+        return '\n'.join(lines)
+
+    def _str_label_list(self, minim:bool = False) -> list:
+        '''
+        Method to display the state with print()
+        :return list: matrix corresponding to the display in a table of the Automata
+        '''
+
+        row = self.get_nb_states() + 1
+        col = self.get_alph_size() + 2
+
+        items = [['' for _ in range(col)] for __ in range(row)]
+        for i in range(2,col):
+            items[0][i] = self.__column_name(i-2)
+        for row_nbr in range(1,row):
+            # if it is an input or output state
+            state_id = row_nbr - 1
+            arrow = ""
+            if self.get_state(state_id).is_out():
+                arrow += '<'
+                if not (self.get_state(state_id).is_in()):
+                    arrow += '-'
+            if self.get_state(state_id).is_in():
+                arrow += '->'
+            items[row_nbr][0] = arrow
+            # It's id or label
+            cur_label = self.get_state(state_id).get_label()
+            if cur_label is None or ("," in cur_label and minim):
+                if cur_label is not None and state_id > 0 and state_id < 10:
+                    roman_numerals = {1: "I", 2: "II", 3: "III", 4: "IV", 5: "V", 6: "VI", 7: "VII", 8: "VIII", 9: "IX"}
+                    name = roman_numerals[state_id]
+                else:
+                    name = str(self.get_state(state_id).get_id())
+            else:
+                name = "(" + str(cur_label) + ")"
+            items[row_nbr][1] = name
+            # All the transitions
+            for col_nbr in range(2,col):
+                alph_id = col_nbr - 2
+                transitions_str = ""
+                for dest_id in self._get_dests(state_id, alph_id):
+                    # Don't show the label if isn't or if is a group due to minimization (,)
+                    dest_label = self.get_state(dest_id).get_label()
+                    if dest_label is None or ("," in dest_label and minim):
+                        if dest_label is not None and dest_id > 0 and dest_id < 10:
+                            roman_numerals = {1: "I",2: "II",3: "III",4: "IV",5: "V",6: "VI",7: "VII",8: "VIII",9: "IX"}
+                            transitions_str += roman_numerals[dest_id]
+                        else:
+                            transitions_str += str(dest_id)
+                    else:
+                        transitions_str += "(" + dest_label + ")"
+                    transitions_str += '/'
+                if not transitions_str:
+                    transitions_str += '--'
+                else:
+                    transitions_str = transitions_str[:-1]
+                items[row_nbr][col_nbr] = transitions_str + ''
+        return items
+
+    def print_minimized(self):
+        '''Method to display a minimized Automata'''
+        print(self.str_minimized())
+
+    def str_minimized(self) -> str:
+        '''Method giving the table displayed by print_minimized'''
+        # mainly the same as printCDFA but showing the group at the end
+        lines = [self.__str_table(self._str_label_list(True))]
+        # Displaying the eventual groups made by the minimization
+        group = False
+        for state_id in range(self.get_nb_states()):
+            if self.get_state(state_id).get_label() is not None and ',' in self.get_state(state_id).get_label():
+                if not group:
+                    lines.append("| With the groups:")
+                    group = True
+                if state_id > 0 and state_id < 10:
+                    roman_numerals = {1: "I", 2: "II", 3: "III", 4: "IV", 5: "V", 6: "VI", 7: "VII", 8: "VIII", 9: "IX"}
+                    lines.append("| "+roman_numerals[state_id]+" corresponding to "+ self.get_state(state_id).get_label())
+                else:
+                    lines.append("| "+str(state_id)+" corresponding to "+ self.get_state(state_id).get_label())
+        return '\n'.join(lines)
+
+    def __equivalence_blocks(self, stats: dict) -> list:
+        '''
+        Method computing the groups of equivalent states of a CDFA with Hopcroft's partition refinement (minimization)
+        :param stats: dictionary where the counters of the refinement are added (rounds, splits, states scanned)
+        :return list: the id of the group of each state
+        '''
+        nb_states = self.get_nb_states()
+        alph_size = self.get_alph_size()
+        # For each letter, the predecessors of each state (CSR: those of q are pred_ids[pred_starts[q]:pred_starts[q+1]])
+        predecessors = self._get_predecessors()
+
+        # Refinable partition: the states of block b are elements[block_start[b]:block_end[b]],
+        # the marked ones (predecessors of the current splitter) are moved to the beginning of their block
+        terminals = [state_id for state_id in range(nb_states) if self._is_out(state_id)]
+        non_terminals = [state_id for state_id in range(nb_states) if not self._is_out(state_id)]
+        elements = terminals + non_terminals
+        location = [0] * nb_states
+        for position_id, state_id in enumerate(elements):
+            location[state_id] = position_id
+        block_of = [1] * nb_states
+        for state_id in terminals:
+            block_of[state_id] = 0
+        block_start = [0, len(terminals)]
+        block_end = [len(terminals), nb_states]
+        marked = [0, 0]
+
+        # Splitters waiting to be used: (block, letter) as block * alph_size + letter, starting with the smallest group
+        # (the letters having the same transitions split the same way: only one of each class is used)
+        letter_ids = self.__column_classes()[1]
+        waiting = []
+        if terminals and non_terminals:
+            smallest = 0 if len(terminals) <= len(non_terminals) else 1
+            waiting = [smallest * alph_size + alph_id for alph_id in letter_ids]
+
+        nb_rounds = 0
+        nb_splits = 0
+        nb_scanned = 0
+        watchers = _watchers()
+        while waiting:
+            if watchers and not nb_rounds % PROGRESS_INTERVAL:
+                for watcher in watchers:
+                    watcher('minimization', {'states': nb_states, 'groups': len(block_start), 'rounds': nb_rounds,
+                                             'waiting': len(waiting)})
+            splitter, alph_id = divmod(waiting.pop(), alph_size)
+            pred_starts, pred_ids = predecessors[alph_id]
+            touched = []
+            nb_rounds += 1
+            nb_scanned += block_end[splitter] - block_start[splitter]
+            for state_id in elements[block_start[splitter]:block_end[splitter]]:
+                for pred_id in pred_ids[pred_starts[state_id]:pred_starts[state_id + 1]]:
+                    block = block_of[pred_id]
+                    first_unmarked = block_start[block] + marked[block]
+                    if location[pred_id] >= first_unmarked:
+                        if not marked[block]:
+                            touched.append(block)
+                        # swapping with the first unmarked state of the block
+                        other_id = elements[first_unmarked]
+                        elements[location[pred_id]] = other_id
+                        location[other_id] = location[pred_id]
+                        elements[first_unmarked] = pred_id
+                        location[pred_id] = first_unmarked
+                        marked[block] += 1
+            for block in touched:
+                nb_marked = marked[block]
+                marked[block] = 0
+                size = block_end[block] - block_start[block]
+                if nb_marked == size:
+                    continue
+                # the smallest part becomes a new block (the states of this part are relabeled)
+                new_block = len(block_start)
+                middle = block_start[block] + nb_marked
+                if nb_marked <= size - nb_marked:
+                    block_start.append(block_start[block])
+                    block_end.append(middle)
+                    block_start[block] = middle
+                else:
+                    block_start.append(middle)
+                    block_end.append(block_end[block])
+                    block_end[block] = middle
+                marked.append(0)
+                nb_splits += 1
+                for state_id in elements[block_start[new_block]:block_end[new_block]]:
+                    block_of[state_id] = new_block
+                # (Hopcroft) whether or not the block was waiting, only the new smaller part needs to be added
+                waiting.extend(new_block * alph_size + letter_id for letter_id in letter_ids)
+        # a round uses a splitter (block, letter)
+        stats['rounds'] = nb_rounds
+        stats['splits'] = nb_splits
+        stats['states_scanned'] = nb_scanned
+        return block_of
+
+    def minimization(self, trim: bool = False) -> 'Automata':
+        '''
+        Method to build a minimized Automata
+        :param trim: remove first the states which can't be reached or can't reach an output state (see trim),
+            those reached are replaced by a single garbage state; the labels keep the ids of this Automata
+        return: Automata minimized
+        '''
+        if trim:
+            return self.__derive('minimized_trimmed', self.__minimization_trimmed)
+        return self.__derive('minimized', self.__minimization)
+    def __minimization_trimmed(self) -> 'Automata':
+        if self.is_complete_DFA(True) != CDFA:
+            return self.__minimization()
+        trimmed, new_ids = self.trim(True)
+        if trimmed.get_nb_in_states() != 1:
+            # no word recognized: nothing to keep
+            return self.__minimization()
+        for state_id in range(self.__nb_states):
+            if new_ids[state_id] != -1 and self.__labels[state_id] is None:
+                trimmed.__labels[new_ids[state_id]] = str(state_id)
+        trimmed.completion()
+        new_automata = trimmed.__minimization()
+        self.__last_stats.update(trimmed.__last_stats)
+        return new_automata
+    def __minimization(self) -> 'Automata':
+        if self.is_complete_DFA(True) == CDFA:
+            start = time.perf_counter()
+            stats = {'states': self.__nb_states}
+            # Groups of equivalent states, numbered in the order of their smallest state
+            block_of = self.__equivalence_blocks(stats)
+            refinement_end = time.perf_counter()
+            group_of_block = {}
+            groups = []
+            for state_id in range(self.get_nb_states()):
+                if block_of[state_id] not in group_of_block:
+                    group_of_block[block_of[state_id]] = len(groups)
+                    groups.append([])
+                groups[group_of_block[block_of[state_id]]].append(state_id)
+            association = {state_id: grp_id for grp_id in range(len(groups)) for state_id in groups[grp_id]}
+            stats['groups'] = len(groups)
+
+            if len(groups) == self.get_nb_states():
+                trace('already_minimized')
+                end = time.perf_counter()
+                stats.update({'refinement_seconds': refinement_end - start, 'construction_seconds': end - refinement_end,
+                              'seconds': end - start})
+                self.__record_stats('minimization', stats)
+                return self.copy()
+
+            # Construct an Automata with the groups obtained
+            alph_size = self.get_alph_size()
+            new_table = array('i', [NO_DEST]) * (len(groups) * alph_size)
+            new_labels = []
+            in_groups = []
+            out_groups = []
+            for group_id in range(len(groups)):
+                group = groups[group_id]
+                # if a state is an entry
+                if any(self._is_in(state_id) for state_id in group):
+                    in_groups.append(group_id)
+                a_state_id = group[0]
+                # thanks to theta 0, if one is output the group is
+                if self._is_out(a_state_id):
+                    out_groups.append(group_id)
+                # putting the correct destination since it is deterministic
+                for alph_id in range(alph_size):
+                    new_table[group_id * alph_size + alph_id] = association[self.__table[a_state_id * alph_size + alph_id]]
+                # adding a label to the group
+                new_labels.append(', '.join([self.__labels[state_id] if self.__labels[state_id] is not None else str(state_id) for state_id in group]))
+            new_automata = Automata._from_table(alph_size, new_table, in_groups, out_groups, new_labels, self.__symbol_ids)
+            end = time.perf_counter()
+            stats.update({'refinement_seconds': refinement_end - start, 'construction_seconds': end - refinement_end,
+                          'seconds': end - start})
+            self.__record_stats('minimization', stats)
+            return new_automata
+        else:
+            trace('not_cdfa')
+
+    def complementary_automata(self) -> 'Automata':
+        '''
+        Method that returns the complementary automata
+        :return:
+        '''
+        return self.__derive('complementary', self.__complementary_automata)
+    def __complementary_automata(self) -> 'Automata':
+        if self.is_complete_DFA(True) == CDFA:
+            new_automata = self.copy()
+        else:
+            new_automata = self.determinize_complete()
+            if is_traced():
+                # a copy, since its outputs are switched below
+                trace('complementary_determinized', automata=new_automata.copy())
+        # List such that [[NT],[T]]
+        state_id_is_terminal = [[],[]]
+        for state_id in range(new_automata.get_nb_states()):
+            state_id_is_terminal[new_automata._is_out(state_id)].append(state_id)
+        # Switching the NT and T states state of output
+        for state_id in state_id_is_terminal[0]:
+            new_automata._set_out(state_id, True)
+        for state_id in state_id_is_terminal[1]:
+            new_automata._set_out(state_id, False)
+        return new_automata
+
+    def intersection(self, other: 'Automata', minimize: bool = False) -> 'Automata':
+        '''
+        Method building the complete deterministic Automata recognizing the words recognized by both Automata
+        :param minimize: minimize the operands before the product, and the result
+        '''
+        return self.__product(other, lambda is_out, is_other_out: is_out and is_other_out, minimize)
+    def union(self, other: 'Automata', minimize: bool = False) -> 'Automata':
+        '''Method building the complete deterministic Automata recognizing the words recognized by one of the Automata (see intersection)'''
+        return self.__product(other, lambda is_out, is_other_out: is_out or is_other_out, minimize)
+    def difference(self, other: 'Automata', minimize: bool = False) -> 'Automata':
+        '''Method building the complete deterministic Automata recognizing the words recognized by this one but not by other (see intersection)'''
+        return self.__product(other, lambda is_out, is_other_out: is_out and not is_other_out, minimize)
+    def symmetric_difference(self, other: 'Automata', minimize: bool = False) -> 'Automata':
+        '''Method building the complete deterministic Automata recognizing the words recognized by only one of the Automata (see intersection)'''
+        return self.__product(other, lambda is_out, is_other_out: is_out != is_other_out, minimize)
+    def __cdfa(self, minimize: bool = False) -> 'Automata':
+        '''Return this Automata if it is a complete DFA, otherwise its determinized one (minimized if asked)'''
+        A = self
+        if A.is_complete_DFA(True) != CDFA:
+            A = A.determinize_complete()
+        if not A.is_valid():
+            raise ValueError('The Automata should be valid (some destinations don\'t exist)')
+        return A.minimization() if minimize else A
+    def __product(self, other: 'Automata', accepts, minimize: bool) -> 'Automata':
+        '''
+        Build the product of the complete DFA of both Automata: only the pairs of states reachable from the pair
+        of input states are built (BFS), a pair being identified by the integer state_id * nb_states_other + other_state_id
+        :param accepts: function (is output in self, is output in other) -> is the pair an output state
+        '''
+        A = self.__cdfa(minimize)
+        B = other.__cdfa(minimize)
+        letters, symbol_ids = A.__joint_letters(B)
+
+        a_table, b_table = A.__table, B.__table
+        a_alph_size, b_alph_size = A.__alph_size, B.__alph_size
+        b_nb_states = B.__nb_states
+        start = next(iter(A.__in_states)) * b_nb_states + next(iter(B.__in_states))
+        pair_ids = {start: 0}
+        # the pairs found, in the order of their ids: also the queue of the BFS
+        pairs = [start]
+        new_table = array('i')
+        new_out_states = []
+        pair_id = 0
+        while pair_id < len(pairs):
+            state_id, other_state_id = divmod(pairs[pair_id], b_nb_states)
+            if accepts(A._is_out(state_id), B._is_out(other_state_id)):
+                new_out_states.append(pair_id)
+            a_offset, b_offset = state_id * a_alph_size, other_state_id * b_alph_size
+            for _, a_alph_id, b_alph_id in letters:
+                dest = a_table[a_offset + a_alph_id] * b_nb_states + b_table[b_offset + b_alph_id]
+                dest_id = pair_ids.get(dest)
+                if dest_id is None:
+                    dest_id = pair_ids[dest] = len(pairs)
+                    pairs.append(dest)
+                new_table.append(dest_id)
+            pair_id += 1
+
+        new_automata = Automata._from_table(len(letters), new_table, [0], new_out_states, [None] * len(pairs), symbol_ids)
+        if minimize:
+            new_automata = new_automata.minimization()
+        # back to the columns of this Automata if its symbols of a column are still together
+        class_of_column = [symbol_ids[symbol_class[0]] for symbol_class in self.get_symbol_classes()]
+        if all(symbol_ids[symbol] == class_of_column[alph_id] for symbol, alph_id in self.__symbol_ids.items()):
+            new_automata = new_automata._map_columns(class_of_column, self.__symbol_ids)
+        return new_automata
+    def __joint_letters(self, other: 'Automata') -> tuple:
+        '''
+        Group the symbols having the same transitions in both Automata, such a group being handled as one letter (see compress_alphabet)
+        :return tuple: (list of (a symbol, its column in self, its column in other) for each letter, dictionary symbol -> letter)
+        '''
+        if set(self.__symbol_ids) != set(other.__symbol_ids):
+            raise ValueError('Both Automata should have the same alphabet')
+        class_of_column = self.__column_classes()[0]
+        other_class_of_column = other.__column_classes()[0]
+        letter_of_classes = {}
+        letters = []
+        symbol_ids = {}
+        for symbol, alph_id in self.__symbol_ids.items():
+            other_alph_id = other.__symbol_ids[symbol]
+            classes = (class_of_column[alph_id], other_class_of_column[other_alph_id])
+            if classes not in letter_of_classes:
+                letter_of_classes[classes] = len(letters)
+                letters.append((symbol, alph_id, other_alph_id))
+            symbol_ids[symbol] = letter_of_classes[classes]
+        return letters, symbol_ids
+
+    def equivalent(self, other: 'Automata', counterexample: bool = False):
+        '''
+        Method to know if both Automata recognize the same words, without determinizing nor minimizing them:
+        the pairs of states of their complete DFA (built on the fly) reachable by the same words are merged
+        with a union-find (Hopcroft-Karp), up to the first pair where only one state is an output
+        :param counterexample: also return a shortest word recognized by only one of them (None if they are equivalent)
+        :return: bool, or tuple (bool, word) if counterexample
+        '''
+        word = self.__distinguishing_word(other, False)
+        return (word is None, word) if counterexample else word is None
+    def included_in(self, other: 'Automata', counterexample: bool = False):
+        '''
+        Method to know if all the words recognized by this Automata are recognized by other (see equivalent)
+        :param counterexample: also return a shortest word recognized by this one but not by other (None if included)
+        :return: bool, or tuple (bool, word) if counterexample
+        '''
+        word = self.__distinguishing_word(other, True)
+        return (word is None, word) if counterexample else word is None
+    def __lazy_cdfa(self) -> tuple:
+        '''
+        Return (input state, function (state, alph_id) -> destination, function state -> is output) of the complete DFA
+        of this Automata: its own states if it is one, otherwise the sets of states (bitmasks) of the determinization,
+        computed when they are reached
+        '''
+        if not self.is_valid():
+            raise ValueError('The Automata should be valid (some destinations don\'t exist)')
+        alph_size = self.__alph_size
+        if self.is_complete_DFA(True) == CDFA:
+            table = self.__table
+            return next(iter(self.__in_states)), lambda state_id, alph_id: table[state_id * alph_size + alph_id], self._is_out
+        successors = self._get_successor_masks()
+        out_mask = int.from_bytes(self.__out_flags, 'little')
+        dest_masks = {}
+        def step(mask: int, alph_id: int) -> int:
+            dest_mask = dest_masks.get((mask, alph_id))
+            if dest_mask is None:
+                dest_mask = 0
+                remaining = mask
+                while remaining:
+                    lowest = remaining & -remaining
+                    dest_mask |= successors[(lowest.bit_length() - 1) * alph_size + alph_id]
+                    remaining ^= lowest
+                dest_masks[(mask, alph_id)] = dest_mask
+            return dest_mask
+        return int.from_bytes(self.__in_flags, 'little'), step, lambda mask: bool(mask & out_mask)
+    def __distinguishing_word(self, other: 'Automata', inclusion: bool) -> str:
+        '''
+        Search, by BFS on the pairs of states of the complete DFA of both Automata, a shortest word recognized
+        by only one of them (inclusion False) or by this one and not by other (inclusion True)
+        For the equivalence, a pair is skipped if its states are already known to be equivalent to each other
+        (union-find on the states, as id * 2 for this Automata and id * 2 + 1 for other); the inclusion isn't symmetric:
+        a pair is only skipped if it has already been found
+        :return: the word, None if there is none
+        '''
+        letters = self.__joint_letters(other)[0]
+        start, step, is_out = self.__lazy_cdfa()
+        other_start, other_step, other_is_out = other.__lazy_cdfa()
+        parents = {}
+        def find(key: int) -> int:
+            parent = parents.get(key, key)
+            while parent != key:
+                grand_parent = parents.get(parent, parent)
+                parents[key] = grand_parent
+                key, parent = parent, grand_parent
+            return key
+        found = {(start, other_start)}
+        parents[start * 2] = other_start * 2 + 1
+        # the pairs in the order of the BFS, with the pair and the symbol they are reached from
+        pairs = [(start, other_start)]
+        origins = [(-1, None)]
+        pair_id = 0
+        while pair_id < len(pairs):
+            state_id, other_state_id = pairs[pair_id]
+            is_state_out, is_other_out = is_out(state_id), other_is_out(other_state_id)
+            if is_state_out != is_other_out and (is_state_out or not inclusion):
+                symbols = []
+                while origins[pair_id][0] != -1:
+                    pair_id, symbol = origins[pair_id]
+                    symbols.append(symbol)
+                return ''.join(reversed(symbols))
+            for symbol, alph_id, other_alph_id in letters:
+                dest = (step(state_id, alph_id), other_step(other_state_id, other_alph_id))
+                if inclusion:
+                    if dest in found:
+                        continue
+                    found.add(dest)
+                else:
+                    root, other_root = find(dest[0] * 2), find(dest[1] * 2 + 1)
+                    if root == other_root:
+                        continue
+                    parents[root] = other_root
+                pairs.append(dest)
+                origins.append((pair_id, symbol))
+            pair_id += 1
+        return None
+
+    def trim(self, mapping: bool = False):
+        '''
+        Method building the Automata without the states which are useless to recognize words: those which can't be
+        reached from an input state (forward BFS) or can't reach an output state (backward BFS), in linear time
+        The states kept are in the same order, with their labels
+        :param mapping: also return the new id of each state (-1 if it has been removed)
+        :return: Automata (not complete), or tuple (Automata, list of the new ids) if mapping
+        '''
+        nb_states = self.__nb_states
+        alph_size = self.__alph_size
+        offsets, targets = self._get_csr()
+        accessible = bytearray(nb_states)
+        queue = deque()
+        for state_id in self.__in_states:
+            accessible[state_id] = 1
+            queue.append(state_id)
+        while queue:
+            offset = queue.popleft() * alph_size
+            for dest_id in targets[offsets[offset]:offsets[offset + alph_size]]:
+                if 0 <= dest_id < nb_states and not accessible[dest_id]:
+                    accessible[dest_id] = 1
+                    queue.append(dest_id)
+        coaccessible = self.__coaccessible()
+        new_ids = [-1] * nb_states
+        kept = []
+        for state_id in range(nb_states):
+            if accessible[state_id] and coaccessible[state_id]:
+                new_ids[state_id] = len(kept)
+                kept.append(state_id)
+        state_ids = []
+        alph_ids = []
+        dest_ids = []
+        for new_id, state_id in enumerate(kept):
+            for alph_id in range(alph_size):
+                slot = state_id * alph_size + alph_id
+                for dest_id in targets[offsets[slot]:offsets[slot + 1]]:
+                    if 0 <= dest_id < nb_states and new_ids[dest_id] != -1:
+                        state_ids.append(new_id)
+                        alph_ids.append(alph_id)
+                        dest_ids.append(new_ids[dest_id])
+        new_automata = Automata(alph_size, len(kept), self.__symbol_ids)
+        new_automata._add_transitions(state_ids, alph_ids, dest_ids)
+        for new_id, state_id in enumerate(kept):
+            if self._is_in(state_id):
+                new_automata._set_in(new_id, True)
+            if self._is_out(state_id):
+                new_automata._set_out(new_id, True)
+        new_automata.__labels = [self.__labels[state_id] for state_id in kept]
+        return (new_automata, new_ids) if mapping else new_automata
+
+    def iter_words(self, max_len: int = None):
+        '''
+        Generator of the words recognized by the Automata in shortlex order (by length, then in the order of the alphabet),
+        walking its complete DFA breadth-first: the states from which no output state can be reached are skipped,
+        so no time is spent on the words which can't be completed
+        :param max_len: maximum length of the words (no limit if None: the generator ends only if there are finitely many words)
+        '''
+        A = self.__cdfa()
+        coaccessible = A.__coaccessible()
+        initial = next(iter(A.__in_states))
+        if not coaccessible[initial]:
+            return
+        table = A.__table
+        alph_size = A.__alph_size
+        letters = list(A.__symbol_ids.items())
+        # the words of the current length with their state, in shortlex order: the words of the next length are
+        # built in the same order while the current ones are given
+        words = [('', initial)]
+        length = 0
+        while words:
+            last_length = length == max_len
+            next_words = []
+            for word, state_id in words:
+                if A._is_out(state_id):
+                    yield word
+                if last_length:
+                    continue
+                offset = state_id * alph_size
+                for symbol, alph_id in letters:
+                    dest_id = table[offset + alph_id]
+                    if coaccessible[dest_id]:
+                        next_words.append((word + symbol, dest_id))
+            words = next_words
+            length += 1
+    def __coaccessible(self) -> bytearray:
+        '''Flags of the states from which an output state can be reached (backward BFS from the output states)'''
+        nb_states = self.__nb_states
+        coaccessible = bytearray(nb_states)
+        queue = deque()
+        for state_id in range(nb_states):
+            if self._is_out(state_id):
+                coaccessible[state_id] = 1
+                queue.append(state_id)
+        predecessors = self._get_predecessors()
+        while queue:
+            state_id = queue.popleft()
+            for offsets, sources in predecessors:
+                for source_id in sources[offsets[state_id]:offsets[state_id + 1]]:
+                    if not coaccessible[source_id]:
+                        coaccessible[source_id] = 1
+                        queue.append(source_id)
+        return coaccessible
+    def count_accepted(self, max_len: int, length_only: bool = False):
+        '''
+        Method counting the words of each length recognized by the Automata, exactly (Python int, whatever their size):
+        on its complete DFA, the number of words of length n+1 reaching each state is computed from the ones of length n
+        (a vectorized step per letter with NumPy if it is installed)
+        :param max_len: maximum length of the words
+        :param length_only: count only the words of length max_len, with powers of the transition matrix if it is faster
+        :return: list of the numbers of words of length 0 to max_len, or int if length_only
+        '''
+        if max_len < 0:
+            raise ValueError('The length of the words should be positive')
+        A = self.__cdfa()
+        nb_states = A.__nb_states
+        alph_size = A.__alph_size
+        # a column of the transitions counts for all its symbols (see compress_alphabet)
+        weights = [len(symbols) for symbols in A.get_symbol_classes()]
+        initial = next(iter(A.__in_states))
+        out_states = [state_id for state_id in range(nb_states) if A._is_out(state_id)]
+        # cost of the matrix power: a product of matrices (nb_states ** 3) per bit of the length; cost of the steps
+        # by length: with NumPy about alph_size vectorized calls per length, otherwise nb_states * alph_size additions
+        matrix_cost = nb_states ** 3 * max_len.bit_length()
+        steps_cost = alph_size * max_len if np is not None else nb_states * alph_size * max_len
+        if length_only and matrix_cost < steps_cost:
+            return A.__count_by_matrix_power(max_len, weights, initial, out_states)
+        nb_symbols = sum(weights)
+        counts = []
+        table = A.__table
+        if np is not None:
+            table = np.frombuffer(table, dtype=np.int32).reshape(nb_states, alph_size)
+            out_states = np.array(out_states, dtype=np.int64)
+            vector = np.zeros(nb_states, dtype=np.int64)
+            vector[initial] = 1
+            for length in range(max_len + 1):
+                counts.append(int(vector[out_states].sum()))
+                if length == max_len:
+                    break
+                if vector.dtype != object and nb_symbols ** (length + 1) >= INT64_BOUND:
+                    vector = vector.astype(object)
+                new_vector = np.zeros(nb_states, dtype=vector.dtype)
+                for alph_id in range(alph_size):
+                    np.add.at(new_vector, table[:, alph_id], vector * weights[alph_id])
+                vector = new_vector
+        else:
+            vector = [0] * nb_states
+            vector[initial] = 1
+            for length in range(max_len + 1):
+                counts.append(sum(vector[state_id] for state_id in out_states))
+                if length == max_len:
+                    break
+                new_vector = [0] * nb_states
+                for state_id in range(nb_states):
+                    if vector[state_id]:
+                        offset = state_id * alph_size
+                        for alph_id in range(alph_size):
+                            new_vector[table[offset + alph_id]] += vector[state_id] * weights[alph_id]
+                vector = new_vector
+        return counts[-1] if length_only else counts
+    def __count_by_matrix_power(self, length: int, weights: list, initial: int, out_states: list) -> int:
+        '''
+        Number of words of the given length recognized by this complete DFA: (line of the input state of M ** length)
+        summed on the output states, M being the matrix of the numbers of symbols going from a state to another
+        (the power is computed by squaring, on the line vector)
+        '''
+        nb_states = self.__nb_states
+        alph_size = self.__alph_size
+        if np is not None:
+            dtype = np.int64 if sum(weights) ** length < INT64_BOUND else object
+            matrix = np.zeros((nb_states, nb_states), dtype=dtype)
+            for state_id in range(nb_states):
+                for alph_id in range(alph_size):
+                    matrix[state_id, self.__table[state_id * alph_size + alph_id]] += weights[alph_id]
+            vector = np.zeros(nb_states, dtype=dtype)
+            vector[initial] = 1
+            while length:
+                if length & 1:
+                    vector = vector @ matrix
+                length >>= 1
+                if length:
+                    matrix = matrix @ matrix
+            return int(vector[out_states].sum())
+        matrix = [[0] * nb_states for _ in range(nb_states)]
+        for state_id in range(nb_states):
+            for alph_id in range(alph_size):
+                matrix[state_id][self.__table[state_id * alph_size + alph_id]] += weights[alph_id]
+        vector = [0] * nb_states
+        vector[initial] = 1
+        while length:
+            if length & 1:
+                vector = [sum(vector[k] * matrix[k][j] for k in range(nb_states)) for j in range(nb_states)]
+            length >>= 1
+            if length:
+                columns = list(zip(*matrix))
+                matrix = [[sum(a * b for a, b in zip(line, column)) for column in columns] for line in matrix]
+        return sum(vector[state_id] for state_id in out_states)
+
+    def copy(self) -> 'Automata':
+        '''
+        Method to copy an Automata instance
+        returns: Automata instance, a copy of this one
+        '''
+        new_automata = Automata(self.get_alph_size(), 0, self.__symbol_ids)
+        new_automata.__nb_states = self.__nb_states
+        # a mapped table is read-only: it is shared until one of the Automata is modified
+        new_automata.__table = array('i', self.__table) if isinstance(self.__table, array) else self.__table
+        new_automata.__multi_dests = {slot: dests.copy() for slot, dests in self.__multi_dests.items()}
+        new_automata.__in_flags = bytearray(self.__in_flags)
+        new_automata.__out_flags = bytearray(self.__out_flags)
+        new_automata.__labels = list(self.__labels)
+        new_automata.__in_states = set(self.__in_states)
+        new_automata.__nb_out_states = self.__nb_out_states
+        new_automata.__in_degrees = None if self.__in_degrees is None else array('i', self.__in_degrees)
+        new_automata.__out_of_range = dict(self.__out_of_range)
+        new_automata.__nb_empty = self.__nb_empty
+        new_automata.__nb_multi = self.__nb_multi
+        new_automata.__is_deter = self.__is_deter
+        new_automata.__is_complete = self.__is_complete
+        new_automata.__is_standard = self.__is_standard
+        new_automata.__is_valid = self.__is_valid
+        return new_automata
+
+    def compress_alphabet(self) -> 'Automata':
+        '''
+        Method merging the symbols which have the same transitions in all the states into one column (class of symbols)
+        The Automata obtained recognizes the same words with fewer columns: get_alph_size() is the number of classes
+        and get_symbol_classes() gives their symbols. Its determinization, minimization and compilation work on the classes.
+        :return: Automata, a copy if no symbols can be merged
+        '''
+        compressed = self.__compressed()
+        return self.copy() if compressed is self else compressed
+    def __column_classes(self) -> tuple:
+        '''
+        Method grouping the columns of the transitions which are the same for all the states
+        :return tuple: (class of each column, first column of each class)
+        '''
+        alph_size = self.__alph_size
+        multi_of_column = [[] for _ in range(alph_size)]
+        for slot in sorted(self.__multi_dests):
+            state_id, alph_id = divmod(slot, alph_size)
+            multi_of_column[alph_id].append((state_id, tuple(sorted(self.__multi_dests[slot]))))
+        classes = {}
+        class_of_column = []
+        representatives = []
+        for alph_id in range(alph_size):
+            signature = (self.__table[alph_id::alph_size].tobytes(), tuple(multi_of_column[alph_id]))
+            if signature not in classes:
+                classes[signature] = len(representatives)
+                representatives.append(alph_id)
+            class_of_column.append(classes[signature])
+        return class_of_column, representatives
+    def __compressed(self) -> 'Automata':
+        '''Return the Automata with a column per class of symbols (see compress_alphabet), itself if there is nothing to merge'''
+        class_of_column, representatives = self.__column_classes()
+        if len(representatives) == self.__alph_size:
+            return self
+        return self._map_columns(representatives, {symbol: class_of_column[alph_id] for symbol, alph_id in self.__symbol_ids.items()})
+    def _map_columns(self, column_ids: list, alphabet: dict) -> 'Automata':
+        '''
+        Return the Automata whose column j of the transitions is the column column_ids[j] of this one, with a new alphabet
+        (see __init__), used to merge the columns of the classes of symbols and to get back the column of each symbol
+        '''
+        alph_size = self.__alph_size
+        new_alph_size = len(column_ids)
+        new_table = array('i', [NO_DEST]) * (self.__nb_states * new_alph_size)
+        new_columns_of = [[] for _ in range(alph_size)]
+        for new_alph_id, alph_id in enumerate(column_ids):
+            column = self.__table[alph_id::alph_size]
+            new_table[new_alph_id::new_alph_size] = column if isinstance(column, array) else array('i', column)
+            new_columns_of[alph_id].append(new_alph_id)
+        new_automata = Automata._from_table(new_alph_size, new_table, [], [], list(self.__labels), alphabet)
+        for slot, dests in self.__multi_dests.items():
+            state_id, alph_id = divmod(slot, alph_size)
+            for new_alph_id in new_columns_of[alph_id]:
+                new_automata.__multi_dests[state_id * new_alph_size + new_alph_id] = set(dests)
+        new_automata.__in_flags = bytearray(self.__in_flags)
+        new_automata.__out_flags = bytearray(self.__out_flags)
+        new_automata.__count_flags()
+        # the properties don't depend on the columns
+        new_automata.__is_deter = self.__is_deter
+        new_automata.__is_complete = self.__is_complete
+        new_automata.__is_standard = self.__is_standard
+        new_automata.__is_valid = self.__is_valid
+        return new_automata
+
+    @classmethod
+    def _from_table(cls, alph_size: int, table: array, in_states: list, out_states: list, labels: list,
+                    alphabet=None) -> 'Automata':
+        '''
+        Function to create an Automata directly from its storage (used by the algorithms building deterministic Automata)
+        :param table: transition table (see __init__), given to the Automata (not copied)
+        :param labels: label of each state (None if no label)
+        :param alphabet: see __init__
+        '''
+        nb_states = len(labels)
+        new_automata = cls(alph_size, 0, alphabet)
+        new_automata.__nb_states = nb_states
+        new_automata.__table = table
+        new_automata.__in_flags = bytearray((nb_states + 7) // 8)
+        new_automata.__out_flags = bytearray((nb_states + 7) // 8)
+        new_automata.__labels = labels
+        new_automata.__in_degrees = None
+        for state_id in in_states:
+            new_automata._set_in(state_id, True)
+        for state_id in out_states:
+            new_automata._set_out(state_id, True)
+        return new_automata
+
+    def __str__(self) -> str:
+        '''
+                Method to display the state with print()
+                '''
+        ch = 'Displaying Automata \n'
+        ch += '     \t' + '\t'.join(self.__column_name(alph_id) for alph_id in range(self.__alph_size)) + '\n'
+        # Here we could have directly print the states, but we want to show the labels in the transitions
+        for state_id in range(self.get_nb_states()):
+            ch += str(self.get_state(state_id)) + '\n'
+        return ch
+
+
+    # The overwrited functions and additional init
+    @classmethod
+    def from_file(cls, path: str) -> 'Automata':
+        '''
+        Function to create the Automata associated to a text file
+        (the file is mapped in memory and the transitions are read at once with a regular expression)
+        :raise ValueError: if the file is malformed (the number of the line is given)
+        '''
+        start = time.perf_counter()
+        try:
+            with open(path, 'rb') as file:
+                nb_bytes = os.fstat(file.fileno()).st_size
+                if nb_bytes == 0:
+                    raise ValueError('Line 1: the file is empty')
+                with memory_map(file.fileno(), 0, access=ACCESS_READ) as content:
+                    # reading the nb of symbols and states, the input and output states and the nb of transitions
+                    header = [content.readline() for _ in range(HEADER_NB_LINES)]
+                    nb_symbols = _parse_header_int(header, 0)
+                    nb_states = _parse_header_int(header, 1)
+                    A = cls(nb_symbols, nb_states)
+                    for line_id, set_state in ((2, A._set_in), (3, A._set_out)):
+                        for state_id in _parse_header_states(header, line_id, nb_states):
+                            set_state(state_id, True)
+                    nb_transitions = _parse_header_int(header, 4)
+                    header_end = time.perf_counter()
+
+                    # adding all the destinations, the transitions are the first nb_transitions words after the header
+                    body_start = content.tell()
+                    body = content[body_start:]
+                    words = body.split()
+                    if len(words) > nb_transitions:
+                        body = b' '.join(words[:nb_transitions])
+                    if len(words) < nb_transitions or len(TRANSITION_PATTERN.findall(body)) != nb_transitions:
+                        _raise_malformed_transition(content, body_start, nb_transitions, nb_states)
+                    # all well formed: the letters give the letter ids, the numbers alternate source and destination
+                    alph_ids = body.translate(LETTER_ID_BYTES, DIGITS_AND_SPACES)
+                    state_ids = list(map(int, body.translate(LETTERS_TO_SPACES).split()))
+                    try:
+                        A._add_transitions(state_ids[0::2], alph_ids, state_ids[1::2])
+                    except IndexError:
+                        _raise_malformed_transition(content, body_start, nb_transitions, nb_states)
+
+                transitions_end = time.perf_counter()
+                # ensuring that destinations exist
+                validity = A.is_valid()
+                if not validity:
+                    trace('invalid_automata', path=path)
+                end = time.perf_counter()
+                A.__record_stats('parsing', {
+                    'bytes': nb_bytes,
+                    'states': nb_states,
+                    'transitions': nb_transitions,
+                    'header_seconds': header_end - start,
+                    'transitions_seconds': transitions_end - header_end,
+                    'validation_seconds': end - transitions_end,
+                    'seconds': end - start,
+                })
+                return A
+
+        except FileNotFoundError:
+            raise FileNotFoundError("The file does not exist.")
+        except IOError:
+            raise IOError("An error occurred while reading the file.")
+        
+    # Other methods
+    def to_file(self, path:str):
+        '''
+        Method to write the automata in a file text
+        :raise ValueError: if the symbols aren't the first letters a, b... (the other alphabets need save_binary)
+        '''
+        symbol_classes = self.get_symbol_classes()
+        if sorted(self.__symbol_ids) != ALPH[:len(self.__symbol_ids)]:
+            raise ValueError('The text files only handle the letters a, b..., save the Automata with save_binary')
+        with open(path, 'w') as file:
+            file.write(str(len(self.__symbol_ids)) + '\n')
+            file.write(str(self.get_nb_states()) + '\n')
+            # writing input states
+            ch = str(self.get_nb_in_states()) + ' '
+            ch += ' '.join([str(i) for i in range(self.get_nb_states()) if self._is_in(i)])
+            file.write(ch + '\n')
+            # writing output states
+            ch = str(self.get_nb_out_states()) + ' '
+            ch += ' '.join([str(i) for i in range(self.get_nb_states()) if self._is_out(i)])
+            file.write(ch + '\n')
+            
+            transistions = [str(num_state) + letter + str(destination)
+                            for num_state in range(self.get_nb_states())
+                                for num_char in range(self.get_alph_size())
+                                    for destination in self._get_dests(num_state, num_char)
+                                        for letter in symbol_classes[num_char]]
+            
+            file.write(str(len(transistions))+'\n')
+            file.write('\n'.join(transistions))
+
+    def save_binary(self, path: str):
+        '''
+        Method to write the automata in a binary file, which can be loaded (and mapped in memory) without parsing
+        (see load_binary, the format is described with BINARY_HEADER)
+        '''
+        multi_slots = sorted(self.__multi_dests)
+        multi_offsets = array('i', [0])
+        multi_targets = array('i')
+        for slot in multi_slots:
+            multi_targets.extend(sorted(self.__multi_dests[slot]))
+            multi_offsets.append(len(multi_targets))
+        labels = b''
+        if any(label is not None for label in self.__labels):
+            labels = json.dumps(self.__labels).encode()
+        alphabet = b''
+        if self.__symbol_ids != {letter: alph_id for alph_id, letter in enumerate(ALPH[:self.__alph_size])}:
+            alphabet = json.dumps(list(self.__symbol_ids.items())).encode()
+        flags = ((FLAG_DETERMINISTIC if self.__is_deter else 0) | (FLAG_COMPLETE if self.__is_complete else 0)
+                 | (FLAG_STANDARD if self.__is_standard else 0) | (FLAG_VALID if self.__is_valid else 0))
+        header = BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, flags, self.__alph_size, self.__nb_states,
+                                    len(multi_slots), len(multi_targets), len(labels), len(alphabet))
+        # written in a new file renamed at the end: an Automata mapping the previous file (load_binary) still reads it
+        tmp_path = str(path) + '.' + str(os.getpid()) + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as file:
+                file.write(header)
+                file.write(_to_little_endian(self.__table))
+                file.write(self.__in_flags)
+                file.write(self.__out_flags)
+                file.write(bytes(-2 * len(self.__in_flags) % 4))
+                for int_array in (array('i', multi_slots), multi_offsets, multi_targets):
+                    file.write(_to_little_endian(int_array))
+                file.write(labels)
+                file.write(alphabet)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def load_binary(cls, path: str, mmap: bool = True) -> 'Automata':
+        '''
+        Function to create the Automata saved in a binary file (see save_binary)
+        :param mmap: if True, the transition table isn't read but mapped in memory: loading is immediate, the pages
+            are shared with the other processes mapping the same file, and the compiled matcher uses it without copy.
+            The table is copied in memory at the first modification of the Automata.
+        :raise ValueError: if the file isn't a binary automata file or is truncated
+        '''
+        with open(path, 'rb') as file:
+            header = file.read(BINARY_HEADER.size)
+            if len(header) < BINARY_HEADER.size or header[:len(BINARY_MAGIC)] != BINARY_MAGIC:
+                raise ValueError('The file ' + str(path) + ' isn\'t a binary automata file')
+            (_, version, flags, alph_size, nb_states,
+             nb_multi_slots, nb_multi_targets, labels_size, alphabet_size) = BINARY_HEADER.unpack(header)
+            if version > BINARY_VERSION:
+                raise ValueError('The binary automata file has the version ' + str(version)
+                                 + ', only the version ' + str(BINARY_VERSION) + ' is supported')
+            flags_size = (nb_states + 7) // 8
+            table_end = BINARY_HEADER.size + 4 * alph_size * nb_states
+            multi_start = table_end + 2 * flags_size + (-2 * flags_size % 4)
+            labels_start = multi_start + 4 * (2 * nb_multi_slots + 1 + nb_multi_targets)
+            if os.fstat(file.fileno()).st_size < labels_start + labels_size + alphabet_size:
+                raise ValueError('The binary automata file ' + str(path) + ' is truncated')
+            if mmap and table_end > BINARY_HEADER.size:
+                content = memoryview(memory_map(file.fileno(), 0, access=ACCESS_READ))
+            else:
+                file.seek(0)
+                content = memoryview(file.read())
+
+        alphabet = None
+        if alphabet_size:
+            alphabet_start = labels_start + labels_size
+            alphabet = dict(json.loads(bytes(content[alphabet_start:alphabet_start + alphabet_size])))
+        A = cls(alph_size, 0, alphabet)
+        A.__nb_states = nb_states
+        if mmap and sys.byteorder == 'little' and table_end > BINARY_HEADER.size:
+            A.__table = content[BINARY_HEADER.size:table_end].cast('i')
+        else:
+            A.__table = _from_little_endian(content[BINARY_HEADER.size:table_end])
+        A.__in_flags = bytearray(content[table_end:table_end + flags_size])
+        A.__out_flags = bytearray(content[table_end + flags_size:table_end + 2 * flags_size])
+        multi = _from_little_endian(content[multi_start:labels_start])
+        multi_slots = multi[:nb_multi_slots]
+        multi_offsets = multi[nb_multi_slots:2 * nb_multi_slots + 1]
+        multi_targets = multi[2 * nb_multi_slots + 1:]
+        A.__multi_dests = {slot: set(multi_targets[multi_offsets[slot_id]:multi_offsets[slot_id + 1]])
+                           for slot_id, slot in enumerate(multi_slots)}
+        A.__count_flags()
+        A.__in_degrees = None
+        if labels_size:
+            A.__labels = json.loads(bytes(content[labels_start:labels_start + labels_size]))
+        else:
+            A.__labels = [None] * nb_states
+        A.__is_deter = bool(flags & FLAG_DETERMINISTIC)
+        A.__is_complete = bool(flags & FLAG_COMPLETE)
+        A.__is_standard = bool(flags & FLAG_STANDARD)
+        A.__is_valid = bool(flags & FLAG_VALID)
+        return A
+
+
+if __name__ == '__main__':
+    # python -m automata batch ...: the batch module imports this file again as the module automata
+    if sys.argv[1:2] == ['batch']:
+        from batch import main
+        sys.exit(main(sys.argv[2:]))
+    if sys.argv[1:2] == ['check']:
+        from batch import check_main
+        sys.exit(check_main(sys.argv[2:]))
+    print('Usage: python -m automata batch DIRECTORY [--ops determinize,minimize] [--output DIR] [--summary FILE]\n'
+          '       python -m automata check DIRECTORY [--max-len 4] [--max-words 10000]')
+    sys.exit(2)
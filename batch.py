@@ -0,0 +1,255 @@
+import argparse
+import csv
+import itertools
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from automata import Automata, DeterminizationLimitError, OperationCancelled, CDFA, watching
+from cache import automata_properties
+
+# The operations of a batch, applied one after the other: each one gets the result of the previous one
+# and the time left for the file (only the determinization can take an exponential time, it is given this timeout;
+# the minimizations are stopped by process_file at the deadline of the file)
+OPERATIONS = {
+    'determinize': lambda A, timeout: A.determinize_complete(timeout=timeout),
+    'minimize': lambda A, timeout: _to_cdfa(A, timeout).minimization(),
+    'complement': lambda A, timeout: _to_cdfa(A, timeout).complementary_automata(),
+    'standardize': lambda A, timeout: _standardized(A),
+    'trim': lambda A, timeout: A.trim(),
+}
+DEFAULT_TIMEOUT = 60.0
+# The batch forms of the recognition, which should give the results of Automata.recognize_word (see check_file)
+RECOGNITIONS = {
+    'recognize_many': lambda A, words: A.recognize_many(words),
+    'compile': lambda A, words: _recognize_compiled(A, words),
+}
+DEFAULT_CHECK_LENGTH = 4
+DEFAULT_CHECK_WORDS = 10000
+SUMMARY_FORMATS = ('json', 'csv')
+
+
+def _to_cdfa(A: Automata, timeout: float) -> Automata:
+    '''Function giving the Automata if it is a complete DFA, otherwise its determinized one (within the timeout)'''
+    return A if A.is_complete_DFA(True) == CDFA else A.determinize_complete(timeout=timeout)
+
+
+def _standardized(A: Automata) -> Automata:
+    '''Function giving a standardized copy of the Automata'''
+    A = A.copy()
+    A.standardize()
+    return A
+
+
+def process_file(path: str, operations: list, timeout: float = DEFAULT_TIMEOUT, output_dir: str = None) -> dict:
+    '''
+    Function reading the Automata of a text file and applying the operations to it (see OPERATIONS), in a worker process
+    The messages of the algorithms go to the logger 'automata' as events (see tracer.py), nothing is printed
+    The results are written in output_dir, if given, as <name of the file>_<operation>.txt
+    :param timeout: maximum time for the file, in seconds: the determinizations and minimizations are stopped
+        when it is over (see automata.watching), the other steps are linear and are checked between the operations
+    :return dict: the summary of the file: status ('ok', 'timeout' or 'error'), properties of the Automata read,
+        number of states and time of each operation
+    '''
+    summary = {'file': os.path.basename(path), 'status': 'ok', 'error': None}
+    start = time.perf_counter()
+    deadline = start + timeout
+    def check_deadline(operation: str, counters: dict):
+        if time.perf_counter() > deadline:
+            raise OperationCancelled('The ' + operation + ' was stopped, the file took more than ' + str(timeout) + ' seconds')
+    try:
+        with watching(check_deadline):
+            _process_operations(summary, path, operations, timeout, output_dir, start)
+    except (DeterminizationLimitError, OperationCancelled) as e:
+        summary['status'] = 'timeout'
+        summary['error'] = str(e)
+    except Exception as e:
+        summary['status'] = 'error'
+        summary['error'] = type(e).__name__ + ': ' + str(e)
+    summary['seconds'] = time.perf_counter() - start
+    return summary
+
+
+def _process_operations(summary: dict, path: str, operations: list, timeout: float, output_dir: str, start: float):
+    '''Function doing the work of process_file from its start time, its results are added to the summary as they come'''
+    A = Automata.from_file(path)
+    summary['parse_seconds'] = time.perf_counter() - start
+    summary.update(automata_properties(A))
+    for operation in operations:
+        remaining = timeout - (time.perf_counter() - start)
+        if remaining <= 0:
+            raise DeterminizationLimitError('The file took more than ' + str(timeout) + ' seconds')
+        operation_start = time.perf_counter()
+        A = OPERATIONS[operation](A, remaining)
+        if A is None:
+            raise ValueError('The operation ' + operation + ' failed')
+        summary[operation + '_states'] = A.get_nb_states()
+        summary[operation + '_seconds'] = time.perf_counter() - operation_start
+        if output_dir is not None:
+            name = os.path.splitext(os.path.basename(path))[0] + '_' + operation + '.txt'
+            A.to_file(os.path.join(output_dir, name))
+
+
+def _process_file(arguments: tuple) -> dict:
+    '''process_file with its arguments in a tuple, for ProcessPoolExecutor.map'''
+    return process_file(*arguments)
+
+
+def run_batch(paths: list, operations: list, timeout: float = DEFAULT_TIMEOUT, output_dir: str = None,
+              jobs: int = None, chunk_size: int = None) -> list:
+    '''
+    Function processing the files in parallel (see process_file) with a pool of jobs processes (one per core by default)
+    The files are given to the processes by chunks of chunk_size (by default about 4 chunks per process)
+    :return list: the summaries of the files, in the order of paths
+    '''
+    unknown = [operation for operation in operations if operation not in OPERATIONS]
+    if unknown:
+        raise ValueError('Unknown operation ' + ', '.join(unknown) + ', expected some of ' + ', '.join(OPERATIONS))
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+    jobs = jobs or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, len(paths) // (jobs * 4))
+    arguments = [(path, operations, timeout, output_dir) for path in paths]
+    if jobs == 1:
+        return [_process_file(file_arguments) for file_arguments in arguments]
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(_process_file, arguments, chunksize=chunk_size))
+
+
+def write_summary(summaries: list, file, summary_format: str = 'json'):
+    '''Function writing the summaries of the files (see run_batch) in an open text file, as JSON or CSV (one line per file)'''
+    if summary_format == 'json':
+        json.dump(summaries, file, indent=2)
+        file.write('\n')
+    elif summary_format == 'csv':
+        # the columns of all the files, in the order they appear
+        columns = list(dict.fromkeys(column for summary in summaries for column in summary))
+        writer = csv.DictWriter(file, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(summaries)
+    else:
+        raise ValueError('The format of the summary should be one of ' + ', '.join(SUMMARY_FORMATS))
+
+
+def list_files(directory: str) -> list:
+    '''Function giving the text files of a directory, sorted by name (automata_2.txt before automata_10.txt)'''
+    names = [name for name in os.listdir(directory) if name.endswith('.txt')]
+    names.sort(key=lambda name: [int(part) if part.isdigit() else part for part in re.split(r'(\d+)', name)])
+    return [os.path.join(directory, name) for name in names]
+
+
+def _recognize_compiled(A: Automata, words: list) -> list:
+    '''Function recognizing the words one by one with the matcher of the Automata (see Automata.compile)'''
+    matcher = A.compile()
+    return [matcher.recognize_word(word) for word in words]
+
+
+def check_words(A: Automata, max_len: int = DEFAULT_CHECK_LENGTH, max_words: int = DEFAULT_CHECK_WORDS) -> list:
+    '''
+    Function giving the words checked on an Automata: all the words up to max_len (at most max_words, shortest first)
+    of its alphabet and of a symbol which isn't in it
+    '''
+    alphabet = A.get_alphabet()
+    invalid = next(symbol for symbol in '#?!' + ''.join(map(chr, range(0x100, 0x200))) if symbol not in alphabet)
+    words = (''.join(letters) for length in range(max_len + 1)
+             for letters in itertools.product(alphabet + [invalid], repeat=length))
+    return list(itertools.islice(words, max_words))
+
+
+def check_file(path: str, max_len: int = DEFAULT_CHECK_LENGTH, max_words: int = DEFAULT_CHECK_WORDS) -> dict:
+    '''
+    Function checking that the batch forms of the recognition (see RECOGNITIONS) give the results of recognize_word
+    on the words of check_words, for the Automata of a text file
+    :return dict: the summary of the file: status ('ok', 'mismatch' or 'error'), number of words,
+        and for each recognition which differs the first words where it does
+    '''
+    summary = {'file': os.path.basename(path), 'status': 'ok', 'error': None, 'words': 0, 'mismatches': {}}
+    try:
+        A = Automata.from_file(path)
+        words = check_words(A, max_len, max_words)
+        summary['words'] = len(words)
+        expected = [A.recognize_word(word) for word in words]
+        for name, recognize in RECOGNITIONS.items():
+            results = [bool(result) for result in recognize(A, words)]
+            differences = [word for word, result, expected_result in zip(words, results, expected) if result != expected_result]
+            if differences:
+                summary['status'] = 'mismatch'
+                summary['mismatches'][name] = differences[:10]
+    except Exception as e:
+        summary['status'] = 'error'
+        summary['error'] = type(e).__name__ + ': ' + str(e)
+    return summary
+
+
+def check_main(arguments: list = None) -> int:
+    '''
+    Command line: python -m automata check Automata_txt/ [--max-len 4] [--max-words 10000]
+    :return int: exit code, 1 if a recognition differs from recognize_word on a file (the files not read are reported)
+    '''
+    parser = argparse.ArgumentParser(prog='python -m automata check',
+                                     description='Check that the batch recognitions agree with recognize_word '
+                                                 'on all the automata of a directory')
+    parser.add_argument('directory', help='directory of the text files of the automata')
+    parser.add_argument('--max-len', type=int, default=DEFAULT_CHECK_LENGTH, help='length of the longest words checked')
+    parser.add_argument('--max-words', type=int, default=DEFAULT_CHECK_WORDS, help='maximum number of words per file')
+    options = parser.parse_args(arguments)
+
+    try:
+        paths = list_files(options.directory)
+    except OSError as e:
+        print('Error: ' + str(e), file=sys.stderr)
+        return 2
+    nb_mismatches = 0
+    for path in paths:
+        summary = check_file(path, options.max_len, options.max_words)
+        if summary['status'] == 'mismatch':
+            nb_mismatches += 1
+            for name, words in summary['mismatches'].items():
+                print(summary['file'] + ': ' + name + ' differs from recognize_word on ' + ', '.join(map(repr, words)))
+        elif summary['status'] == 'error':
+            print(summary['file'] + ': not checked, ' + summary['error'])
+    print(str(len(paths)) + ' files, ' + str(nb_mismatches) + ' with differences', file=sys.stderr)
+    return 1 if nb_mismatches else 0
+
+
+def main(arguments: list = None) -> int:
+    '''
+    Command line: python -m automata batch Automata_txt/ --ops determinize,minimize [--output DIR] [--summary FILE]
+    :return int: exit code, 1 if a file failed or timed out
+    '''
+    parser = argparse.ArgumentParser(prog='python -m automata batch',
+                                     description='Apply operations to all the automata of a directory, in parallel')
+    parser.add_argument('directory', help='directory of the text files of the automata')
+    parser.add_argument('--ops', default='determinize,minimize',
+                        help='operations applied one after the other, separated by commas, among ' + ', '.join(OPERATIONS))
+    parser.add_argument('--output', default=None, help='directory where the results are written (not written by default)')
+    parser.add_argument('--summary', default=None, help='file of the summary (standard output by default)')
+    parser.add_argument('--format', default=None, choices=SUMMARY_FORMATS,
+                        help='format of the summary (by default from the extension of --summary, else json)')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help='maximum time per file, in seconds (the determinizations and minimizations are stopped at it, '
+                             'the reading and the linear steps are checked between the operations)')
+    parser.add_argument('--jobs', type=int, default=None, help='number of processes (one per core by default)')
+    parser.add_argument('--chunk-size', type=int, default=None, help='number of files given at once to a process')
+    options = parser.parse_args(arguments)
+
+    operations = [operation.strip() for operation in options.ops.split(',') if operation.strip()]
+    summary_format = options.format
+    if summary_format is None:
+        summary_format = 'csv' if options.summary is not None and options.summary.endswith('.csv') else 'json'
+    try:
+        summaries = run_batch(list_files(options.directory), operations, options.timeout, options.output,
+                              options.jobs, options.chunk_size)
+    except (OSError, ValueError) as e:
+        print('Error: ' + str(e), file=sys.stderr)
+        return 2
+    if options.summary is None:
+        write_summary(summaries, sys.stdout, summary_format)
+    else:
+        with open(options.summary, 'w', newline='') as file:
+            write_summary(summaries, file, summary_format)
+    nb_failed = sum(summary['status'] != 'ok' for summary in summaries)
+    print(str(len(summaries) - nb_failed) + ' files processed, ' + str(nb_failed) + ' failed or timed out', file=sys.stderr)
+    return 1 if nb_failed else 0
@@ -0,0 +1,8 @@
+'''
+Benchmarks of the Automata library: seeded generators of automata (generators.py), runners measuring the time
+and the peak memory of the main operations on inputs of growing size (runners.py), and their comparison.
+    python -m benchmarks run --output results.json
+    python -m benchmarks compare old_results.json results.json
+'''
+from benchmarks.generators import random_nfa, random_dfa, nth_letter_from_end, chain_dfa, cycle_dfa
+from benchmarks.runners import BENCHMARKS, run_benchmarks, compare_results
@@ -0,0 +1,61 @@
+import argparse
+import json
+import sys
+from benchmarks.runners import BENCHMARKS, DEFAULT_REPEAT, run_benchmarks, compare_results
+
+
+def main(arguments: list = None) -> int:
+    '''
+    Command line:
+        python -m benchmarks run [--only name,name] [--max-size N] [--repeat N] [--output results.json]
+        python -m benchmarks compare old_results.json new_results.json [--threshold 0.1]
+    :return int: exit code, 1 if compare finds a slower benchmark
+    '''
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Benchmarks of the Automata library')
+    commands = parser.add_subparsers(dest='command', required=True)
+    run = commands.add_parser('run', help='run the benchmarks, the results are written in JSON')
+    run.add_argument('--only', default=None, help='benchmarks to run, separated by commas, among ' + ', '.join(BENCHMARKS))
+    run.add_argument('--max-size', type=int, default=None, help='skip the inputs bigger than this size')
+    run.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='number of timed runs (the best one is kept)')
+    run.add_argument('--output', default=None, help='JSON file of the results (standard output by default)')
+    compare = commands.add_parser('compare', help='compare two JSON files of results')
+    compare.add_argument('old')
+    compare.add_argument('new')
+    compare.add_argument('--threshold', type=float, default=0.1, help='relative change of time considered significant')
+    options = parser.parse_args(arguments)
+
+    if options.command == 'run':
+        names = None if options.only is None else [name.strip() for name in options.only.split(',')]
+        try:
+            results = run_benchmarks(names, options.repeat, options.max_size, progress=_print_result)
+        except ValueError as e:
+            print('Error: ' + str(e), file=sys.stderr)
+            return 2
+        if options.output is None:
+            json.dump(results, sys.stdout, indent=2)
+            sys.stdout.write('\n')
+        else:
+            with open(options.output, 'w') as file:
+                json.dump(results, file, indent=2)
+        return 0
+
+    with open(options.old) as file:
+        old = json.load(file)
+    with open(options.new) as file:
+        new = json.load(file)
+    comparison = compare_results(old, new, options.threshold)
+    for result in comparison:
+        print('{:<36} {:>8} {:>10.4f}s -> {:>10.4f}s  x{:<6.2f} {:>12} -> {:>12} bytes  {}'.format(
+            result['benchmark'], result['size'], result['old_seconds'], result['new_seconds'], result['ratio'],
+            result['old_peak_bytes'], result['new_peak_bytes'], result['change']))
+    return 1 if any(result['change'] == 'slower' for result in comparison) else 0
+
+
+def _print_result(result: dict):
+    '''Function displaying a result while the benchmarks run (on the error output, the standard one may be the JSON)'''
+    print('{:<36} {:>8} {:>10.4f}s {:>12} bytes'.format(result['benchmark'], result['size'], result['seconds'],
+                                                        result['peak_bytes']), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,111 @@
+import random
+from automata import Automata
+from state import ALPH
+
+# Generators of automata for the benchmarks: the same arguments (and seed) always give the same Automata
+
+
+def random_nfa(nb_states: int, alph_size: int = 2, density: float = 1.5, nb_in_states: int = 1,
+               out_ratio: float = 0.2, seed: int = 0) -> Automata:
+    '''
+    Function generating a random (usually non deterministic) Automata
+    :param density: average number of destinations of a state for a letter
+    :param out_ratio: proportion of output states (at least one)
+    '''
+    generator = random.Random(seed)
+    nb_transitions = int(nb_states * alph_size * density)
+    A = Automata(alph_size, nb_states)
+    A._add_transitions([generator.randrange(nb_states) for _ in range(nb_transitions)],
+                       [generator.randrange(alph_size) for _ in range(nb_transitions)],
+                       [generator.randrange(nb_states) for _ in range(nb_transitions)])
+    for state_id in generator.sample(range(nb_states), min(nb_in_states, nb_states)):
+        A._set_in(state_id, True)
+    _set_random_outs(A, out_ratio, generator)
+    return A
+
+
+def random_dfa(nb_states: int, alph_size: int = 2, complete: bool = True, out_ratio: float = 0.5, seed: int = 0) -> Automata:
+    '''
+    Function generating a random deterministic Automata, whose input state is 0
+    :param complete: each state has a destination for each letter, otherwise about 10% of them are missing
+    '''
+    generator = random.Random(seed)
+    state_ids = []
+    alph_ids = []
+    dest_ids = []
+    for state_id in range(nb_states):
+        for alph_id in range(alph_size):
+            if complete or generator.random() >= 0.1:
+                state_ids.append(state_id)
+                alph_ids.append(alph_id)
+                dest_ids.append(generator.randrange(nb_states))
+    A = Automata(alph_size, nb_states)
+    A._add_transitions(state_ids, alph_ids, dest_ids)
+    A._set_in(0, True)
+    _set_random_outs(A, out_ratio, generator)
+    return A
+
+
+def nth_letter_from_end(n: int, alph_size: int = 2) -> Automata:
+    '''
+    Function generating the Automata of the words whose n-th letter from the end is an a: n + 1 states,
+    its determinized Automata has 2 ** n states (the worst case of the determinization)
+    '''
+    A = Automata(alph_size, n + 1)
+    state_ids = [0] * alph_size + list(range(1, n)) * alph_size + [0]
+    alph_ids = list(range(alph_size)) + [alph_id for alph_id in range(alph_size) for _ in range(1, n)] + [0]
+    dest_ids = [0] * alph_size + list(range(2, n + 1)) * alph_size + [1]
+    A._add_transitions(state_ids, alph_ids, dest_ids)
+    A._set_in(0, True)
+    A._set_out(n, True)
+    return A
+
+
+def chain_dfa(n: int, alph_size: int = 2) -> Automata:
+    '''
+    Function generating a complete deterministic Automata of n + 2 states: a chain of n a's
+    (the other letters and the letters after the chain go to a garbage state)
+    It recognizes only the word of n a's
+    '''
+    garbage = n + 1
+    A = Automata(alph_size, n + 2)
+    state_ids = []
+    alph_ids = []
+    dest_ids = []
+    for state_id in range(n + 2):
+        for alph_id in range(alph_size):
+            state_ids.append(state_id)
+            alph_ids.append(alph_id)
+            dest_ids.append(state_id + 1 if alph_id == 0 and state_id < n else garbage)
+    A._add_transitions(state_ids, alph_ids, dest_ids)
+    A._set_in(0, True)
+    A._set_out(n, True)
+    return A
+
+
+def cycle_dfa(n: int, alph_size: int = 2) -> Automata:
+    '''
+    Function generating a complete deterministic Automata of n states on a cycle: the letter a goes to the next state,
+    the other letters stay on the state. It recognizes the words whose number of a is a multiple of n
+    '''
+    A = Automata(alph_size, n)
+    state_ids = [state_id for state_id in range(n) for _ in range(alph_size)]
+    alph_ids = list(range(alph_size)) * n
+    dest_ids = [(state_id + 1) % n if alph_id == 0 else state_id for state_id in range(n) for alph_id in range(alph_size)]
+    A._add_transitions(state_ids, alph_ids, dest_ids)
+    A._set_in(0, True)
+    A._set_out(0, True)
+    return A
+
+
+def random_word(length: int, alph_size: int = 2, seed: int = 0) -> str:
+    '''Function generating a random word of the first alph_size letters'''
+    generator = random.Random(seed)
+    return ''.join(generator.choice(ALPH[:alph_size]) for _ in range(length))
+
+
+def _set_random_outs(A: Automata, out_ratio: float, generator: random.Random):
+    '''Function choosing the output states of a generated Automata'''
+    nb_states = A.get_nb_states()
+    for state_id in generator.sample(range(nb_states), max(1, int(nb_states * out_ratio)) if nb_states else 0):
+        A._set_out(state_id, True)
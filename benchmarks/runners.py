@@ -0,0 +1,174 @@
+import gc
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from automata import Automata, __version__
+from benchmarks.generators import random_nfa, random_dfa, nth_letter_from_end, chain_dfa, cycle_dfa, random_word
+
+# Each benchmark: the sizes of its inputs, a function size -> input (not measured),
+# and the operation measured on the input, which returns the Automata (or value) obtained
+BENCHMARKS = {
+    'determinize_nth_letter': {
+        'sizes': [8, 10, 12, 14],
+        'setup': lambda size: nth_letter_from_end(size),
+        'operation': lambda A: A.determinize_complete(),
+    },
+    'determinize_random_nfa': {
+        # with this density, the size of the determinized Automata varies a lot with the seed: they are fixed,
+        # these sizes (and seeds) give from about 6000 to 150000 determinized states
+        'sizes': [300, 400, 800, 1000],
+        'setup': lambda size: random_nfa(size, alph_size=2, density=0.8, seed=size),
+        'operation': lambda A: A.determinize_complete(),
+    },
+    'minimize_random_dfa': {
+        'sizes': [1000, 10000, 100000],
+        'setup': lambda size: random_dfa(size, alph_size=4, seed=size),
+        'operation': lambda A: A.minimization(),
+    },
+    'minimize_cycle_dfa': {
+        'sizes': [1000, 10000, 100000],
+        'setup': lambda size: cycle_dfa(size, alph_size=3),
+        'operation': lambda A: A.minimization(),
+    },
+    'from_file_random_nfa': {
+        'sizes': [1000, 10000, 100000],
+        'setup': lambda size: _text_file(random_nfa(size, alph_size=3, density=2.0, seed=size)),
+        'operation': lambda path: Automata.from_file(path),
+    },
+    'recognize_word_chain_dfa': {
+        # sizes kept from the recursive version of recognize_word, to compare with the results measured then
+        'sizes': [100, 300, 900],
+        'setup': lambda size: (chain_dfa(size), 'a' * size),
+        'operation': lambda arguments: arguments[0].recognize_word(arguments[1]),
+    },
+    'compiled_recognize_word_cycle_dfa': {
+        'sizes': [10000, 100000, 1000000],
+        'setup': lambda size: (cycle_dfa(1000, alph_size=2).compile(), random_word(size, seed=size)),
+        'operation': lambda arguments: arguments[0].recognize_word(arguments[1]),
+    },
+}
+DEFAULT_REPEAT = 3
+# Text files written by the setups, removed at the end of run_benchmarks
+_TEMPORARY_FILES = []
+
+
+def _text_file(A: Automata) -> str:
+    '''Function writing an Automata in a temporary text file, giving its path'''
+    fd, path = tempfile.mkstemp(suffix='.txt')
+    os.close(fd)
+    A.to_file(path)
+    _TEMPORARY_FILES.append(path)
+    return path
+
+
+def _remove_temporary_files():
+    while _TEMPORARY_FILES:
+        path = _TEMPORARY_FILES.pop()
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def measure(operation, argument, repeat: int = DEFAULT_REPEAT) -> dict:
+    '''
+    Function measuring an operation on an argument: the best time of repeat runs (seconds),
+    then the peak of the memory allocated during one more run traced by tracemalloc (peak_bytes)
+    '''
+    times = []
+    for _ in range(repeat):
+        # the derived Automata kept by an Automata (see Automata.get_derived_stats) must be computed again
+        argument = _fresh(argument)
+        gc.collect()
+        start = time.perf_counter()
+        result = operation(argument)
+        times.append(time.perf_counter() - start)
+    argument = _fresh(argument)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        operation(argument)
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    measures = {'seconds': min(times), 'mean_seconds': sum(times) / len(times), 'peak_bytes': peak_bytes}
+    if isinstance(result, Automata):
+        measures['result_states'] = result.get_nb_states()
+    return measures
+
+
+def _fresh(argument):
+    '''Copy of the Automata of an argument, without the results kept from a previous run'''
+    if isinstance(argument, Automata):
+        return argument.copy()
+    if isinstance(argument, tuple):
+        return tuple(_fresh(item) for item in argument)
+    return argument
+
+
+def run_benchmarks(names: list = None, repeat: int = DEFAULT_REPEAT, max_size: int = None, progress=None) -> dict:
+    '''
+    Function running the benchmarks (all of BENCHMARKS by default) for each of their sizes (up to max_size)
+    :param progress: function called with each result when it is measured (to display it), optional
+    :return dict: {'version', 'python', 'machine', 'results': list of {'benchmark', 'size', 'seconds', ...}},
+        serializable in JSON (see compare_results)
+    '''
+    names = list(BENCHMARKS) if names is None else names
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError('Unknown benchmark ' + ', '.join(unknown) + ', expected some of ' + ', '.join(BENCHMARKS))
+    results = []
+    try:
+        for name in names:
+            benchmark = BENCHMARKS[name]
+            for size in benchmark['sizes']:
+                if max_size is not None and size > max_size:
+                    continue
+                argument = benchmark['setup'](size)
+                result = {'benchmark': name, 'size': size}
+                result.update(measure(benchmark['operation'], argument, repeat))
+                results.append(result)
+                if progress is not None:
+                    progress(result)
+    finally:
+        _remove_temporary_files()
+    return {
+        'version': __version__,
+        'python': sys.version.split()[0],
+        'machine': platform.platform(),
+        'results': results,
+    }
+
+
+def compare_results(old: dict, new: dict, threshold: float = 0.1) -> list:
+    '''
+    Function comparing two runs of the benchmarks (see run_benchmarks), for the (benchmark, size) present in both
+    :param threshold: relative change of the time over which a result is slower or faster
+    :return list: {'benchmark', 'size', 'old_seconds', 'new_seconds', 'ratio', 'old_peak_bytes', 'new_peak_bytes', 'change'}
+        with ratio = new / old time and change 'slower', 'faster' or 'same'
+    '''
+    old_results = {(result['benchmark'], result['size']): result for result in old['results']}
+    comparison = []
+    for result in new['results']:
+        old_result = old_results.get((result['benchmark'], result['size']))
+        if old_result is None:
+            continue
+        ratio = result['seconds'] / old_result['seconds'] if old_result['seconds'] else float('inf')
+        if ratio > 1 + threshold:
+            change = 'slower'
+        elif ratio < 1 / (1 + threshold):
+            change = 'faster'
+        else:
+            change = 'same'
+        comparison.append({
+            'benchmark': result['benchmark'],
+            'size': result['size'],
+            'old_seconds': old_result['seconds'],
+            'new_seconds': result['seconds'],
+            'ratio': ratio,
+            'old_peak_bytes': old_result['peak_bytes'],
+            'new_peak_bytes': result['peak_bytes'],
+            'change': change,
+        })
+    return comparison
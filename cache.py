@@ -0,0 +1,166 @@
+import hashlib
+import json
+import os
+import tempfile
+from automata import Automata, __version__
+
+# The operations kept in the cache, computed from the Automata read in the text file
+OPERATIONS = {
+    'source': lambda A: A,
+    'determinized': lambda A: A.determinize_complete(),
+    'minimized': lambda A: A.determinize_complete().minimization(),
+    'complementary': lambda A: A.complementary_automata(),
+}
+DEFAULT_CACHE_DIR = '.automata_cache'
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+
+
+def automata_properties(A: Automata) -> dict:
+    '''Function giving the properties of an Automata stored with it in the cache (see DiskCache.get_properties)'''
+    return {
+        'alph_size': A.get_alph_size(),
+        'nb_states': A.get_nb_states(),
+        'nb_in_states': A.get_nb_in_states(),
+        'nb_out_states': A.get_nb_out_states(),
+        'deterministic': int(A.is_deterministic()),
+        'complete_DFA': int(A.is_complete_DFA(True)),
+        'standard': A.is_standard(),
+        'valid': A.is_valid(),
+    }
+
+
+class DiskCache:
+    '''
+    Directory keeping the Automata derived from text files (determinized, minimized, complementary, see OPERATIONS)
+    in the binary format (Automata.save_binary), with the properties of each one in a JSON file.
+    An entry is named after a hash of the content of the text file, the operation and the version of the library,
+    so a modified file or a new version never reuses an old entry.
+    Entries are written in a temporary file then renamed: several processes can share the directory.
+    When the directory is bigger than max_size bytes, the least recently used entries are removed.
+    '''
+
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, max_size: int = DEFAULT_MAX_SIZE):
+        self.__directory = directory
+        self.__max_size = max_size
+        self.__stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+        os.makedirs(directory, exist_ok=True)
+
+    # The getters:
+    def get_directory(self) -> str:
+        '''Getter for the directory of the cache'''
+        return self.__directory
+    def get_max_size(self) -> int:
+        '''Getter for the maximum size of the cache, in bytes'''
+        return self.__max_size
+    def get_stats(self) -> dict:
+        '''Getter for the number of hits, misses and evictions since the creation of this DiskCache'''
+        return dict(self.__stats)
+
+    def key(self, path: str, operation: str) -> str:
+        '''Return the name of the entry of the operation on the text file path'''
+        if operation not in OPERATIONS:
+            raise ValueError('Unknown operation ' + repr(operation) + ', expected one of ' + ', '.join(OPERATIONS))
+        digest = hashlib.sha256()
+        with open(path, 'rb') as file:
+            for chunk in iter(lambda: file.read(1 << 20), b''):
+                digest.update(chunk)
+        digest.update(b'\0' + operation.encode() + b'\0' + __version__.encode())
+        return digest.hexdigest()
+
+    def load(self, path: str, operation: str = 'source') -> Automata:
+        '''
+        Return the result of the operation on the Automata of the text file path,
+        from the cache if it is there, otherwise computed and added to the cache
+        (the Automata returned can be modified, it doesn't modify the cache)
+        '''
+        entry = os.path.join(self.__directory, self.key(path, operation))
+        try:
+            A = Automata.load_binary(entry + '.bin')
+            os.utime(entry + '.bin')
+            self.__stats['hits'] += 1
+            return A
+        except (OSError, ValueError):
+            # not in the cache (or removed, or being replaced, by another process)
+            pass
+        self.__stats['misses'] += 1
+        A = OPERATIONS[operation](Automata.from_file(path))
+        self.__store(entry, A)
+        return A
+
+    def get_properties(self, path: str, operation: str = 'source') -> dict:
+        '''
+        Return the properties (see automata_properties) of the result of the operation on the Automata of the text file path,
+        without loading it if they are in the cache
+        '''
+        entry = os.path.join(self.__directory, self.key(path, operation))
+        try:
+            with open(entry + '.json') as file:
+                properties = json.load(file)
+            self.__stats['hits'] += 1
+            return properties
+        except (OSError, ValueError):
+            return automata_properties(self.load(path, operation))
+
+    def clear(self):
+        '''Remove all the entries of the cache'''
+        for name in os.listdir(self.__directory):
+            if name.endswith(('.bin', '.json')):
+                try:
+                    os.remove(os.path.join(self.__directory, name))
+                except OSError:
+                    pass
+
+    def __store(self, entry: str, A: Automata):
+        '''Add an Automata and its properties to the cache, with atomic renames, then evict if the cache is too big'''
+        # the properties are computed first, so that they are also saved in the binary file
+        properties = json.dumps(automata_properties(A))
+        try:
+            self.__write_atomically(entry + '.bin', A.save_binary)
+            self.__write_atomically(entry + '.json', lambda tmp_path: self.__write_text(tmp_path, properties))
+        except OSError:
+            # the cache is only an optimization
+            return
+        self.__evict()
+
+    def __write_atomically(self, path: str, write):
+        '''Write a file with write(temporary path) then rename it: a reader sees the old file or the new one, never a part'''
+        fd, tmp_path = tempfile.mkstemp(dir=self.__directory, suffix='.tmp')
+        os.close(fd)
+        try:
+            write(tmp_path)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def __write_text(path: str, text: str):
+        with open(path, 'w') as file:
+            file.write(text)
+
+    def __evict(self):
+        '''Remove the least recently used entries (oldest modification time of the .bin) until the cache fits in max_size'''
+        entries = {}
+        total_size = 0
+        for dir_entry in os.scandir(self.__directory):
+            name, extension = os.path.splitext(dir_entry.name)
+            if extension not in ('.bin', '.json'):
+                continue
+            try:
+                stat = dir_entry.stat()
+            except OSError:
+                continue
+            size, last_use = entries.get(name, (0, 0.0))
+            entries[name] = (size + stat.st_size, max(last_use, stat.st_mtime) if extension == '.bin' else last_use)
+            total_size += stat.st_size
+        for name, (size, _) in sorted(entries.items(), key=lambda item: item[1][1]):
+            if total_size <= self.__max_size:
+                break
+            for extension in ('.bin', '.json'):
+                try:
+                    os.remove(os.path.join(self.__directory, name + extension))
+                except OSError:
+                    pass
+            total_size -= size
+            self.__stats['evictions'] += 1
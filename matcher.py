@@ -0,0 +1,435 @@
+from array import array
+from collections import OrderedDict
+from state import ALPH
+
+# NumPy is optional, it is only used to speed up the recognition of big batches of words
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Number of words encoded at once by recognize_array (bounds the size of the padded matrix)
+BATCH_SIZE = 65536
+# Code of the bytes which aren't symbols, so the bytes are decoded only for less than INVALID_CODE columns
+INVALID_CODE = 255
+
+
+class CompiledMatcher:
+    '''
+    Immutable word matcher built from a complete deterministic Automata.
+    The transitions are stored in a flat table indexed by state_id * alph_size + letter_id,
+    the output states in a bitmap (bit state_id set if the state is an output).
+    '''
+    __slots__ = ('__alph_size', '__nb_states', '__initial', '__table', '__accepting', '__letter_ids', '__latin_1', '__dead')
+
+    def __init__(self, alph_size: int, nb_states: int, initial: int, table, accepting: bytes, letter_ids: dict = None):
+        '''
+        :param letter_ids: dictionary symbol -> column of the table, the letters a, b... by default
+        '''
+        if len(table) != alph_size * nb_states:
+            raise ValueError('The transition table should have alph_size * nb_states entries')
+        if not 0 <= initial < nb_states:
+            raise ValueError('The initial state should be one of the states')
+        self.__alph_size = alph_size
+        self.__nb_states = nb_states
+        self.__initial = initial
+        self.__table = table
+        self.__accepting = bytes(accepting)
+        # only the letters of the alphabet of the automata are recognized
+        if letter_ids is None:
+            letter_ids = {ALPH[alph_id]: alph_id for alph_id in range(alph_size)}
+        self.__letter_ids = dict(letter_ids)
+        # recognize_array encodes the words in latin-1 ('?' for the other characters) with a byte per column
+        self.__latin_1 = '?' not in letter_ids and alph_size < INVALID_CODE and all(
+            isinstance(letter, str) and len(letter) == 1 and ord(letter) < 256 for letter in letter_ids)
+        # a state which isn't an output and only goes to itself (such as the garbage state of a completion):
+        # once there, no word can be recognized, the recognition stops
+        self.__dead = -1
+        if np is not None and nb_states:
+            rows = np.frombuffer(table, dtype=np.int32).reshape(nb_states, alph_size)
+            accepting_states = np.unpackbits(np.frombuffer(self.__accepting, dtype=np.uint8), bitorder='little')[:nb_states]
+            dead_states = np.flatnonzero((rows == np.arange(nb_states)[:, None]).all(axis=1) & (accepting_states == 0))
+            if len(dead_states):
+                self.__dead = int(dead_states[0])
+        else:
+            for state_id in range(nb_states):
+                if not self.is_accepting(state_id) and all(
+                        dest_id == state_id for dest_id in table[state_id * alph_size:(state_id + 1) * alph_size]):
+                    self.__dead = state_id
+                    break
+
+    @classmethod
+    def from_automata(cls, automata) -> 'CompiledMatcher':
+        '''
+        Function to compile a complete deterministic Automata (CDFA) into a matcher
+        :param automata: Automata which should be a CDFA (use Automata.compile() otherwise)
+        '''
+        alph_size = automata.get_alph_size()
+        nb_states = automata.get_nb_states()
+        # complete and deterministic: no marker (negative value) in the table of the automata
+        # (a table mapped from a binary file is read-only, it is used without copy)
+        table = automata._get_table()
+        if isinstance(table, array):
+            table = array('i', table)
+        if nb_states and (np.frombuffer(table, dtype=np.int32).min() if np is not None else min(table)) < 0:
+            raise ValueError('The Automata should be complete and deterministic to be compiled')
+        if automata.get_nb_in_states() != 1:
+            raise ValueError('The Automata should have only one input state to be compiled')
+        accepting = bytearray((nb_states + 7) // 8)
+        initial = -1
+        for state_id in range(nb_states):
+            if automata._is_in(state_id):
+                initial = state_id
+            if automata._is_out(state_id):
+                accepting[state_id >> 3] |= 1 << (state_id & 7)
+        return cls(alph_size, nb_states, initial, table, accepting, automata._get_symbol_ids())
+
+    # The getters:
+    def get_alph_size(self) -> int:
+        '''Getter for the number of symbols'''
+        return self.__alph_size
+    def get_nb_states(self) -> int:
+        '''Getter for the number of states'''
+        return self.__nb_states
+    def get_initial(self) -> int:
+        '''Getter for the id of the input state'''
+        return self.__initial
+    def get_table(self) -> memoryview:
+        '''Getter for the (read-only) flat transition table'''
+        return memoryview(self.__table).toreadonly()
+    def get_dead(self) -> int:
+        '''Getter for the id of a state from which no word is recognized (-1 if there is none)'''
+        return self.__dead
+    def get_letter_ids(self) -> dict:
+        '''Getter for a copy of the dictionary letter -> column of the table'''
+        return dict(self.__letter_ids)
+    def get_byte_codes(self) -> bytes:
+        '''
+        Getter for the translation table byte -> column of the table (INVALID_CODE if not a letter)
+        :raise ValueError: if the table has INVALID_CODE columns or more (a column would be taken for an invalid byte)
+        '''
+        if self.__alph_size >= INVALID_CODE:
+            raise ValueError('The bytes can\'t be decoded for an alphabet of ' + str(self.__alph_size)
+                             + ' classes of symbols (at most ' + str(INVALID_CODE - 1) + '), use str instead')
+        codes = bytearray([INVALID_CODE]) * 256
+        for letter, alph_id in self.__letter_ids.items():
+            if isinstance(letter, str) and len(letter) == 1 and ord(letter) < 256:
+                codes[ord(letter)] = alph_id
+        return bytes(codes)
+
+    def is_accepting(self, state_id: int) -> bool:
+        '''Indicates if the given state is an output state'''
+        return bool(self.__accepting[state_id >> 3] >> (state_id & 7) & 1)
+
+    def recognize_word(self, word: str) -> bool:
+        '''
+        Method to check if a word is recognized, in linear time and without recursion
+        :return: bool -- True if recognized, False if not or if a character isn't in the alphabet
+        '''
+        table = self.__table
+        letter_ids = self.__letter_ids
+        alph_size = self.__alph_size
+        dead = self.__dead
+        state_id = self.__initial
+        try:
+            for char in word:
+                state_id = table[state_id * alph_size + letter_ids[char]]
+                if state_id == dead:
+                    return False
+        except KeyError:
+            return False
+        return bool(self.__accepting[state_id >> 3] >> (state_id & 7) & 1)
+
+    def recognize_array(self, words):
+        '''
+        Method to check a batch of words at once: the words are encoded in a padded matrix of letter ids
+        and all the current states are advanced column by column with one lookup in the table (NumPy)
+        Without NumPy, or if some symbols aren't latin-1 characters, the words are recognized one by one with recognize_word
+        :param words: any iterable of words
+        :return: numpy array of bool (list of bool without NumPy) -- True for each recognized word
+        '''
+        if np is None:
+            return [self.recognize_word(word) for word in words]
+        if not self.__latin_1:
+            return np.array([self.recognize_word(word) for word in words], dtype=bool)
+        words = list(words)
+        results = np.zeros(len(words), dtype=bool)
+        if not words:
+            return results
+        lengths = np.fromiter(map(len, words), dtype=np.int64, count=len(words))
+        # sorting by decreasing length: the words still running are always the first rows of the batch
+        order = np.argsort(-lengths, kind='stable')
+        words = [words[i] for i in order.tolist()]
+        lengths = lengths[order]
+        table = np.frombuffer(self.__table, dtype=np.int32) if self.__table.itemsize == 4 else np.asarray(self.__table, dtype=np.int32)
+        accepting = np.unpackbits(np.frombuffer(self.__accepting, dtype=np.uint8), bitorder='little')[:self.__nb_states].astype(bool)
+        codes_of_bytes = np.frombuffer(self.get_byte_codes(), dtype=np.uint8)
+        for begin in range(0, len(words), BATCH_SIZE):
+            batch_lengths = lengths[begin:begin + BATCH_SIZE]
+            nb_words = len(batch_lengths)
+            max_length = int(batch_lengths[0])
+            # encoding, the characters out of latin-1 (replaced by '?') are invalid codes
+            # (the padding '\0' may be a symbol of the alphabet: the positions of the padding come from the lengths)
+            joined = ''.join([word.ljust(max_length, '\0') for word in words[begin:begin + BATCH_SIZE]])
+            padded = codes_of_bytes[np.frombuffer(joined.encode('latin-1', errors='replace'), dtype=np.uint8)]
+            padded = padded.reshape(nb_words, max_length)
+            # a word is valid if it has no invalid code before its end
+            in_word = np.arange(max_length) < batch_lengths[:, None]
+            valid = ~((padded == INVALID_CODE) & in_word).any(axis=1)
+            np.minimum(padded, self.__alph_size - 1, out=padded)
+            # running the automata on all the words, the words already finished are masked out
+            states = np.full(nb_words, self.__initial, dtype=np.int64)
+            nb_running = nb_words
+            for col in range(max_length):
+                while batch_lengths[nb_running - 1] <= col:
+                    nb_running -= 1
+                states[:nb_running] = table[states[:nb_running] * self.__alph_size + padded[:nb_running, col]]
+            results[order[begin:begin + BATCH_SIZE]] = accepting[states] & valid
+        return results
+
+    def __str__(self) -> str:
+        return ('CompiledMatcher(' + str(self.__nb_states) + ' states, '
+                + str(self.__alph_size) + ' symbols, input state ' + str(self.__initial) + ')')
+
+
+class Recognizer:
+    '''
+    Incremental recognition of a word given by chunks (str or bytes), only the current state is kept in memory
+    '''
+    __slots__ = ('__matcher', '__table', '__letter_ids', '__byte_codes', '__alph_size', '__state_id', '__nb_characters')
+
+    def __init__(self, automata):
+        '''
+        :param automata: Automata (compiled with Automata.compile()) or CompiledMatcher
+        '''
+        self.__matcher = automata if isinstance(automata, CompiledMatcher) else automata.compile()
+        self.__table = self.__matcher.get_table()
+        self.__letter_ids = self.__matcher.get_letter_ids()
+        # built by the first call of feed_bytes (not possible for all the alphabets, see CompiledMatcher.get_byte_codes)
+        self.__byte_codes = None
+        self.__alph_size = self.__matcher.get_alph_size()
+        self.reset()
+
+    def reset(self):
+        '''Method to restart the recognition from the input state (empty word)'''
+        self.__state_id = self.__matcher.get_initial()
+        self.__nb_characters = 0
+
+    def get_state_id(self) -> int:
+        '''Getter for the current state, -1 if an invalid character has been read'''
+        return self.__state_id
+    def get_nb_characters(self) -> int:
+        '''Getter for the number of characters read since the last reset'''
+        return self.__nb_characters
+
+    def is_accepting(self) -> bool:
+        '''Indicates if the word read since the last reset is recognized'''
+        return self.__state_id != -1 and self.__matcher.is_accepting(self.__state_id)
+
+    def feed(self, chunk: str):
+        '''Method to read the next characters of the word'''
+        self.__nb_characters += len(chunk)
+        state_id = self.__state_id
+        if state_id == -1:
+            return
+        table = self.__table
+        letter_ids = self.__letter_ids
+        alph_size = self.__alph_size
+        try:
+            for char in chunk:
+                state_id = table[state_id * alph_size + letter_ids[char]]
+        except KeyError:
+            state_id = -1
+        self.__state_id = state_id
+
+    def feed_bytes(self, buf):
+        '''
+        Method to read the next characters of the word, given as bytes (one byte per character)
+        :raise ValueError: if the bytes can't be decoded for the alphabet (see CompiledMatcher.get_byte_codes)
+        '''
+        if self.__byte_codes is None:
+            self.__byte_codes = self.__matcher.get_byte_codes()
+        self.__nb_characters += len(buf)
+        state_id = self.__state_id
+        if state_id == -1:
+            return
+        if not isinstance(buf, (bytes, bytearray)):
+            buf = bytes(buf)
+        codes = buf.translate(self.__byte_codes)
+        if INVALID_CODE in codes:
+            self.__state_id = -1
+            return
+        table = self.__table
+        alph_size = self.__alph_size
+        dead = self.__matcher.get_dead()
+        for code in codes:
+            state_id = table[state_id * alph_size + code]
+            if state_id == dead:
+                break
+        self.__state_id = state_id
+
+
+class LazyMatcher:
+    '''
+    Word matcher simulating a (non deterministic) Automata on sets of states:
+    the states of the determinized Automata are only built, and memoized, when a word reaches them.
+    At most max_states of them are kept, the others are evicted:
+        - 'flush': the whole cache is dropped when full (no cost while recognizing)
+        - 'lru': the least recently used state is dropped
+    '''
+    __slots__ = ('__alph_size', '__letter_ids', '__successors', '__out_mask', '__initial_subset', '__max_states',
+                 '__eviction', '__ids', '__subsets', '__accepting', '__trans', '__incoming', '__recency',
+                 '__free_ids', '__stats')
+
+    def __init__(self, alph_size: int, successors: list, in_states: list, out_states: list,
+                 max_states: int = 10000, eviction: str = 'flush', letter_ids: dict = None):
+        '''
+        :param successors: list such that successors[state_id * alph_size + alph_id] is the bitmask of the destinations
+        :param in_states, out_states: ids of the input and output states
+        :param letter_ids: dictionary symbol -> alph_id, the letters a, b... by default
+        '''
+        if eviction not in ('flush', 'lru'):
+            raise ValueError('The eviction should be \'flush\' or \'lru\'')
+        if max_states < 2:
+            raise ValueError('At least 2 states should be kept in the cache')
+        self.__alph_size = alph_size
+        if letter_ids is None:
+            letter_ids = {ALPH[alph_id]: alph_id for alph_id in range(alph_size)}
+        self.__letter_ids = dict(letter_ids)
+        self.__successors = successors
+        self.__out_mask = sum(1 << state_id for state_id in set(out_states))
+        self.__initial_subset = sum(1 << state_id for state_id in set(in_states))
+        self.__max_states = max_states
+        self.__eviction = eviction
+        self.__stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'flushes': 0}
+        self.clear()
+
+    @classmethod
+    def from_automata(cls, automata, max_states: int = 10000, eviction: str = 'flush') -> 'LazyMatcher':
+        '''Function to build the lazy matcher of an Automata (which should be valid)'''
+        if not automata.is_valid():
+            raise ValueError('The Automata should be valid (some destinations don\'t exist)')
+        alph_size = automata.get_alph_size()
+        successors = automata._get_successor_masks()
+        in_states = [state_id for state_id in range(automata.get_nb_states()) if automata._is_in(state_id)]
+        out_states = [state_id for state_id in range(automata.get_nb_states()) if automata._is_out(state_id)]
+        return cls(alph_size, successors, in_states, out_states, max_states, eviction, automata._get_symbol_ids())
+
+    def clear(self):
+        '''Method to drop all the memoized states'''
+        self.__ids = {}
+        self.__subsets = []
+        self.__accepting = []
+        self.__trans = []
+        self.__incoming = []
+        self.__recency = OrderedDict()
+        self.__free_ids = []
+
+    # The getters:
+    def get_alph_size(self) -> int:
+        '''Getter for the number of symbols'''
+        return self.__alph_size
+    def get_nb_cached_states(self) -> int:
+        '''Getter for the number of memoized states'''
+        return len(self.__ids)
+    def get_stats(self) -> dict:
+        '''Getter for the cache statistics (hits and misses of transitions, evictions, flushes)'''
+        return dict(self.__stats)
+
+    def __new_id(self, subset: int, protected: int) -> int:
+        '''Method to memoize a set of states (bitmask), evicting if needed, but never the protected id'''
+        if len(self.__ids) >= self.__max_states:
+            if self.__eviction == 'flush':
+                protected_subset = self.__subsets[protected] if protected != -1 else None
+                self.clear()
+                self.__stats['flushes'] += 1
+                if protected_subset is not None:
+                    self.__new_id(protected_subset, -1)
+            else:
+                self.__evict(protected)
+        if self.__free_ids:
+            new_id = self.__free_ids.pop()
+            self.__subsets[new_id] = subset
+            self.__accepting[new_id] = bool(subset & self.__out_mask)
+            self.__incoming[new_id] = set()
+        else:
+            new_id = len(self.__subsets)
+            self.__subsets.append(subset)
+            self.__accepting.append(bool(subset & self.__out_mask))
+            self.__trans.extend([-1] * self.__alph_size)
+            self.__incoming.append(set())
+        self.__ids[subset] = new_id
+        self.__recency[new_id] = None
+        return new_id
+
+    def __evict(self, protected: int):
+        '''Method to drop the least recently used state (other than protected) and the transitions from/towards it'''
+        victim = next(state_id for state_id in self.__recency if state_id != protected)
+        del self.__recency[victim]
+        trans = self.__trans
+        for slot in self.__incoming[victim]:
+            trans[slot] = -1
+        for slot in range(victim * self.__alph_size, (victim + 1) * self.__alph_size):
+            if trans[slot] != -1:
+                self.__incoming[trans[slot]].discard(slot)
+                trans[slot] = -1
+        del self.__ids[self.__subsets[victim]]
+        self.__incoming[victim] = set()
+        self.__free_ids.append(victim)
+        self.__stats['evictions'] += 1
+
+    def __successor(self, state_id: int, alph_id: int) -> int:
+        '''Method to compute (and memoize) the destination of a memoized state for a letter'''
+        self.__stats['misses'] += 1
+        subset = self.__subsets[state_id]
+        successors = self.__successors
+        alph_size = self.__alph_size
+        dest_subset = 0
+        remaining = subset
+        while remaining:
+            lowest = remaining & -remaining
+            dest_subset |= successors[(lowest.bit_length() - 1) * alph_size + alph_id]
+            remaining ^= lowest
+        dest_id = self.__ids.get(dest_subset)
+        if dest_id is None:
+            dest_id = self.__new_id(dest_subset, state_id)
+            # the cache may have been flushed, giving a new id to the current state
+            state_id = self.__ids[subset]
+        self.__trans[state_id * alph_size + alph_id] = dest_id
+        self.__incoming[dest_id].add(state_id * alph_size + alph_id)
+        return dest_id
+
+    def recognize_word(self, word: str) -> bool:
+        '''
+        Method to check if a word is recognized, building the needed states on the fly
+        :return: bool -- True if recognized, False if not or if a character isn't in the alphabet
+        '''
+        letter_ids = self.__letter_ids
+        alph_size = self.__alph_size
+        state_id = self.__ids.get(self.__initial_subset)
+        if state_id is None:
+            state_id = self.__new_id(self.__initial_subset, -1)
+        trans = self.__trans
+        recency = self.__recency if self.__eviction == 'lru' else None
+        if recency is not None:
+            # every word starts there: it shouldn't be the first state evicted
+            recency.move_to_end(state_id)
+        nb_misses = self.__stats['misses']
+        nb_steps = 0
+        for char in word:
+            alph_id = letter_ids.get(char)
+            if alph_id is None:
+                break
+            dest_id = trans[state_id * alph_size + alph_id]
+            if dest_id == -1:
+                dest_id = self.__successor(state_id, alph_id)
+                # the lists are replaced when the cache is flushed
+                trans = self.__trans
+            if recency is not None:
+                recency.move_to_end(dest_id)
+            state_id = dest_id
+            nb_steps += 1
+        self.__stats['hits'] += nb_steps - (self.__stats['misses'] - nb_misses)
+        if nb_steps != len(word):
+            return False
+        return self.__accepting[state_id]
@@ -1,10 +1,11 @@
 import os
-import sys
-import io
+import queue
+import threading
 import customtkinter as ctk
 from tkinter import messagebox
 from PIL import Image, ImageTk, ImageOps
 from automata import *
+from cache import DiskCache, DEFAULT_CACHE_DIR
 from colorama import init
 
 init(autoreset=True)
@@ -13,6 +14,9 @@ ctk.set_default_color_theme("blue")
 
 DEFAULT_DIRECTORY = os.getcwd()
 AUTOMATA_TXT_DIR = os.path.join(DEFAULT_DIRECTORY, "Automata_txt")
+CACHE_DIR = os.path.join(DEFAULT_DIRECTORY, DEFAULT_CACHE_DIR)
+# Time between two readings of the messages of the worker thread of AutomataApp, in milliseconds
+POLL_INTERVAL_MS = 100
 
 
 class AutomataTextMenu:
@@ -23,6 +27,7 @@ class AutomataTextMenu:
         self.created_complement_files = []
         self.current_Automata = None
         self.current_Automata_name = None
+        self.cache = DiskCache(CACHE_DIR)
         print("\n===== AUTOMATA PROJECT - TEXT MENU =====\n")
     
     def run(self):
@@ -89,7 +94,7 @@ class AutomataTextMenu:
                 self.selected_file = os.path.join(AUTOMATA_TXT_DIR, selected)
                 self.display_file_content(self.selected_file)
                 print(f"\n✅ Automaton '{selected}' selected.")
-                self.current_Automata = Automata.from_file(self.selected_file)
+                self.current_Automata = self.cache.load(self.selected_file)
                 self.current_Automata_name = selected
             else:
                 print("❌ Invalid number.")
@@ -128,11 +133,10 @@ class AutomataTextMenu:
             return
             
         try:
-            A = Automata.from_file(self.selected_file)
+            A = self.cache.load(self.selected_file)
             print("\n=== Current Automaton ===\n")
             print(f"File: {os.path.basename(self.selected_file)}")
-            table_output = self.capture_stdout(A.printCDFA)
-            print("\n" + table_output)
+            print("\n" + A.str_CDFA())
         except Exception as e:
             print(f"❌ Error: {str(e)}")
     
@@ -150,14 +154,9 @@ class AutomataTextMenu:
             print(f"\n🔍 Testing word '{word}'...")
 
             try:
-                output_buffer = io.StringIO()
-                sys.stdout = output_buffer
-
-                result = self.current_Automata.recognize_word(word)
-
-                sys.stdout = sys.__stdout__
-                debug_output = output_buffer.getvalue()
-                output_buffer.close()
+                with tracing() as events:
+                    result = self.current_Automata.recognize_word(word)
+                debug_output = render(events)
 
                 if result:
                     print(f"\n✅ The word '{word}' is recognized by the automaton.")
@@ -168,7 +167,6 @@ class AutomataTextMenu:
                     print(f"\n🔧 Execution details:\n{debug_output}")
 
             except Exception as e:
-                sys.stdout = sys.__stdout__
                 print(f"\n❌ Error: {str(e)}")
             word = input("\nEnter a word to test (\"end\"to stop testing): ").strip()
     
@@ -181,8 +179,7 @@ class AutomataTextMenu:
         try:
             self.current_Automata = self.current_Automata.determinize_complete()
             self.current_Automata_name += " -> Deteminized"
-            result = self.capture_stdout(self.current_Automata.printCDFA)
-            print("\n✔ After complete determinization:\n" + result)
+            print("\n✔ After complete determinization:\n" + self.current_Automata.str_CDFA())
         except Exception as e:
             print(f"\n❌ Error: {str(e)}")
     
@@ -197,16 +194,13 @@ class AutomataTextMenu:
             
             if self.current_Automata.is_standard():
                 print("\n✅ The automaton is already standardized.")
-                result = self.capture_stdout(self.current_Automata.printCDFA)
-                print("\nStandardized automaton:\n" + result)
+                print("\nStandardized automaton:\n" + self.current_Automata.str_CDFA())
                 return
                 
             self.current_Automata = self.current_Automata.standardize()
             self.current_Automata_name += " -> Standardized"
-            result = self.capture_stdout(self.current_Automata.printCDFA)
-            print("\n✅ After standardization:\n" + result)
+            print("\n✅ After standardization:\n" + self.current_Automata.str_CDFA())
         except Exception as e:
-            sys.stdout = sys.__stdout__
             print(f"\n❌ Error: {str(e)}")
     
     def minimize(self):
@@ -221,8 +215,7 @@ class AutomataTextMenu:
             self.current_Automata_name += " -> Deteminized"
             self.current_Automata = self.current_Automata.minimization()
             self.current_Automata_name += " -> Minimized"
-            result = self.capture_stdout(self.current_Automata.print_minimized)
-            print("\n✔ After minimization:\n" + result)
+            print("\n✔ After minimization:\n" + self.current_Automata.str_minimized())
         except Exception as e:
             print(f"\n❌ Error: {str(e)}")
     
@@ -237,8 +230,7 @@ class AutomataTextMenu:
             complementary = self.current_Automata.complementary_automata()
             self.current_Automata = complementary
             self.current_Automata_name += " -> Complementary"
-            result = self.capture_stdout(complementary.printCDFA)
-            print("\n✅ Complementary automaton created:\n" + result)
+            print("\n✅ Complementary automaton created:\n" + complementary.str_CDFA())
             
             save = input("\nDo you want to save the complementary automaton? (y/n): ").lower()
             if save in ('y', 'yes'):
@@ -259,11 +251,11 @@ class AutomataTextMenu:
             return
             
         try:
-            A = Automata.from_file(self.selected_file)
+            properties = self.cache.get_properties(self.selected_file)
             
             print("\n=== Checking properties ===\n")
             
-            det_result = A.is_deterministic()
+            det_result = properties['deterministic']
             print("🔍 Is deterministic?")
             if det_result == DETERMINISTIC:
                 print("   ✅ The automaton is DETERMINISTIC.")
@@ -274,14 +266,11 @@ class AutomataTextMenu:
                 print("   ❌ The automaton is NOT deterministic:")
                 print("      → A transition has multiple destinations for the same letter.")
             
-            output_buffer = io.StringIO()
-            sys.stdout = output_buffer
-            
-            cdfa_result = A.is_complete_DFA(False)
-            
-            sys.stdout = sys.__stdout__
-            debug_output = output_buffer.getvalue()
-            output_buffer.close()
+            cdfa_result = properties['complete_DFA']
+            debug_output = ""
+            if cdfa_result != CDFA:
+                A = self.cache.load(self.selected_file)
+                debug_output = self.explain_not_cdfa(A)
             
             print("\n🔍 Is a complete DFA (CDFA)?")
             if cdfa_result == CDFA:
@@ -299,7 +288,7 @@ class AutomataTextMenu:
             if debug_output:
                 print(f"\n      Details: {debug_output}")
             
-            std_result = A.is_standard()
+            std_result = properties['standard']
             print("\n🔍 Is standardized?")
             if std_result:
                 print("   ✅ The automaton is STANDARD.")
@@ -307,21 +296,13 @@ class AutomataTextMenu:
                 print("   ❌ The automaton is NOT standardized.")
                 
         except Exception as e:
-            sys.stdout = sys.__stdout__
             print(f"\n❌ Error: {str(e)}")
     
-    def capture_stdout(self, func, *args):
-        output_buffer = io.StringIO()
-        sys.stdout = output_buffer
-        try:
-            func(*args)
-        except Exception as e:
-            sys.stdout = sys.__stdout__
-            return f"❌ Error: {str(e)}"
-        sys.stdout = sys.__stdout__
-        result = output_buffer.getvalue()
-        output_buffer.close()
-        return result
+    def explain_not_cdfa(self, A):
+        '''Text of the reason why the Automata isn't a CDFA (the events of is_complete_DFA)'''
+        with tracing(('not_cdfa_inputs', 'not_cdfa_transitions', 'not_cdfa_incomplete')) as events:
+            A.is_complete_DFA(False)
+        return render(events)
     
     def handle_exit(self):
         if self.created_complement_files:
@@ -355,6 +336,7 @@ class AutomataApp(ctk.CTk):
         self.top_container.pack(fill="x", padx=100, pady=5)
         self.selected_file = None
         self.current_automata = None
+        self.cache = DiskCache(CACHE_DIR)
 
         self.label_title = ctk.CTkLabel(
             self.top_container, 
@@ -468,6 +450,24 @@ class AutomataApp(ctk.CTk):
                                         command=self.check_is_standard)
         self.check_standard.pack(side="left", expand=True, padx=5, pady=5)
 
+        # Progress of the operation running on the worker thread, and its Cancel button (see run_in_background)
+        self.progress_frame = ctk.CTkFrame(self)
+        self.progress_frame.pack(pady=5, fill="x", padx=20)
+
+        self.progress_bar = ctk.CTkProgressBar(self.progress_frame, mode="indeterminate")
+        self.progress_bar.pack(side="left", expand=True, fill="x", padx=5, pady=5)
+        self.progress_bar.set(0)
+
+        self.progress_label = ctk.CTkLabel(self.progress_frame, text="", font=("Courier", 12), width=500, anchor="w")
+        self.progress_label.pack(side="left", padx=5)
+
+        self.cancel_button = ctk.CTkButton(self.progress_frame, text="⏹ Cancel", command=self.cancel, state="disabled")
+        self.cancel_button.pack(side="right", padx=5, pady=5)
+
+        self.worker = None
+        self.worker_messages = queue.Queue()
+        self.cancel_event = threading.Event()
+
         self.result_label = ctk.CTkLabel(self, text="Results :", font=("Arial", 16, "bold"))
         self.result_label.pack(pady=5)
 
@@ -509,6 +509,9 @@ class AutomataApp(ctk.CTk):
         return files
 
     def on_file_selected(self, selected_file):
+        if self.is_busy():
+            messagebox.showinfo("Busy", "An operation is running: wait for it or cancel it before selecting another file.")
+            return
         if selected_file:
             selected_display_name = os.path.splitext(selected_file)[0]
             for button in self.file_buttons:
@@ -524,10 +527,9 @@ class AutomataApp(ctk.CTk):
             self.display_automata_image(selected_file)
             
             try:
-                A = Automata.from_file(self.selected_file)
-                table_output = self.capture_stdout(A.printCDFA)
+                A = self.cache.load(self.selected_file)
                 self.table_textbox.delete("1.0", "end")
-                self.table_textbox.insert("1.0", table_output)
+                self.table_textbox.insert("1.0", A.str_CDFA())
             except Exception as e:
                 self.table_textbox.delete("1.0", "end")
                 self.table_textbox.insert("1.0", f"Error: {str(e)}")
@@ -583,18 +585,96 @@ class AutomataApp(ctk.CTk):
             self.image_label.configure(image=None, text=f"(Image not found at {image_path})")
             print(f"Image not found: {image_path}")
 
-    def capture_stdout(self, func, *args):
-        output_buffer = io.StringIO()
-        sys.stdout = output_buffer
-        try:
-            func(*args)
-        except Exception as e:
-            sys.stdout = sys.__stdout__
-            return f"❌ Error: {str(e)}"
-        sys.stdout = sys.__stdout__
-        result = output_buffer.getvalue()
-        output_buffer.close()
-        return result
+    def explain_not_cdfa(self, A):
+        '''Text of the reason why the Automata isn't a CDFA (the events of is_complete_DFA)'''
+        with tracing(('not_cdfa_inputs', 'not_cdfa_transitions', 'not_cdfa_incomplete')) as events:
+            A.is_complete_DFA(False)
+        return render(events)
+
+    def action_buttons(self):
+        return [self.test_button, self.determinize_button, self.standardize_button, self.minimize_button,
+                self.complement_button, self.check_deterministic, self.check_complete, self.check_standard]
+
+    def is_busy(self):
+        return self.worker is not None and self.worker.is_alive()
+
+    def run_in_background(self, work, done):
+        """
+        Run work() on a worker thread, so that the window stays responsive, then done(result) in the Tk thread.
+        The progress of the determinizations and minimizations is displayed (see automata.watching),
+        the Cancel button stops them. The worker only puts messages in a queue, read here with after().
+        """
+        if self.is_busy():
+            messagebox.showinfo("Busy", "An operation is already running.")
+            return
+        self.cancel_event = threading.Event()
+        self.worker_messages = queue.Queue()
+        cancel_event = self.cancel_event
+        messages = self.worker_messages
+
+        def on_progress(operation, counters):
+            if cancel_event.is_set():
+                raise OperationCancelled("Operation cancelled")
+            messages.put(("progress", (operation, counters)))
+
+        def run():
+            try:
+                with watching(on_progress):
+                    result = work()
+                messages.put(("cancelled", None) if cancel_event.is_set() else ("done", result))
+            except OperationCancelled:
+                messages.put(("cancelled", None))
+            except Exception as e:
+                messages.put(("error", e))
+
+        for button in self.action_buttons():
+            button.configure(state="disabled")
+        self.cancel_button.configure(state="normal")
+        self.progress_label.configure(text="Working...")
+        self.progress_bar.start()
+        self.worker = threading.Thread(target=run, daemon=True)
+        self.worker.start()
+        self.after(POLL_INTERVAL_MS, self.poll_worker, done)
+
+    def poll_worker(self, done):
+        progress = None
+        while True:
+            try:
+                kind, value = self.worker_messages.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                # only the last progress is displayed
+                progress = value
+                continue
+            self.finish_worker()
+            if kind == "done":
+                done(value)
+            elif kind == "cancelled":
+                self.result_textbox.insert("end", "\n⏹ Operation cancelled.\n")
+            else:
+                messagebox.showerror("Error", f"An error occurred: {str(value)}")
+                self.result_textbox.insert("end", f"\n❌ Error: {str(value)}")
+            return
+        if progress is not None:
+            operation, counters = progress
+            self.progress_label.configure(
+                text=operation + ": " + ", ".join(f"{name} {value}" for name, value in counters.items()))
+        self.after(POLL_INTERVAL_MS, self.poll_worker, done)
+
+    def finish_worker(self):
+        self.worker = None
+        self.progress_bar.stop()
+        self.progress_bar.set(0)
+        self.progress_label.configure(text="")
+        self.cancel_button.configure(state="disabled")
+        for button in self.action_buttons():
+            button.configure(state="normal")
+
+    def cancel(self):
+        if self.is_busy():
+            self.cancel_event.set()
+            self.progress_label.configure(text="Cancelling...")
 
     def test_word(self):
         if not self.selected_file:
@@ -609,29 +689,24 @@ class AutomataApp(ctk.CTk):
         self.result_textbox.delete("1.0", "end")
         self.result_textbox.insert("1.0", f"🔍 Testing word '{word}'...\n")
 
-        try:
-            A = Automata.from_file(self.selected_file)
-            output_buffer = io.StringIO()
-            sys.stdout = output_buffer
-            
-            result = A.recognize_word(word)
-            
-            sys.stdout = sys.__stdout__
-            debug_output = output_buffer.getvalue()
-            output_buffer.close()
-            
+        path = self.selected_file
+        def work():
+            A = self.cache.load(path)
+            with tracing() as events:
+                result = A.recognize_word(word)
+            return result, render(events)
+
+        def show(outcome):
+            result, debug_output = outcome
             if result:
                 self.result_textbox.insert("end", f"\n✅ The word '{word}' is recognized by the automaton.\n")
             else:
                 self.result_textbox.insert("end", f"\n❌ The word '{word}' is NOT recognized by the automaton.\n")
-            
+
             if debug_output:
                 self.result_textbox.insert("end", f"\n🔧 Execution details:\n{debug_output}")
-                
-        except Exception as e:
-            sys.stdout = sys.__stdout__
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
-            self.result_textbox.insert("end", f"\n❌ Error: {str(e)}")
+
+        self.run_in_background(work, show)
 
     def determinize(self):
         if not self.selected_file:
@@ -641,13 +716,10 @@ class AutomataApp(ctk.CTk):
         self.result_textbox.delete("1.0", "end")
         self.result_textbox.insert("1.0", f"📌 Loading automaton from {self.selected_file}...\n")
 
-        try:
-            A1 = Automata.from_file(self.selected_file)
-            A2 = A1.determinize_complete()
-            result = self.capture_stdout(A2.printCDFA)
-            self.result_textbox.insert("end", "\n✔ After complete determinization:\n" + result)
-        except Exception as e:
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
+        path = self.selected_file
+        self.run_in_background(
+            lambda: self.cache.load(path, 'determinized').str_CDFA(),
+            lambda table: self.result_textbox.insert("end", "\n✔ After complete determinization:\n" + table))
 
     def minimize(self):
         if not self.selected_file:
@@ -657,14 +729,10 @@ class AutomataApp(ctk.CTk):
         self.result_textbox.delete("1.0", "end")
         self.result_textbox.insert("1.0", f"🔧 Minimizing...\n")
 
-        try:
-            A1 = Automata.from_file(self.selected_file)
-            A2 = A1.determinize_complete()
-            A3 = A2.minimization()
-            result = self.capture_stdout(A3.print_minimized)
-            self.result_textbox.insert("end", "\n✔ After minimization:\n" + result)
-        except Exception as e:
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
+        path = self.selected_file
+        self.run_in_background(
+            lambda: self.cache.load(path, 'minimized').str_minimized(),
+            lambda table: self.result_textbox.insert("end", "\n✔ After minimization:\n" + table))
 
     def standardize(self):
         if not self.selected_file:
@@ -674,22 +742,23 @@ class AutomataApp(ctk.CTk):
         self.result_textbox.delete("1.0", "end")
         self.result_textbox.insert("1.0", f"📐 Standardizing...\n")
 
-        try:
-            A1 = Automata.from_file(self.selected_file)
-            
+        path = self.selected_file
+        def work():
+            A1 = self.cache.load(path)
             if A1.is_standard():
-                self.result_textbox.insert("end", "\n✅ The automaton is already standardized.\n")
-                result = self.capture_stdout(A1.printCDFA)
-                self.result_textbox.insert("end", "\nStandardized automaton:\n" + result)
-                return
-                
+                return True, A1.str_CDFA()
             A1.standardize()
-            result = self.capture_stdout(A1.printCDFA)
-            self.result_textbox.insert("end", "\n✅ After standardization:\n" + result)
-        except Exception as e:
-            sys.stdout = sys.__stdout__
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
-            self.result_textbox.insert("end", f"\n❌ Error: {str(e)}")
+            return False, A1.str_CDFA()
+
+        def show(outcome):
+            already_standard, table = outcome
+            if already_standard:
+                self.result_textbox.insert("end", "\n✅ The automaton is already standardized.\n")
+                self.result_textbox.insert("end", "\nStandardized automaton:\n" + table)
+            else:
+                self.result_textbox.insert("end", "\n✅ After standardization:\n" + table)
+
+        self.run_in_background(work, show)
 
     def complementary(self):
         if not self.selected_file:
@@ -699,26 +768,32 @@ class AutomataApp(ctk.CTk):
         self.result_textbox.delete("1.0", "end")
         self.result_textbox.insert("1.0", f"🔄 Creating complementary automaton...\n")
 
-        try:
-            A1 = Automata.from_file(self.selected_file)
-            complementary = A1.complementary_automata()
-            result = self.capture_stdout(complementary.printCDFA)
-            self.result_textbox.insert("end", "\n✅ Complementary automaton created:\n" + result)
-            
+        path = self.selected_file
+        def work():
+            complementary = self.cache.load(path, 'complementary')
+            return complementary, complementary.str_CDFA()
+
+        def show(outcome):
+            complementary, table = outcome
+            self.result_textbox.insert("end", "\n✅ Complementary automaton created:\n" + table)
+
             if messagebox.askyesno("Save", "Do you want to save the complementary automaton to a file?"):
-                base_filename = os.path.basename(self.selected_file)
+                base_filename = os.path.basename(path)
                 name_without_ext = os.path.splitext(base_filename)[0]
                 save_path = os.path.join(AUTOMATA_TXT_DIR, f"{name_without_ext}_complement.txt")
-                
-                complementary.to_file(save_path)
+
+                try:
+                    complementary.to_file(save_path)
+                except Exception as e:
+                    messagebox.showerror("Error", f"An error occurred: {str(e)}")
+                    self.result_textbox.insert("end", f"\n❌ Error: {str(e)}")
+                    return
                 self.result_textbox.insert("end", f"\n💾 Complementary automaton saved as: {save_path}\n")
-                
+
                 self.created_complement_files.append(save_path)
                 self.refresh_file_list()
-                
-        except Exception as e:
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
-            self.result_textbox.insert("end", f"\n❌ Error: {str(e)}")
+
+        self.run_in_background(work, show)
 
     def refresh_file_list(self):
         for button in self.file_buttons:
@@ -747,10 +822,7 @@ class AutomataApp(ctk.CTk):
         self.result_textbox.delete("1.0", "end")
         self.result_textbox.insert("1.0", "🔍 Checking if the automaton is deterministic...\n")
         
-        try:
-            A = Automata.from_file(self.selected_file)
-            result = A.is_deterministic()
-            
+        def show(result):
             if result == DETERMINISTIC:
                 self.result_textbox.insert("end", "✅ The automaton is DETERMINISTIC.\n")
             elif result == NOT_DETERM_INPUT:
@@ -759,10 +831,9 @@ class AutomataApp(ctk.CTk):
             else:
                 self.result_textbox.insert("end", "❌ The automaton is NOT deterministic:\n")
                 self.result_textbox.insert("end", "   → A transition has multiple destinations for the same letter.\n")
-        
-        except Exception as e:
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
-            self.result_textbox.insert("end", f"\n❌ Error: {str(e)}")
+
+        path = self.selected_file
+        self.run_in_background(lambda: self.cache.get_properties(path)['deterministic'], show)
 
     def check_is_complete_dfa(self):
         if not self.selected_file:
@@ -772,18 +843,16 @@ class AutomataApp(ctk.CTk):
         self.result_textbox.delete("1.0", "end")
         self.result_textbox.insert("1.0", "🔍 Checking if the automaton is a CDFA...\n")
         
-        try:
-            A = Automata.from_file(self.selected_file)
-            
-            output_buffer = io.StringIO()
-            sys.stdout = output_buffer
-            
-            result = A.is_complete_DFA(False)
-            
-            sys.stdout = sys.__stdout__
-            debug_output = output_buffer.getvalue()
-            output_buffer.close()
-            
+        path = self.selected_file
+        def work():
+            result = self.cache.get_properties(path)['complete_DFA']
+            debug_output = ""
+            if result != CDFA:
+                debug_output = self.explain_not_cdfa(self.cache.load(path))
+            return result, debug_output
+
+        def show(outcome):
+            result, debug_output = outcome
             if result == CDFA:
                 self.result_textbox.insert("end", "✅ The automaton is a COMPLETE DETERMINISTIC FINITE AUTOMATON.\n")
             elif result == NOT_DETERM_INPUT:
@@ -798,11 +867,8 @@ class AutomataApp(ctk.CTk):
             
             if debug_output:
                 self.result_textbox.insert("end", f"\n🔧 Details:\n{debug_output}")
-        
-        except Exception as e:
-            sys.stdout = sys.__stdout__
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
-            self.result_textbox.insert("end", f"\n❌ Error: {str(e)}")
+
+        self.run_in_background(work, show)
 
     def check_is_standard(self):
         if not self.selected_file:
@@ -812,20 +878,17 @@ class AutomataApp(ctk.CTk):
         self.result_textbox.delete("1.0", "end")
         self.result_textbox.insert("1.0", "🔍 Checking if the automaton is standardized...\n")
         
-        try:
-            A = Automata.from_file(self.selected_file)
-            result = A.is_standard()
-            
+        def show(result):
             if result:
                 self.result_textbox.insert("end", "✅ The automaton is STANDARD.\n")
             else:
                 self.result_textbox.insert("end", "❌ The automaton is NOT standardized.\n")
-        
-        except Exception as e:
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
-            self.result_textbox.insert("end", f"\n❌ Error: {str(e)}")
+
+        path = self.selected_file
+        self.run_in_background(lambda: self.cache.get_properties(path)['standard'], show)
     
     def on_closing(self):
+        self.cancel()
         if self.created_complement_files:
             if messagebox.askyesno("Confirmation", 
                                   f"Do you want to delete the {len(self.created_complement_files)} complementary automata files created during this session?"):
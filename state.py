@@ -1,125 +1,195 @@
-ALPH = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x', 'y', 'z']
-LETTER_ID = {
-    'a': 0, 'b': 1, 'c': 2, 'd': 3, 'e': 4, 'f': 5, 'g': 6, 'h': 7, 'i': 8, 'j': 9,
-    'k': 10, 'l': 11, 'm': 12, 'n': 13, 'o': 14, 'p': 15, 'q': 16, 'r': 17, 's': 18,
-    't': 19, 'u': 20, 'v': 21, 'w': 22, 'x': 23, 'y': 24, 'z': 25
-}
-
-
-class State :
-    def __init__(self, alph_size: int, state_id: int):
-        self.__in_state = False
-        self.__out_state = False
-        self.__alph_size = alph_size
-        self.__state_id = state_id
-        self.__dest_states= [set() for _ in range(self.__alph_size)]
-        self.__label = None
-    
-    # Getters
-    def get_id(self)->int:
-        '''Return the number of the state'''
-        return self.__state_id
-    def get_dests(self, letter: str) -> list:
-        '''Return the list of destinations of the state for the given letter'''
-        return list(self.__dest_states[LETTER_ID[letter]])
-    def is_in(self) -> bool:
-        '''
-        Indicates if the state is an input state
-        Returns:
-            bool
-        '''
-        return self.__in_state
-    def is_out(self) -> bool:
-        '''
-        Indicates if the state is an output state
-        Returns:
-            bool
-        '''
-        return self.__out_state
-    def get_alph_size(self) -> int:
-        '''Getter for the size of the alphabet'''
-        return self.__alph_size
-
-    def get_label(self) -> str:
-        '''Getter for the label of the state'''
-        return self.__label
-
-    # Setters
-    def set_in(self):
-        '''Set the state as an input state'''
-        self.__in_state = True
-    def set_out(self):
-        '''Set the state as an output state'''
-        self.__out_state = True
-    
-    def set_not_in(self):
-        '''Set the state as not an input state'''
-        self.__in_state = False 
-    def set_not_out(self):
-        '''Set the state as not an output state'''
-        self.__out_state = False
-
-    def set_label(self, label: str):
-        ''' Method to set a label to the state (will be displaying instead of id when the state is printed)'''
-        self.__label = label
-
-    def add_dest(self, letter : str, num_dest: int):
-        '''Add a destination state from a given character if it is in the alphabet'''
-        if LETTER_ID[letter] < self.get_alph_size():
-            self.__dest_states[LETTER_ID[letter]].add((num_dest))
-        else:
-            assert KeyError('Letter isn\'t in the alphabet of this state')
-    
-    def mod_id(self, new_id: int, silent_mode: bool = False):
-        ''' Dangerous, modify the id of the state'''
-        if not silent_mode:print('Modifying the id of state ' + str(self.get_id()) + ' to ' + str(new_id))
-        self.__state_id = new_id
-    
-    # Overwriting
-    def copy(self) -> 'State':
-        '''
-        Method to copy a state
-        :return: same state with a different address
-        '''
-        new_state = State(self.get_alph_size(), self.get_id())
-        new_state.__in_state = self.__in_state
-        new_state.__out_state = self.__out_state
-        new_state.__dest_states = [self.__dest_states[alph_id].copy() for alph_id in range(self.__alph_size)]
-        new_state.__label = self.get_label()
-        return new_state
-
-    def __str__(self) -> str:
-        '''Method to display the state with print(), by id (not with labels)'''
-        ch=''
-        # Showing if input or output state
-        if self.is_out():
-            ch+='<'
-            if not(self.is_in()):
-                ch+='-'
-        else:
-            ch += ' '
-        if self.is_in():
-            ch+='->'
-        elif self.is_out():
-            ch += ' '
-        else :
-            ch += '  '
-        ch+='  '
-
-        ch += str(self.get_id())+'\t'
-
-        # Showing the transitions
-        for alph_id in range(self.__alph_size):
-            for dest_id in self.get_dests(ALPH[alph_id]):
-                ch += str(dest_id) + ','
-            if ch[-1] == '\t':
-                ch += '--'
-            else:
-                ch = ch[:-1]
-            ch += '\t'
-        
-        return ch
-
-
-
-
+from tracer import trace
+
+ALPH = ['a', 'b', 'c', 'd', 'e', 'f', 'g', 'h', 'i', 'j', 'k', 'l', 'm', 'n', 'o', 'p', 'q', 'r', 's', 't', 'u', 'v', 'w', 'x', 'y', 'z']
+LETTER_ID = {
+    'a': 0, 'b': 1, 'c': 2, 'd': 3, 'e': 4, 'f': 5, 'g': 6, 'h': 7, 'i': 8, 'j': 9,
+    'k': 10, 'l': 11, 'm': 12, 'n': 13, 'o': 14, 'p': 15, 'q': 16, 'r': 17, 's': 18,
+    't': 19, 'u': 20, 'v': 21, 'w': 22, 'x': 23, 'y': 24, 'z': 25
+}
+
+
+class State :
+    '''
+    A state of an Automata. A State created directly holds its own data; once added to an Automata (add_state),
+    or when obtained with Automata.get_state, it is a lightweight view on the storage of the Automata.
+    The transitions are given with the symbols of the alphabet (the letters a, b... by default, or a list of symbols,
+    or a dictionary symbol -> column as for Automata)
+    '''
+    __slots__ = ('__automata', '__state_id', '__alph_size', '__symbol_ids', '__in_state', '__out_state', '__dest_states', '__label')
+
+    def __init__(self, alph_size: int, state_id: int, alphabet: list = None):
+        self.__automata = None
+        self.__in_state = False
+        self.__out_state = False
+        self.__alph_size = alph_size
+        if alphabet is None:
+            self.__symbol_ids = LETTER_ID
+        elif isinstance(alphabet, dict):
+            self.__symbol_ids = alphabet
+        else:
+            self.__symbol_ids = {symbol: alph_id for alph_id, symbol in enumerate(alphabet)}
+        self.__state_id = state_id
+        self.__dest_states= [set() for _ in range(self.__alph_size)]
+        self.__label = None
+
+    @classmethod
+    def _view(cls, automata, state_id: int) -> 'State':
+        '''Function to build the view of the state state_id of an Automata (see Automata.get_state)'''
+        state = cls.__new__(cls)
+        state.__automata = automata
+        state.__state_id = state_id
+        state.__alph_size = automata.get_alph_size()
+        state.__symbol_ids = automata._get_symbol_ids()
+        state.__dest_states = None
+        return state
+
+    def _attach(self, automata):
+        '''Method to turn the state into a view once its data has been stored in the Automata (add_state)'''
+        self.__automata = automata
+        self.__symbol_ids = automata._get_symbol_ids()
+        self.__dest_states = None
+        self.__label = None
+
+    def is_view(self) -> bool:
+        '''Indicates if the state is a view on the storage of an Automata'''
+        return self.__automata is not None
+    
+    # Getters
+    def get_id(self)->int:
+        '''Return the number of the state'''
+        return self.__state_id
+    def get_dests(self, letter: str) -> list:
+        '''Return the list of destinations of the state for the given letter'''
+        return self._get_dests_of(self.__symbol_ids[letter])
+    def _get_dests_of(self, alph_id: int) -> list:
+        '''Return the list of destinations of the state for the given letter id (column of the transitions)'''
+        if self.__automata is not None:
+            return self.__automata._get_dests(self.__state_id, alph_id)
+        return list(self.__dest_states[alph_id])
+    def is_in(self) -> bool:
+        '''
+        Indicates if the state is an input state
+        Returns:
+            bool
+        '''
+        if self.__automata is not None:
+            return self.__automata._is_in(self.__state_id)
+        return self.__in_state
+    def is_out(self) -> bool:
+        '''
+        Indicates if the state is an output state
+        Returns:
+            bool
+        '''
+        if self.__automata is not None:
+            return self.__automata._is_out(self.__state_id)
+        return self.__out_state
+    def get_alph_size(self) -> int:
+        '''Getter for the size of the alphabet'''
+        return self.__alph_size
+
+    def get_label(self) -> str:
+        '''Getter for the label of the state'''
+        if self.__automata is not None:
+            return self.__automata._get_label(self.__state_id)
+        return self.__label
+
+    # Setters
+    def set_in(self):
+        '''Set the state as an input state'''
+        if self.__automata is not None:
+            self.__automata._set_in(self.__state_id, True)
+        else:
+            self.__in_state = True
+    def set_out(self):
+        '''Set the state as an output state'''
+        if self.__automata is not None:
+            self.__automata._set_out(self.__state_id, True)
+        else:
+            self.__out_state = True
+    
+    def set_not_in(self):
+        '''Set the state as not an input state'''
+        if self.__automata is not None:
+            self.__automata._set_in(self.__state_id, False)
+        else:
+            self.__in_state = False
+    def set_not_out(self):
+        '''Set the state as not an output state'''
+        if self.__automata is not None:
+            self.__automata._set_out(self.__state_id, False)
+        else:
+            self.__out_state = False
+
+    def set_label(self, label: str):
+        ''' Method to set a label to the state (will be displaying instead of id when the state is printed)'''
+        if self.__automata is not None:
+            self.__automata._set_label(self.__state_id, label)
+        else:
+            self.__label = label
+
+    def add_dest(self, letter : str, num_dest: int):
+        '''Add a destination state from a given character if it is in the alphabet'''
+        alph_id = self.__symbol_ids[letter]
+        if alph_id < self.get_alph_size():
+            if self.__automata is not None:
+                self.__automata._add_dest(self.__state_id, alph_id, num_dest)
+            else:
+                self.__dest_states[alph_id].add((num_dest))
+        else:
+            assert KeyError('Letter isn\'t in the alphabet of this state')
+    
+    def mod_id(self, new_id: int, silent_mode: bool = False):
+        ''' Dangerous, modify the id of the state (for a view: the state viewed)'''
+        if not silent_mode: trace('state_id_modified', old_id=self.get_id(), new_id=new_id)
+        self.__state_id = new_id
+    
+    # Overwriting
+    def copy(self) -> 'State':
+        '''
+        Method to copy a state
+        :return: same state with a different address (not a view, even if this one is)
+        '''
+        new_state = State(self.get_alph_size(), self.get_id())
+        new_state.__symbol_ids = self.__symbol_ids
+        new_state.__in_state = self.is_in()
+        new_state.__out_state = self.is_out()
+        new_state.__dest_states = [set(self._get_dests_of(alph_id)) for alph_id in range(self.__alph_size)]
+        new_state.__label = self.get_label()
+        return new_state
+
+    def __str__(self) -> str:
+        '''Method to display the state with print(), by id (not with labels)'''
+        ch=''
+        # Showing if input or output state
+        if self.is_out():
+            ch+='<'
+            if not(self.is_in()):
+                ch+='-'
+        else:
+            ch += ' '
+        if self.is_in():
+            ch+='->'
+        elif self.is_out():
+            ch += ' '
+        else :
+            ch += '  '
+        ch+='  '
+
+        ch += str(self.get_id())+'\t'
+
+        # Showing the transitions
+        for alph_id in range(self.__alph_size):
+            for dest_id in self._get_dests_of(alph_id):
+                ch += str(dest_id) + ','
+            if ch[-1] == '\t':
+                ch += '--'
+            else:
+                ch = ch[:-1]
+            ch += '\t'
+        
+        return ch
+
+
+
+
@@ -0,0 +1,108 @@
+'''
+Messages of the library: the algorithms don't print, they give events (a name and a dictionary of data)
+to the tracers, and log them with the logger 'automata'
+    with tracing() as events:
+        A.recognize_word('abba')
+    print(render(events))
+Nothing is built for an event when there is no tracer and its level isn't enabled for the logger (see is_traced),
+so the library is quiet and the trace costs nothing by default
+'''
+import contextlib
+import logging
+import threading
+
+logger = logging.getLogger('automata')
+# a library doesn't configure the logging: without handler of the application, the events are dropped
+logger.addHandler(logging.NullHandler())
+
+# Level (for the logger) and text of each event, formatted with the data of the event
+EVENTS = {
+    'not_cdfa_inputs': (logging.INFO, 'Algorithm isn\'t CDFA: it is not a deterministic one.'),
+    'not_cdfa_transitions': (logging.INFO, 'Algorithm isn\'t CDFA: it is not deterministic.'
+                             + '\n\tNot deterministic for state, transition, number of destinations: '
+                             + '{state_id}, {letter}, {nb_dests}'),
+    'not_cdfa_incomplete': (logging.INFO, 'Algorithm isn\'t CDFA: it is deterministic but not complete.'
+                            + '\n\tNot complete for state, transition: {state_id}, {letter}'),
+    'incompatible_alphabet': (logging.WARNING, 'Incompatible alphabet size, couldn\'t add the state'),
+    'state_added': (logging.DEBUG, 'Number of state successfuly increased by 1'),
+    'state_replaced': (logging.DEBUG, 'State successfuly replaced'),
+    'state_id_modified': (logging.DEBUG, 'Modifying the id of state {old_id} to {new_id}'),
+    'invalid_character': (logging.INFO, 'Can\'t recognize, invalid character'),
+    'recognition_deterministic': (logging.DEBUG, 'The automata is deterministic'),
+    'recognition_determinized': (logging.DEBUG,
+                                 'The automata is not deterministic, we will based us on it\'s determinized version:'),
+    'recognition_step': (logging.DEBUG, 'word: {word}\nstate_id: {state_id}'),
+    'not_deterministic': (logging.WARNING, 'The Automata should be deterministic first'),
+    'already_minimized': (logging.INFO, 'The Automata was already minimized.'),
+    'not_cdfa': (logging.WARNING, 'Can\'t minimize, your Automata should first be a complete and deterministic one'),
+    'complementary_determinized': (logging.DEBUG, 'We will base us on the CDFA automata corresponding to your automata:'),
+    'invalid_automata': (logging.WARNING, 'BE AWARE YOUR AUTOMATA IS NOT VALID (found a destination that don\'t exists)'),
+}
+# replaced (never modified) by add_tracer and remove_tracer, so that an event can be traced during a change in another thread
+_tracers = []
+
+
+def is_traced(level: int = logging.DEBUG) -> bool:
+    '''Function to know if an event of this level would be used, to build its data only in this case'''
+    return bool(_tracers) or logger.isEnabledFor(level)
+
+
+def trace(name: str, **data):
+    '''Function giving an event to the tracers, and to the logger if its level is enabled (see EVENTS)'''
+    for tracer in _tracers:
+        tracer(name, data)
+    level = EVENTS[name][0]
+    if logger.isEnabledFor(level):
+        logger.log(level, '%s', render_event(name, data), extra={'event': name, 'event_data': data})
+
+
+def render_event(name: str, data: dict) -> str:
+    '''
+    Function giving the text of an event
+    The Automata of an event (data['automata'], such as the determinized one used) is displayed under its text
+    '''
+    text = EVENTS[name][1].format(**data)
+    if data.get('automata') is not None:
+        text += '\n' + data['automata'].str_CDFA()
+    return text
+
+
+def render(events: list) -> str:
+    '''Function giving the text of events (name, data) collected by tracing, one per line'''
+    return '\n'.join(render_event(name, data) for name, data in events)
+
+
+def add_tracer(tracer):
+    '''Function to give all the events to tracer(name, data), until remove_tracer'''
+    global _tracers
+    _tracers = _tracers + [tracer]
+
+
+def remove_tracer(tracer):
+    global _tracers
+    tracers = list(_tracers)
+    tracers.remove(tracer)
+    _tracers = tracers
+
+
+def print_tracer(name: str, data: dict):
+    '''Tracer printing the events, as the library did before (add_tracer(print_tracer) to get its messages back)'''
+    print(render_event(name, data))
+
+
+@contextlib.contextmanager
+def tracing(names=None):
+    '''
+    Context manager collecting the events of its block in a list of (name, data), optionally only the ones of names
+    Unlike a redirection of sys.stdout, only the events of the thread of the block are collected
+    '''
+    events = []
+    thread_id = threading.get_ident()
+    def collect(name: str, data: dict):
+        if (names is None or name in names) and threading.get_ident() == thread_id:
+            events.append((name, data))
+    add_tracer(collect)
+    try:
+        yield events
+    finally:
+        remove_tracer(collect)